@@ -34,6 +34,7 @@ class BookmarkManager:
         self.bookmarks_file = Path.home() / ".fftp" / "bookmarks.json"
         self.bookmarks_file.parent.mkdir(exist_ok=True)
         self.bookmarks: List[Bookmark] = []
+        self._type_counts: Dict[str, int] = {}
         self.load_bookmarks()
 
     def load_bookmarks(self):
@@ -46,6 +47,13 @@ class BookmarkManager:
             except Exception as e:
                 print(f"Error loading bookmarks: {e}")
                 self.bookmarks = []
+        self._recount()
+
+    def _recount(self):
+        """Rebuild the per-type bookmark counts"""
+        self._type_counts = {}
+        for bookmark in self.bookmarks:
+            self._type_counts[bookmark.type] = self._type_counts.get(bookmark.type, 0) + 1
 
     def save_bookmarks(self):
         """Save bookmarks to file"""
@@ -65,6 +73,7 @@ class BookmarkManager:
 
         bookmark = Bookmark(name=name, path=path, type=bookmark_type, server_name=server_name)
         self.bookmarks.append(bookmark)
+        self._type_counts[bookmark_type] = self._type_counts.get(bookmark_type, 0) + 1
         self.save_bookmarks()
         return True
 
@@ -73,6 +82,7 @@ class BookmarkManager:
         for i, bookmark in enumerate(self.bookmarks):
             if bookmark.path == path and bookmark.type == bookmark_type:
                 del self.bookmarks[i]
+                self._type_counts[bookmark_type] -= 1
                 self.save_bookmarks()
                 return True
         return False
@@ -87,6 +97,14 @@ class BookmarkManager:
         """Get local bookmarks"""
         return self.get_bookmarks("local")
 
+    def next_local_bookmark_id(self) -> int:
+        """Number to use when naming the next local bookmark"""
+        return self._type_counts.get("local", 0) + 1
+
+    def next_remote_bookmark_id(self) -> int:
+        """Number to use when naming the next remote bookmark"""
+        return self._type_counts.get("remote", 0) + 1
+
     def get_remote_bookmarks(self, server_name: Optional[str] = None) -> List[Bookmark]:
         """Get remote bookmarks, optionally filtered by server"""
         bookmarks = self.get_bookmarks("remote")
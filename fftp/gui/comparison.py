@@ -2,7 +2,7 @@
 Directory comparison functionality for Fftp
 """
 
-from typing import Dict, List, Set, Tuple, Optional
+from typing import Callable, Dict, List, Set, Tuple, Optional
 from pathlib import Path
 from datetime import datetime
 import os
@@ -157,6 +157,22 @@ class DirectoryComparator:
 
         return result == "identical"
 
+    def build_hide_predicate(self) -> Callable[[str], bool]:
+        """Build a predicate equivalent to should_hide_file for one listing
+
+        The set of identical names is computed once, so each per-file
+        check is a single frozenset membership test.
+        """
+        if not self.comparison_mode or not self.hide_identical:
+            return lambda filename: False
+
+        identical = frozenset(
+            name for name, local_file in self.local_files.items()
+            if name in self.remote_files
+            and self._files_identical(local_file, self.remote_files[name])
+        )
+        return identical.__contains__
+
 
 class ComparisonManager:
     """Manages directory comparison operations"""
@@ -204,6 +220,10 @@ class ComparisonManager:
             self.main_window.load_local_files()
             self.main_window.load_remote_files()
 
+    def build_hide_predicate(self) -> Callable[[str], bool]:
+        """Get a predicate telling whether a file name should be hidden"""
+        return self.comparator.build_hide_predicate()
+
     def get_comparison_color(self, result: str) -> str:
         """Get color for comparison result"""
         colors = {
@@ -12,6 +12,7 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QIcon
 from ..models import ConnectionConfig
+from .icon_themes import get_icon_theme_manager
 
 
 class ConnectionManagerDialog(QDialog):
@@ -41,27 +42,20 @@ class ConnectionManagerDialog(QDialog):
         self.site_tree.setAnimated(True)
         self.site_tree.setIndentation(15)
 
-        # Add root items
+        # Add root items; icons are looked up once and shared by every row
+        icon_manager = get_icon_theme_manager()
+        folder_icon = icon_manager.get_file_icon('folder')
+        server_icon = icon_manager.get_ui_icon('server') or icon_manager.get_file_icon('file')
+
         self.sites_root = QTreeWidgetItem(self.site_tree)
         self.sites_root.setText(0, "My Sites")
-        # Get icon from theme manager if available
-        try:
-            from .icon_themes import get_icon_theme_manager
-            icon_manager = get_icon_theme_manager()
-            folder_icon = icon_manager.get_file_icon('folder')
+        if folder_icon:
             self.sites_root.setIcon(0, folder_icon)
-        except:
-            pass  # No icon available
 
         self.bookmarks_root = QTreeWidgetItem(self.site_tree)
         self.bookmarks_root.setText(0, "Global Bookmarks")
-        try:
-            from .icon_themes import get_icon_theme_manager
-            icon_manager = get_icon_theme_manager()
-            folder_icon = icon_manager.get_file_icon('folder')
+        if folder_icon:
             self.bookmarks_root.setIcon(0, folder_icon)
-        except:
-            pass  # No icon available
 
         # Populate sites
         for conn in self.connections:
@@ -72,18 +66,8 @@ class ConnectionManagerDialog(QDialog):
 
             site_item = QTreeWidgetItem(self.sites_root)
             site_item.setText(0, name)
-            # Try to get server icon from theme manager
-            try:
-                from .icon_themes import get_icon_theme_manager
-                icon_manager = get_icon_theme_manager()
-                server_icon = icon_manager.get_ui_icon('server')
-                if server_icon:
-                    site_item.setIcon(0, server_icon)
-                else:
-                    # Fallback to a generic icon
-                    site_item.setIcon(0, icon_manager.get_file_icon('file'))
-            except:
-                pass  # No icon available
+            if server_icon:
+                site_item.setIcon(0, server_icon)
             site_item.setData(0, Qt.ItemDataRole.UserRole, conn)
 
         self.site_tree.expandAll()
@@ -277,7 +261,7 @@ class ConnectionManagerDialog(QDialog):
 
         site_item = QTreeWidgetItem(self.sites_root)
         site_item.setText(0, config.name)
-        site_item.setIcon(0, QIcon("server.png"))
+        site_item.setIcon(0, get_icon_theme_manager().get_ui_icon('server') or QIcon())
         site_item.setData(0, Qt.ItemDataRole.UserRole, conn_dict)
         self.sites_root.setExpanded(True)
         self.site_tree.setCurrentItem(site_item)
@@ -363,7 +347,7 @@ class ConnectionManagerDialog(QDialog):
             if ok and folder_name:
                 folder_item = QTreeWidgetItem(current)
                 folder_item.setText(0, folder_name)
-                folder_item.setIcon(0, QIcon("folder.png"))
+                folder_item.setIcon(0, get_icon_theme_manager().get_file_icon('folder') or QIcon())
                 current.setExpanded(True)
 
     def rename_item(self):
@@ -2,7 +2,6 @@
 Connection tab widget for multiple server connections
 """
 
-import os
 import traceback
 from pathlib import Path
 from PyQt6.QtWidgets import (
@@ -15,6 +14,24 @@ from PyQt6.QtGui import QIcon, QPixmap
 from ..models import ConnectionConfig, RemoteFile
 from .drag_drop_table import DragDropTableWidget
 from .context_menus import ContextMenuManager
+from .filter_manager import FileListing
+from .icon_themes import get_icon_theme_manager
+
+
+# Tree item flag: False until the directory's children have been listed
+_TREE_POPULATED_ROLE = Qt.ItemDataRole.UserRole + 1
+
+
+class _ParentDir:
+    """Stand-in file object for the synthesized parent directory (..) row"""
+    __slots__ = ('name', 'path', 'is_dir', 'size', 'modified')
+
+    def __init__(self, path):
+        self.name = ".."
+        self.path = path
+        self.is_dir = True
+        self.size = 0
+        self.modified = ""
 
 
 class ConnectionTab(QWidget):
@@ -27,9 +44,19 @@ class ConnectionTab(QWidget):
         self.manager = None
         self.current_remote_path = "."
         self.connection_worker = None
+        self._parent_dir_cache = {}
+
+        # Coalesce bursts of refresh requests into a single listing
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(50)
+        self._refresh_timer.timeout.connect(self._do_load_remote_files)
 
-        # Context menu manager
-        self.context_menu_manager = ContextMenuManager(self.parent())
+        # Share the main window's context menus rather than building another
+        # set of actions and menus on the window for every tab
+        self.context_menu_manager = getattr(main_window, 'context_menu_manager', None)
+        if self.context_menu_manager is None:
+            self.context_menu_manager = ContextMenuManager(self)
 
         self.init_ui()
     
@@ -182,7 +209,7 @@ class ConnectionTab(QWidget):
             root_item.setData(0, Qt.ItemDataRole.UserRole, "/")
 
             # Set folder icon
-            root_item.setIcon(0, QIcon("folder.png"))  # You might want to add proper icons
+            root_item.setIcon(0, self._folder_icon())
 
             # Load subdirectories for root
             self.load_remote_tree_children(root_item, "/")
@@ -193,6 +220,10 @@ class ConnectionTab(QWidget):
         except Exception as e:
             print(f"Error loading remote tree: {e}")
 
+    def _folder_icon(self):
+        """Shared folder icon for tree rows; QIcon is implicitly shared"""
+        return get_icon_theme_manager().get_file_icon('folder') or QIcon()
+
     def load_remote_tree_children(self, parent_item, path):
         """Load children for a tree item"""
         if not self.manager:
@@ -200,29 +231,31 @@ class ConnectionTab(QWidget):
 
         try:
             files = self.manager.list_files(path)
+            folder_icon = self._folder_icon()
             for file in files:
                 if file.is_dir and file.name not in [".", ".."]:
                     child_item = QTreeWidgetItem(parent_item)
                     child_item.setText(0, file.name)
                     child_item.setData(0, Qt.ItemDataRole.UserRole, file.path)
-                    child_item.setIcon(0, QIcon("folder.png"))  # Add folder icon
+                    child_item.setIcon(0, folder_icon)
 
-                    # Add dummy child to show expand arrow
-                    dummy = QTreeWidgetItem(child_item)
-                    dummy.setText(0, "")
-                    child_item.addChild(dummy)
+                    # Show the expand arrow without a dummy child; children are listed on expand
+                    child_item.setChildIndicatorPolicy(QTreeWidgetItem.ChildIndicatorPolicy.ShowIndicator)
+                    child_item.setData(0, _TREE_POPULATED_ROLE, False)
 
         except Exception as e:
             print(f"Error loading tree children for {path}: {e}")
 
     def on_remote_tree_expanded(self, item):
         """Handle tree item expansion"""
-        # Remove dummy child and load real children
-        if item.childCount() == 1 and item.child(0).text(0) == "":
-            item.takeChildren()  # Remove dummy
+        # Load real children the first time the item is expanded
+        if item.data(0, _TREE_POPULATED_ROLE) is False:
+            item.setData(0, _TREE_POPULATED_ROLE, True)
             path = item.data(0, Qt.ItemDataRole.UserRole)
             if path:
                 self.load_remote_tree_children(item, path)
+            if item.childCount() == 0:
+                item.setChildIndicatorPolicy(QTreeWidgetItem.ChildIndicatorPolicy.DontShowIndicatorWhenChildless)
 
     def on_remote_tree_clicked(self, item, column):
         """Handle tree item click"""
@@ -276,8 +309,7 @@ class ConnectionTab(QWidget):
             files = self.manager.list_files(path)
             self.current_remote_path = path
             # Update main window's current path too
-            if hasattr(self.main_window, 'current_remote_path'):
-                self.main_window.current_remote_path = path
+            self.main_window.current_remote_path = path
             self.load_remote_files()
         except Exception:
             # If path doesn't exist or is invalid, stay on current path
@@ -300,8 +332,7 @@ class ConnectionTab(QWidget):
             self.current_remote_path = new_path
             self.remote_path_edit.setText(new_path)
             # Update main window's current path too
-            if hasattr(self.main_window, 'current_remote_path'):
-                self.main_window.current_remote_path = new_path
+            self.main_window.current_remote_path = new_path
             self.load_remote_files()
         except Exception:
             # If can't go up, stay on current path
@@ -325,8 +356,7 @@ class ConnectionTab(QWidget):
                     self.current_remote_path = new_path
                     self.remote_path_edit.setText(new_path)
                     # Update main window's current path too
-                    if hasattr(self.main_window, 'current_remote_path'):
-                        self.main_window.current_remote_path = new_path
+                    self.main_window.current_remote_path = new_path
                     # Navigate with sync if enabled, otherwise just load
                     if self.main_window.synchronized_browsing:
                         self.main_window.navigate_remote_with_sync(new_path)
@@ -353,8 +383,7 @@ class ConnectionTab(QWidget):
                         self.current_remote_path = new_path
                         self.remote_path_edit.setText(new_path)
                         # Update main window's current path too
-                        if hasattr(self.main_window, 'current_remote_path'):
-                            self.main_window.current_remote_path = new_path
+                        self.main_window.current_remote_path = new_path
                         self.load_remote_files()
         else:
             # Call the original key press event for other keys
@@ -362,10 +391,15 @@ class ConnectionTab(QWidget):
 
     # Helper methods (stubs - need to be implemented)
     def load_remote_files(self):
-        """Load remote files for current path"""
-        import logging
-        logger = logging.getLogger(__name__)
+        """Schedule a reload of the remote files for the current path
 
+        Restarting the timer drops any pending reload, so rapid successive
+        calls result in a single listing.
+        """
+        self._refresh_timer.start()
+
+    def _do_load_remote_files(self):
+        """Load remote files for current path"""
         if not self.manager or not self.is_connected():
             if hasattr(self, 'remote_table'):
                 self.remote_table.setRowCount(0)
@@ -386,24 +420,30 @@ class ConnectionTab(QWidget):
                 self.remote_table.setSortingEnabled(True)
                 return
 
+            # Build the comparison hide predicate once per listing
+            hide = self.main_window.comparison_manager.build_hide_predicate()
+            filter_manager = self.main_window.filter_manager
+
+            # Check the whole listing against the filters in one batch
+            count = len(files)
+            listing = FileListing(
+                names=[file.name for file in files],
+                paths=[self.current_remote_path] * count,
+                sizes=[file.size for file in files],
+                modified=[file.modified for file in files],
+                is_dirs=[file.is_dir for file in files]
+            )
+            filtered = filter_manager.filter_listing(listing)
+
             # Process files with filtering
             visible_files = []
-            for file in files:
-                file_info = {
-                    'name': file.name,
-                    'path': self.current_remote_path,
-                    'full_path': os.path.join(self.current_remote_path, file.name) if self.current_remote_path != "/" else f"/{file.name}",
-                    'size': file.size,
-                    'modified': file.modified,
-                    'is_dir': file.is_dir
-                }
-
+            for file, is_filtered in zip(files, filtered):
                 # Check if filtered (using parent's filter manager)
-                if hasattr(self.parent(), 'filter_manager') and self.parent().filter_manager.is_filtered(file_info):
+                if is_filtered:
                     continue
 
                 # Check if should be hidden in comparison mode
-                if hasattr(self.parent(), 'comparison_manager') and self.parent().comparison_manager.comparator.should_hide_file(file.name):
+                if hide(file.name):
                     continue
 
                 visible_files.append(file)
@@ -418,31 +458,28 @@ class ConnectionTab(QWidget):
                 self.remote_table.setItem(0, 2, QTableWidgetItem("Parent Directory"))
                 self.remote_table.setItem(0, 3, QTableWidgetItem(""))
 
-                # Create a mock file object for parent directory
-                class ParentDir:
-                    def __init__(self, path):
-                        self.name = ".."
-                        self.path = path
-                        self.is_dir = True
-                        self.size = 0
-                        self.modified = ""
-                parent_dir = ParentDir("/".join(self.current_remote_path.split("/")[:-1]) or "/")
-                self.remote_table.item(0, 0).setData(Qt.ItemDataRole.UserRole, parent_dir)
+                # Reuse the parent directory object for this path
+                parent_dir = self._parent_dir_cache.get(self.current_remote_path)
+                if parent_dir is None:
+                    parent_dir = _ParentDir("/".join(self.current_remote_path.split("/")[:-1]) or "/")
+                    self._parent_dir_cache[self.current_remote_path] = parent_dir
+                parent_item.setData(Qt.ItemDataRole.UserRole, parent_dir)
                 offset = 1
 
             # Separate directories and files for consistent sorting (Folders first)
             visible_dirs = [f for f in visible_files if f.is_dir]
             visible_non_dirs = [f for f in visible_files if not f.is_dir]
 
-            # Populate table with directories first
-            for i, file in enumerate(visible_dirs):
-                row = i + offset
-                self._add_file_row(row, file)
-            
-            # Then populate with files
-            for i, file in enumerate(visible_non_dirs):
-                row = i + offset + len(visible_dirs)
-                self._add_file_row(row, file)
+            with self.remote_table.batch_updates():
+                # Populate table with directories first
+                for i, file in enumerate(visible_dirs):
+                    row = i + offset
+                    self._add_file_row(row, file)
+
+                # Then populate with files
+                for i, file in enumerate(visible_non_dirs):
+                    row = i + offset + len(visible_dirs)
+                    self._add_file_row(row, file)
 
             self.remote_table.setSortingEnabled(True)
             self.remote_table.resizeColumnsToContents()
@@ -525,15 +562,14 @@ class ConnectionTab(QWidget):
 
     def _on_remote_selection_changed(self):
         """Handle remote table selection changes"""
-        if hasattr(self.parent(), 'status_bar'):
-            selected_items = []
-            for item in self.remote_table.selectedItems():
-                if item.column() == 0:  # Only count once per row
-                    row = item.row()
-                    file_item = self.remote_table.item(row, 0)
-                    if file_item:
-                        file_data = file_item.data(Qt.ItemDataRole.UserRole)
-                        if file_data:
-                            selected_items.append(file_data)
-
-            self.parent().status_bar.update_selection_info(selected_items, is_local=False)
+        selected_items = []
+        for item in self.remote_table.selectedItems():
+            if item.column() == 0:  # Only count once per row
+                row = item.row()
+                file_item = self.remote_table.item(row, 0)
+                if file_item:
+                    file_data = file_item.data(Qt.ItemDataRole.UserRole)
+                    if file_data:
+                        selected_items.append(file_data)
+
+        self.main_window.status_bar.update_selection_info(selected_items, is_local=False)
@@ -9,7 +9,7 @@ from ..models import ConnectionConfig
 class ConnectionWorker(QThread):
     """Worker thread for connection operations"""
     finished = pyqtSignal(bool, str)
-    status_update = pyqtSignal(str)
+    # Progress text and level; receivers use it for both the log and the status bar
     log_message = pyqtSignal(str, str)
     
     def __init__(self, config: ConnectionConfig, manager_class):
@@ -20,25 +20,21 @@ class ConnectionWorker(QThread):
     
     def run(self):
         """Run connection in background thread"""
+        config = self.config
+        protocol = config.protocol.upper()
         try:
-            self.log_message.emit(f"Initializing {self.config.protocol.upper()} connection...", "info")
-            self.status_update.emit(f"Initializing {self.config.protocol.upper()} connection...")
-            self.manager = self.manager_class(self.config)
+            self.log_message.emit(f"Initializing {protocol} connection...", "info")
+            self.manager = self.manager_class(config)
             
-            self.log_message.emit(f"Connecting to {self.config.host}:{self.config.port} using {self.config.protocol.upper()}...", "info")
-            self.status_update.emit(f"Connecting to {self.config.host}:{self.config.port}...")
+            self.log_message.emit(f"Connecting to {config.host}:{config.port} using {protocol}...", "info")
             success, msg = self.manager.connect()
             
             if success:
-                self.log_message.emit(f"Successfully connected to {self.config.host}:{self.config.port}", "success")
-                self.status_update.emit(f"Successfully connected to {self.config.host}")
+                self.log_message.emit(f"Successfully connected to {config.host}:{config.port}", "success")
             else:
                 self.log_message.emit(f"Connection failed: {msg}", "error")
-                self.status_update.emit(f"Connection failed: {msg}")
             
             self.finished.emit(success, msg)
         except Exception as e:
-            error_msg = f"Connection error: {str(e)}"
-            self.log_message.emit(error_msg, "error")
-            self.status_update.emit(error_msg)
+            self.log_message.emit(f"Connection error: {str(e)}", "error")
             self.finished.emit(False, str(e))
@@ -2,255 +2,347 @@
 Enhanced context menu system for Fftp
 """
 
+import os
+import stat
+import sys
+from functools import partial
 from pathlib import Path
 from PyQt6.QtWidgets import QMenu, QMessageBox
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QAction, QIcon
 
+_USER_ROLE = Qt.ItemDataRole.UserRole
+
+# Labels shared by several menus
+_LBL_TRANSFER = sys.intern("Transfer")
+_LBL_UPLOAD = sys.intern("Upload")
+_LBL_DOWNLOAD = sys.intern("Download")
+_LBL_ADD_TO_QUEUE = sys.intern("Add to Queue")
+_LBL_DELETE = sys.intern("Delete")
+_LBL_REFRESH = sys.intern("Refresh")
+_LBL_PROPERTIES = sys.intern("Properties")
+
+_NOT_YET_IMPLEMENTED = "Not yet implemented"
+
+# Refresh requests arriving within this window (ms) collapse into one reload
+_REFRESH_DEBOUNCE_MS = 150
+
 
 class ContextMenuManager:
     """Enhanced context menu manager for Fftp"""
 
+    # "Open with..." entries as (label, application path); None means system default
+    _OPEN_WITH_APPS = (("Notepad", "notepad.exe"), ("System Default", None))
+
+    # Pooled actions as (key, label, slot method name); a None slot marks
+    # a disabled "not yet implemented" placeholder
+    _ACTION_SPECS = (
+        ('upload_local', _LBL_UPLOAD, '_upload_selected_local'),
+        ('queue_local', _LBL_ADD_TO_QUEUE, '_upload_selected_local'),
+        ('open_local', "Open", '_open_selected_local'),
+        ('rename_local', "Rename", '_rename_selected_local'),
+        ('delete_local', _LBL_DELETE, '_delete_selected_local'),
+        ('new_folder_local', "Folder", '_create_new_folder_local'),
+        ('enter_local', "Enter Directory", '_enter_selected_directory'),
+        ('bookmark_local', "Add to Bookmarks", '_add_directory_bookmark'),
+        ('refresh_local', _LBL_REFRESH, '_refresh_local_files'),
+        ('download_remote', _LBL_DOWNLOAD, '_download_selected_remote'),
+        ('queue_remote', _LBL_ADD_TO_QUEUE, '_download_selected_remote'),
+        ('view_remote', "View/Edit", '_view_selected_remote'),
+        ('rename_remote', "Rename", '_rename_selected_remote'),
+        ('delete_remote', _LBL_DELETE, '_delete_selected_remote'),
+        ('new_folder_remote', "Folder", '_create_new_folder_remote'),
+        ('enter_remote', "Enter Directory", '_enter_selected_directory_remote'),
+        ('bookmark_remote', "Add to Bookmarks", '_add_remote_directory_bookmark'),
+        ('refresh_remote', _LBL_REFRESH, '_refresh_remote_files'),
+        ('copy', "Copy", None),
+        ('paste', "Paste", None),
+        ('new_file', "File", None),
+        ('chmod', "Change Permissions", None),
+        ('copy_url', "Copy URL to Clipboard", None),
+        ('open_url', "Open URL in Browser", None),
+        ('properties', _LBL_PROPERTIES, None),
+        ('tree_upload', _LBL_UPLOAD, None),
+        ('tree_download', _LBL_DOWNLOAD, None),
+        ('tree_new_folder', "New Folder", None),
+        ('tree_refresh', _LBL_REFRESH, None),
+    )
+
     def __init__(self, parent):
         self.parent = parent
-
-    def create_local_context_menu(self, table, position, selected_items):
-        """Create comprehensive context menu for local files"""
-        menu = QMenu(self.parent)
+        self._refresh_local_pending = False
+        self._refresh_remote_pending = False
+
+        # Actions are owned by the parent window and shared between menus
+        self._actions = self._build_actions(parent)
+
+        # Menus are built once and reused for every right-click
+        self._local_menu = self._build_local_menu(parent)
+        self._remote_menu = self._build_remote_menu(parent)
+
+    def _build_actions(self, owner):
+        """Create the pooled QActions with their slots connected once"""
+        actions = {}
+        for key, label, slot_name in self._ACTION_SPECS:
+            action = QAction(label, owner)
+            if slot_name is None:
+                action.setEnabled(False)
+                action.setToolTip(_NOT_YET_IMPLEMENTED)
+            else:
+                action.triggered.connect(getattr(self, slot_name))
+            actions[key] = action
+        return actions
+
+    def _add_actions(self, menu, *keys):
+        """Attach pooled actions to a menu in a single call"""
+        menu.setToolTipsVisible(True)
+        menu.addActions([self._actions[key] for key in keys])
+
+    def _build_local_menu(self, owner):
+        """Build the reusable context menu for local files
+
+        Submenus are created empty and only populated the first time they
+        are about to be shown, so unused paths are never built.
+        """
+        menu = QMenu(owner)
 
         # Transfer operations submenu
-        if selected_items:
-            transfer_menu = menu.addMenu("Transfer")
-
-            # Upload selected files/folders
-            upload_action = transfer_menu.addAction("Upload")
-            upload_action.triggered.connect(self._upload_selected_local)
-
-            # Add to queue
-            queue_action = transfer_menu.addAction("Add to Queue")
-            queue_action.triggered.connect(self._queue_selected_local)
+        transfer_menu = menu.addMenu(_LBL_TRANSFER)
+        transfer_menu.aboutToShow.connect(partial(self._populate_transfer_local, transfer_menu))
+        self._local_transfer_menu_action = transfer_menu.menuAction()
 
-            menu.addSeparator()
+        self._local_transfer_separator = menu.addSeparator()
 
         # File operations submenu
         file_menu = menu.addMenu("File Operations")
+        file_menu.aboutToShow.connect(partial(self._populate_file_local, file_menu))
 
-        # Open/Edit
-        open_action = file_menu.addAction("Open")
-        open_action.triggered.connect(self._open_selected_local)
-
-        # Open with...
-        open_with_menu = file_menu.addMenu("Open with...")
-        # Add common applications
-        notepad_action = open_with_menu.addAction("Notepad")
-        notepad_action.triggered.connect(lambda: self._open_with_application("notepad.exe"))
-
-        # Add system default
-        default_action = open_with_menu.addAction("System Default")
-        default_action.triggered.connect(self._open_with_system_default)
+        menu.addSeparator()
 
-        file_menu.addSeparator()
+        # Directory operations
+        dir_menu = menu.addMenu("Directory")
+        dir_menu.aboutToShow.connect(partial(self._populate_directory_local, dir_menu))
+        self._local_dir_menu_action = dir_menu.menuAction()
 
-        # Create new
-        new_menu = file_menu.addMenu("New")
-        new_file_action = new_menu.addAction("File")
-        new_file_action.triggered.connect(self._create_new_file_local)
+        # Refresh
+        menu.addSeparator()
+        self._add_actions(menu, 'refresh_local')
 
-        new_folder_action = new_menu.addAction("Folder")
-        new_folder_action.triggered.connect(self._create_new_folder_local)
+        # Properties
+        menu.addSeparator()
+        self._add_actions(menu, 'properties')
 
-        file_menu.addSeparator()
+        return menu
 
-        # Copy/Paste operations
-        copy_action = file_menu.addAction("Copy")
-        copy_action.triggered.connect(self._copy_selected_local)
+    def _build_remote_menu(self, owner):
+        """Build the reusable context menu for remote files
 
-        paste_action = file_menu.addAction("Paste")
-        paste_action.triggered.connect(self._paste_to_local)
+        Submenus are populated on demand, as for the local menu.
+        """
+        menu = QMenu(owner)
 
-        file_menu.addSeparator()
+        # Transfer operations submenu
+        transfer_menu = menu.addMenu(_LBL_TRANSFER)
+        transfer_menu.aboutToShow.connect(partial(self._populate_transfer_remote, transfer_menu))
+        self._remote_transfer_menu_action = transfer_menu.menuAction()
 
-        # Rename
-        rename_action = file_menu.addAction("Rename")
-        rename_action.triggered.connect(self._rename_selected_local)
+        self._remote_transfer_separator = menu.addSeparator()
 
-        # Delete
-        delete_action = file_menu.addAction("Delete")
-        delete_action.triggered.connect(self._delete_selected_local)
+        # File operations submenu
+        file_menu = menu.addMenu("File Operations")
+        file_menu.aboutToShow.connect(partial(self._populate_file_remote, file_menu))
 
         menu.addSeparator()
 
         # Directory operations
-        if self._has_directory_selected(selected_items):
-            dir_menu = menu.addMenu("Directory")
+        dir_menu = menu.addMenu("Directory")
+        dir_menu.aboutToShow.connect(partial(self._populate_directory_remote, dir_menu))
+        self._remote_dir_menu_action = dir_menu.menuAction()
 
-            enter_action = dir_menu.addAction("Enter Directory")
-            enter_action.triggered.connect(self._enter_selected_directory)
+        # URL operations
+        url_menu = menu.addMenu("URL")
+        url_menu.aboutToShow.connect(partial(self._populate_url_remote, url_menu))
 
-            add_bookmark_action = dir_menu.addAction("Add to Bookmarks")
-            add_bookmark_action.triggered.connect(self._add_directory_bookmark)
+        menu.addSeparator()
 
         # Refresh
-        menu.addSeparator()
-        refresh_action = menu.addAction("Refresh")
-        refresh_action.triggered.connect(self._refresh_local_files)
+        self._add_actions(menu, 'refresh_remote')
 
         # Properties
         menu.addSeparator()
-        properties_action = menu.addAction("Properties")
-        properties_action.triggered.connect(self._show_local_properties)
+        self._add_actions(menu, 'properties')
+
+        return menu
 
-        menu.exec(table.mapToGlobal(position))
+    def create_local_context_menu(self, table, position, selected_items):
+        """Show the context menu for local files"""
+        has_selection = bool(selected_items)
+        has_dir = self._has_directory_selected(selected_items)
+        self._local_transfer_menu_action.setVisible(has_selection)
+        self._local_transfer_separator.setVisible(has_selection)
+        self._local_dir_menu_action.setVisible(has_dir)
+        self._local_menu.exec(table.mapToGlobal(position))
 
     def create_remote_context_menu(self, table, position, selected_items):
-        """Create comprehensive context menu for remote files"""
-        menu = QMenu(self.parent)
+        """Show the context menu for remote files"""
+        has_selection = bool(selected_items)
+        has_dir = self._has_directory_selected(selected_items)
+        self._remote_transfer_menu_action.setVisible(has_selection)
+        self._remote_transfer_separator.setVisible(has_selection)
+        self._remote_dir_menu_action.setVisible(has_dir)
+        self._remote_menu.exec(table.mapToGlobal(position))
+
+    # Submenu builders (run from aboutToShow, populate once)
+    def _populate_transfer_local(self, menu):
+        if not menu.isEmpty():
+            return
+
+        # Upload selected files/folders; queueing currently uploads too
+        self._add_actions(menu, 'upload_local', 'queue_local')
+
+    def _populate_file_local(self, menu):
+        if not menu.isEmpty():
+            return
 
-        # Transfer operations submenu
-        if selected_items:
-            transfer_menu = menu.addMenu("Transfer")
+        # Open/Edit
+        self._add_actions(menu, 'open_local')
 
-            # Download selected files/folders
-            download_action = transfer_menu.addAction("Download")
-            download_action.triggered.connect(self._download_selected_remote)
+        # Open with...
+        open_with_menu = menu.addMenu("Open with...")
+        open_with_menu.aboutToShow.connect(partial(self._populate_open_with, open_with_menu))
 
-            # Add to queue
-            queue_action = transfer_menu.addAction("Add to Queue")
-            queue_action.triggered.connect(self._queue_selected_remote)
+        menu.addSeparator()
 
-            menu.addSeparator()
+        # Create new
+        new_menu = menu.addMenu("New")
+        new_menu.aboutToShow.connect(partial(self._populate_new_local, new_menu))
 
-        # File operations submenu
-        file_menu = menu.addMenu("File Operations")
+        menu.addSeparator()
 
-        # View/Edit remote file
-        view_action = file_menu.addAction("View/Edit")
-        view_action.triggered.connect(self._view_selected_remote)
+        # Copy/Paste operations
+        self._add_actions(menu, 'copy', 'paste')
 
-        file_menu.addSeparator()
+        menu.addSeparator()
 
-        # Create new
-        new_menu = file_menu.addMenu("New")
-        new_file_action = new_menu.addAction("File")
-        new_file_action.triggered.connect(self._create_new_file_remote)
+        # Rename/Delete
+        self._add_actions(menu, 'rename_local', 'delete_local')
 
-        new_folder_action = new_menu.addAction("Folder")
-        new_folder_action.triggered.connect(self._create_new_folder_remote)
+    def _populate_open_with(self, menu):
+        if not menu.isEmpty():
+            return
 
-        file_menu.addSeparator()
+        for name, app_path in self._OPEN_WITH_APPS:
+            action = menu.addAction(name)
+            if app_path is None:
+                action.triggered.connect(self._open_with_system_default)
+            else:
+                action.triggered.connect(partial(self._open_with_application, app_path))
 
-        # Copy/Paste operations (between local/remote)
-        copy_action = file_menu.addAction("Copy")
-        copy_action.triggered.connect(self._copy_selected_remote)
+    def _populate_new_local(self, menu):
+        if not menu.isEmpty():
+            return
+
+        self._add_actions(menu, 'new_file', 'new_folder_local')
+
+    def _populate_directory_local(self, menu):
+        if not menu.isEmpty():
+            return
 
-        paste_action = file_menu.addAction("Paste")
-        paste_action.triggered.connect(self._paste_to_remote)
+        self._add_actions(menu, 'enter_local', 'bookmark_local')
 
-        file_menu.addSeparator()
+    def _populate_transfer_remote(self, menu):
+        if not menu.isEmpty():
+            return
 
-        # Rename
-        rename_action = file_menu.addAction("Rename")
-        rename_action.triggered.connect(self._rename_selected_remote)
+        # Download selected files/folders; queueing currently downloads too
+        self._add_actions(menu, 'download_remote', 'queue_remote')
 
-        # Delete
-        delete_action = file_menu.addAction("Delete")
-        delete_action.triggered.connect(self._delete_selected_remote)
+    def _populate_file_remote(self, menu):
+        if not menu.isEmpty():
+            return
 
-        # Change permissions
-        chmod_action = file_menu.addAction("Change Permissions")
-        chmod_action.triggered.connect(self._change_permissions_remote)
+        # View/Edit remote file
+        self._add_actions(menu, 'view_remote')
 
         menu.addSeparator()
 
-        # Directory operations
-        if self._has_directory_selected(selected_items):
-            dir_menu = menu.addMenu("Directory")
+        # Create new
+        new_menu = menu.addMenu("New")
+        new_menu.aboutToShow.connect(partial(self._populate_new_remote, new_menu))
 
-            enter_action = dir_menu.addAction("Enter Directory")
-            enter_action.triggered.connect(self._enter_selected_directory_remote)
+        menu.addSeparator()
 
-            add_bookmark_action = dir_menu.addAction("Add to Bookmarks")
-            add_bookmark_action.triggered.connect(self._add_remote_directory_bookmark)
+        # Copy/Paste operations (between local/remote)
+        self._add_actions(menu, 'copy', 'paste')
 
-        # URL operations
-        url_menu = menu.addMenu("URL")
+        menu.addSeparator()
 
-        copy_url_action = url_menu.addAction("Copy URL to Clipboard")
-        copy_url_action.triggered.connect(self._copy_url_to_clipboard)
+        # Rename/Delete/Change permissions
+        self._add_actions(menu, 'rename_remote', 'delete_remote', 'chmod')
 
-        open_url_action = url_menu.addAction("Open URL in Browser")
-        open_url_action.triggered.connect(self._open_url_in_browser)
+    def _populate_new_remote(self, menu):
+        if not menu.isEmpty():
+            return
 
-        menu.addSeparator()
+        self._add_actions(menu, 'new_file', 'new_folder_remote')
 
-        # Refresh
-        refresh_action = menu.addAction("Refresh")
-        refresh_action.triggered.connect(self._refresh_remote_files)
+    def _populate_directory_remote(self, menu):
+        if not menu.isEmpty():
+            return
 
-        # Properties
-        menu.addSeparator()
-        properties_action = menu.addAction("Properties")
-        properties_action.triggered.connect(self._show_remote_properties)
+        self._add_actions(menu, 'enter_remote', 'bookmark_remote')
+
+    def _populate_url_remote(self, menu):
+        if not menu.isEmpty():
+            return
 
-        menu.exec(table.mapToGlobal(position))
+        self._add_actions(menu, 'copy_url', 'open_url')
 
     def create_local_tree_context_menu(self, tree, position):
         """Create context menu for local directory tree"""
-        menu = QMenu(self.parent)
+        menu = QMenu(tree)
 
         # Get selected item
         item = tree.itemAt(position)
         if item:
-            path_data = item.data(0, Qt.ItemDataRole.UserRole)
+            path_data = item.data(0, _USER_ROLE)
             if path_data:
                 # Transfer operations
-                upload_action = menu.addAction("Upload")
-                upload_action.triggered.connect(lambda: self._upload_from_tree(path_data))
+                self._add_actions(menu, 'tree_upload')
 
                 menu.addSeparator()
 
                 # Directory operations
-                new_folder_action = menu.addAction("New Folder")
-                new_folder_action.triggered.connect(lambda: self._create_folder_in_tree(path_data))
-
-                refresh_action = menu.addAction("Refresh")
-                refresh_action.triggered.connect(lambda: self._refresh_tree_item(tree, item))
+                self._add_actions(menu, 'tree_new_folder', 'tree_refresh')
 
                 menu.addSeparator()
 
                 # Properties
-                properties_action = menu.addAction("Properties")
-                properties_action.triggered.connect(lambda: self._show_tree_properties(path_data))
+                self._add_actions(menu, 'properties')
 
         menu.exec(tree.mapToGlobal(position))
 
     def create_remote_tree_context_menu(self, tree, position):
         """Create context menu for remote directory tree"""
-        menu = QMenu(self.parent)
+        menu = QMenu(tree)
 
         # Get selected item
         item = tree.itemAt(position)
         if item:
-            path_data = item.data(0, Qt.ItemDataRole.UserRole)
+            path_data = item.data(0, _USER_ROLE)
             if path_data:
                 # Transfer operations
-                download_action = menu.addAction("Download")
-                download_action.triggered.connect(lambda: self._download_from_tree(path_data))
+                self._add_actions(menu, 'tree_download')
 
                 menu.addSeparator()
 
                 # Directory operations
-                new_folder_action = menu.addAction("New Folder")
-                new_folder_action.triggered.connect(lambda: self._create_remote_folder_in_tree(path_data))
-
-                refresh_action = menu.addAction("Refresh")
-                refresh_action.triggered.connect(lambda: self._refresh_remote_tree_item(tree, item))
+                self._add_actions(menu, 'tree_new_folder', 'tree_refresh')
 
                 menu.addSeparator()
 
                 # Properties
-                properties_action = menu.addAction("Properties")
-                properties_action.triggered.connect(lambda: self._show_remote_tree_properties(path_data))
+                self._add_actions(menu, 'properties')
 
         menu.exec(tree.mapToGlobal(position))
 
@@ -258,9 +350,6 @@ class ContextMenuManager:
     def _upload_selected_local(self):
         self.parent.upload_selected_local()
 
-    def _queue_selected_local(self):
-        self.parent.upload_selected_local()  # For now, same as upload
-
     def _open_selected_local(self):
         self.parent.open_selected_local_file()
 
@@ -272,21 +361,9 @@ class ContextMenuManager:
         """Open selected file with system default application"""
         self.parent.open_selected_local_file()
 
-    def _create_new_file_local(self):
-        # TODO: Implement
-        pass
-
     def _create_new_folder_local(self):
         self.parent.create_local_folder()
 
-    def _copy_selected_local(self):
-        # TODO: Implement clipboard operations
-        pass
-
-    def _paste_to_local(self):
-        # TODO: Implement paste operations
-        pass
-
     def _rename_selected_local(self):
         self.parent.rename_selected_local()
 
@@ -303,50 +380,34 @@ class ContextMenuManager:
             # Get current directory
             current_path = getattr(self.parent, 'current_local_path', '')
             if current_path:
-                bookmark_name = f"Bookmark {len(self.parent.bookmark_manager.get_local_bookmarks()) + 1}"
+                bookmark_name = f"Bookmark {self.parent.bookmark_manager.next_local_bookmark_id()}"
                 self.parent.bookmark_manager.add_bookmark(bookmark_name, current_path, "local")
 
     def _refresh_local_files(self):
-        self.parent.load_local_files()
+        if self._refresh_local_pending:
+            return
+        self._refresh_local_pending = True
+        QTimer.singleShot(_REFRESH_DEBOUNCE_MS, self._do_refresh_local)
 
-    def _show_local_properties(self):
-        # TODO: Implement properties dialog
-        pass
+    def _do_refresh_local(self):
+        self._refresh_local_pending = False
+        self.parent.load_local_files()
 
     def _download_selected_remote(self):
         self.parent.download_selected_remote()
 
-    def _queue_selected_remote(self):
-        self.parent.download_selected_remote()  # For now, same as download
-
     def _view_selected_remote(self):
         self.parent.view_selected_remote_file()
 
-    def _create_new_file_remote(self):
-        # TODO: Implement
-        pass
-
     def _create_new_folder_remote(self):
         self.parent.create_remote_folder()
 
-    def _copy_selected_remote(self):
-        # TODO: Implement
-        pass
-
-    def _paste_to_remote(self):
-        # TODO: Implement
-        pass
-
     def _rename_selected_remote(self):
         self.parent.rename_selected_remote()
 
     def _delete_selected_remote(self):
         self.parent.delete_selected_remote()
 
-    def _change_permissions_remote(self):
-        # TODO: Implement chmod dialog
-        pass
-
     def _enter_selected_directory_remote(self):
         self.parent.enter_selected_remote_directory()
 
@@ -356,63 +417,40 @@ class ContextMenuManager:
             tab = self.parent.get_current_tab()
             if tab and hasattr(tab, 'current_remote_path') and tab.current_remote_path:
                 server_name = tab.config.host if hasattr(tab, 'config') else None
-                bookmark_name = f"Remote {len(self.parent.bookmark_manager.get_remote_bookmarks()) + 1}"
+                bookmark_name = f"Remote {self.parent.bookmark_manager.next_remote_bookmark_id()}"
                 self.parent.bookmark_manager.add_bookmark(bookmark_name, tab.current_remote_path, "remote", server_name)
 
-    def _copy_url_to_clipboard(self):
-        # TODO: Implement URL operations
-        pass
-
-    def _open_url_in_browser(self):
-        # TODO: Implement URL operations
-        pass
-
     def _refresh_remote_files(self):
-        self.parent.load_remote_files()
+        if self._refresh_remote_pending:
+            return
+        self._refresh_remote_pending = True
+        QTimer.singleShot(_REFRESH_DEBOUNCE_MS, self._do_refresh_remote)
 
-    def _show_remote_properties(self):
-        # TODO: Implement properties dialog
-        pass
-
-    def _upload_from_tree(self, path):
-        # TODO: Implement tree upload
-        pass
-
-    def _create_folder_in_tree(self, path):
-        # TODO: Implement tree folder creation
-        pass
-
-    def _refresh_tree_item(self, tree, item):
-        # TODO: Implement tree refresh
-        pass
-
-    def _show_tree_properties(self, path):
-        # TODO: Implement tree properties
-        pass
-
-    def _download_from_tree(self, path):
-        # TODO: Implement tree download
-        pass
+    def _do_refresh_remote(self):
+        self._refresh_remote_pending = False
+        self.parent.load_remote_files()
 
-    def _create_remote_folder_in_tree(self, path):
-        # TODO: Implement remote tree folder creation
-        pass
+    def _has_directory_selected(self, selected_items):
+        """Check if any selected items are directories"""
+        return any(getattr(item.data(_USER_ROLE), 'is_dir', False) for item in selected_items)
 
-    def _refresh_remote_tree_item(self, tree, item):
-        # TODO: Implement remote tree refresh
-        pass
 
-    def _show_remote_tree_properties(self, path):
-        # TODO: Implement remote tree properties
-        pass
+def _classify_local_entry(entry):
+    """Return (is_file, is_dir) for a path string or an os.DirEntry
 
-    def _has_directory_selected(self, selected_items):
-        """Check if any selected items are directories"""
-        for item in selected_items:
-            file_data = item.data(Qt.ItemDataRole.UserRole)
-            if file_data and getattr(file_data, 'is_dir', False):
-                return True
-        return False
+    DirEntry objects answer from the type cached by scandir(), so no
+    syscall is made; plain paths are classified with a single stat().
+    """
+    if isinstance(entry, os.DirEntry):
+        try:
+            return entry.is_file(follow_symlinks=False), entry.is_dir(follow_symlinks=False)
+        except OSError:
+            return False, False
+    try:
+        mode = os.stat(entry).st_mode
+    except OSError:
+        return False, False
+    return stat.S_ISREG(mode), stat.S_ISDIR(mode)
 
 
 # Legacy functions for backward compatibility
@@ -426,37 +464,38 @@ def create_local_context_menu(parent, table, position,
     if row >= 0:
         item = table.item(row, 0)
         if item:
-            path_str = item.data(Qt.ItemDataRole.UserRole)
-            if path_str:
-                path = Path(path_str)
-                if path.exists():
-                    if path.is_file():
+            entry = item.data(_USER_ROLE)
+            if entry:
+                is_file, is_dir = _classify_local_entry(entry)
+                if is_file or is_dir:
+                    path = Path(entry)
+                    if is_file:
                         if upload_callback:
-                            upload_action = menu.addAction("Upload")
-                            upload_action.triggered.connect(lambda: upload_callback())
+                            upload_action = menu.addAction(_LBL_UPLOAD)
+                            upload_action.triggered.connect(upload_callback)
                             menu.addSeparator()
 
                         if open_callback:
                             open_action = menu.addAction("Open")
-                            open_action.triggered.connect(lambda: open_callback(path))
+                            open_action.triggered.connect(partial(open_callback, path))
                             menu.addSeparator()
 
                         if delete_callback:
-                            delete_action = menu.addAction("Delete")
-                            delete_action.triggered.connect(lambda: delete_callback(path))
-                    elif path.is_dir():
+                            delete_action = menu.addAction(_LBL_DELETE)
+                            delete_action.triggered.connect(partial(delete_callback, path))
+                    else:
                         if upload_callback:
                             upload_action = menu.addAction("Upload Folder")
-                            upload_action.triggered.connect(lambda: upload_callback())
+                            upload_action.triggered.connect(upload_callback)
                             menu.addSeparator()
 
                         if delete_callback:
-                            delete_action = menu.addAction("Delete")
-                            delete_action.triggered.connect(lambda: delete_callback(path))
+                            delete_action = menu.addAction(_LBL_DELETE)
+                            delete_action.triggered.connect(partial(delete_callback, path))
 
     menu.addSeparator()
     if refresh_callback:
-        refresh_action = menu.addAction("Refresh")
+        refresh_action = menu.addAction(_LBL_REFRESH)
         refresh_action.triggered.connect(refresh_callback)
 
     menu.exec(table.viewport().mapToGlobal(position))
@@ -472,20 +511,20 @@ def create_remote_context_menu(parent, table, position,
     if row >= 0:
         item = table.item(row, 0)
         if item:
-            file_data = item.data(Qt.ItemDataRole.UserRole)
+            file_data = item.data(_USER_ROLE)
             if file_data:
                 if download_callback:
-                    download_action = menu.addAction("Download")
-                    download_action.triggered.connect(lambda: download_callback())
+                    download_action = menu.addAction(_LBL_DOWNLOAD)
+                    download_action.triggered.connect(download_callback)
                     menu.addSeparator()
 
                 if delete_callback:
-                    delete_action = menu.addAction("Delete")
-                    delete_action.triggered.connect(lambda: delete_callback(file_data))
+                    delete_action = menu.addAction(_LBL_DELETE)
+                    delete_action.triggered.connect(partial(delete_callback, file_data))
 
     menu.addSeparator()
     if refresh_callback:
-        refresh_action = menu.addAction("Refresh")
+        refresh_action = menu.addAction(_LBL_REFRESH)
         refresh_action.triggered.connect(refresh_callback)
 
     menu.exec(table.viewport().mapToGlobal(position))
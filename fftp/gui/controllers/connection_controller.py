@@ -3,14 +3,20 @@ Connection Controller - Manages FTP/SFTP connection lifecycle
 Extracted from main_window.py as part of Phase 13 refactoring
 """
 
-from typing import Optional, Callable
-from PyQt6.QtCore import QObject, pyqtSignal
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+from functools import partial
+from PyQt6.QtCore import QObject, QThreadPool, Qt, pyqtSignal
 from PyQt6.QtWidgets import QMessageBox
 
-from ...models import ConnectionConfig
-from ...managers import SFTPManager, FTPManager
 from ..connection_worker import ConnectionWorker
 
+if TYPE_CHECKING:
+    # Only needed for annotations; importing managers pulls in paramiko
+    from ...models import ConnectionConfig
+    from ...managers import SFTPManager, FTPManager
+
 
 class ConnectionController(QObject):
     """Handles all connection-related operations"""
@@ -20,32 +26,27 @@ class ConnectionController(QObject):
     connection_established = pyqtSignal(object)  # Emits manager
     connection_failed = pyqtSignal(str)  # Emits error message
     connection_closed = pyqtSignal()
+    log_message = pyqtSignal(str)
+    status_message = pyqtSignal(str)
+    _disconnect_finished = pyqtSignal()
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.manager: Optional[SFTPManager | FTPManager] = None
         self.config: Optional[ConnectionConfig] = None
         self.connection_worker: Optional[ConnectionWorker] = None
-        self._log_callback: Optional[Callable[[str], None]] = None
-        self._status_callback: Optional[Callable[[str], None]] = None
-    
-    def set_log_callback(self, callback: Callable[[str], None]):
-        """Set callback for logging messages"""
-        self._log_callback = callback
-    
-    def set_status_callback(self, callback: Callable[[str], None]):
-        """Set callback for status updates"""
-        self._status_callback = callback
+        self._connected_cache: Optional[bool] = None
+        self._reconnect_config: Optional[ConnectionConfig] = None
+        self._disconnect_finished.connect(self._on_disconnect_finished,
+                                          Qt.ConnectionType.QueuedConnection)
     
     def _log(self, message: str):
         """Internal logging helper"""
-        if self._log_callback:
-            self._log_callback(message)
+        self.log_message.emit(message)
     
     def _status(self, message: str):
         """Internal status update helper"""
-        if self._status_callback:
-            self._status_callback(message)
+        self.status_message.emit(message)
     
     def connect(self, config: ConnectionConfig) -> bool:
         """
@@ -78,6 +79,7 @@ class ConnectionController(QObject):
     def _on_connection_established(self, manager):
         """Handle successful connection"""
         self.manager = manager
+        self._connected_cache = True
         self._log(f"Connected to {self.config.host}")
         self._status(f"Connected to {self.config.host}")
         self.connection_established.emit(manager)
@@ -89,6 +91,7 @@ class ConnectionController(QObject):
         self.connection_failed.emit(error_message)
         self.manager = None
         self.config = None
+        self._connected_cache = False
     
     def disconnect(self) -> bool:
         """
@@ -109,6 +112,7 @@ class ConnectionController(QObject):
             
             self.manager = None
             self.config = None
+            self._connected_cache = False
             self.connection_closed.emit()
             return True
             
@@ -117,8 +121,21 @@ class ConnectionController(QObject):
             return False
     
     def is_connected(self) -> bool:
-        """Check if currently connected to a server"""
-        return self.manager is not None and hasattr(self.manager, 'is_connected') and self.manager.is_connected()
+        """
+        Check if currently connected to a server
+        
+        The result is cached until the connection state changes or
+        invalidate_connection_cache() is called, since probing the manager
+        costs a network round-trip.
+        """
+        if self._connected_cache is None:
+            m = self.manager
+            self._connected_cache = m is not None and m.is_connected()
+        return self._connected_cache
+    
+    def invalidate_connection_cache(self):
+        """Force the next is_connected() call to probe the manager"""
+        self._connected_cache = None
     
     def get_manager(self) -> Optional[SFTPManager | FTPManager]:
         """Get current connection manager"""
@@ -140,5 +157,33 @@ class ConnectionController(QObject):
             return False
         
         self._log("Reconnecting...")
-        self.disconnect()
-        return self.connect(self.config)
+        saved_config = self.config
+        manager = self.manager
+        
+        self.manager = None
+        self.config = None
+        self._connected_cache = False
+        self.connection_closed.emit()
+        
+        if manager is None:
+            return self.connect(saved_config)
+        
+        # Closing a stalled socket can block for a long time, so do it off
+        # the GUI thread and reconnect once it has finished
+        self._reconnect_config = saved_config
+        QThreadPool.globalInstance().start(partial(self._disconnect_in_background, manager))
+        return True
+    
+    def _disconnect_in_background(self, manager):
+        """Close an old manager's connection from a pool thread"""
+        try:
+            manager.disconnect()
+        except Exception:
+            pass
+        self._disconnect_finished.emit()
+    
+    def _on_disconnect_finished(self):
+        """Connect again after a background disconnect has completed"""
+        config, self._reconnect_config = self._reconnect_config, None
+        if config:
+            self.connect(config)
@@ -3,12 +3,25 @@ Navigation Controller - Manages local and remote directory navigation
 Extracted from main_window.py as part of Phase 13 refactoring
 """
 
-from typing import Optional, Callable, List
+import os
+import posixpath
+import stat
+import time
+from collections import OrderedDict
+from typing import Optional, Callable, List, Tuple
 from pathlib import Path
 from PyQt6.QtCore import QObject, pyqtSignal
 
 from ...managers import SFTPManager, FTPManager
-from ...models import RemoteFile
+from ...models import LocalFile, RemoteFile
+
+
+def _stat_or_none(path) -> Optional[os.stat_result]:
+    """stat() a path, returning None if it cannot be accessed"""
+    try:
+        return os.stat(path)
+    except (OSError, ValueError):
+        return None
 
 
 class NavigationController(QObject):
@@ -19,6 +32,8 @@ class NavigationController(QObject):
     remote_path_changed = pyqtSignal(str)  # Emits new path
     local_files_loaded = pyqtSignal(list)  # Emits file list
     remote_files_loaded = pyqtSignal(list)  # Emits file list
+    remote_files_appended = pyqtSignal(list)  # Emits a further page of the current listing
+    remote_files_more_available = pyqtSignal(int)  # Emits count of entries not yet emitted
     navigation_error = pyqtSignal(str)  # Emits error message
     
     def __init__(self, parent=None):
@@ -28,6 +43,14 @@ class NavigationController(QObject):
         self.local_history: List[str] = []
         self.remote_history: List[str] = []
         
+        # Remote listings keyed by path as (timestamp, files), oldest first
+        self._remote_cache: "OrderedDict[str, Tuple[float, List[RemoteFile]]]" = OrderedDict()
+        self._remote_cache_ttl = 30.0
+        self._remote_cache_max = 64
+        self._remote_cache_manager = None
+        self._remote_listing: List[RemoteFile] = []
+        self.max_immediate_load = 500
+        
         self._log_callback: Optional[Callable[[str], None]] = None
     
     def set_log_callback(self, callback: Callable[[str], None]):
@@ -53,12 +76,13 @@ class NavigationController(QObject):
         """
         try:
             path_obj = Path(path)
-            if not path_obj.exists():
+            st = _stat_or_none(path)
+            if st is None:
                 self._log(f"Path does not exist: {path}")
                 self.navigation_error.emit(f"Path does not exist: {path}")
                 return False
             
-            if not path_obj.is_dir():
+            if not stat.S_ISDIR(st.st_mode):
                 self._log(f"Not a directory: {path}")
                 self.navigation_error.emit(f"Not a directory: {path}")
                 return False
@@ -83,12 +107,23 @@ class NavigationController(QObject):
         parent = Path(self.current_local_path).parent
         return self.navigate_local(str(parent))
     
-    def local_back(self) -> bool:
-        """Navigate back in local history"""
+    def local_back(self, validate: bool = False) -> bool:
+        """
+        Navigate back in local history
+        
+        Args:
+            validate: Check that the history entry is still a directory;
+                entries were valid when recorded, so this is off by default
+        """
         if not self.local_history:
             return False
         
         previous_path = self.local_history.pop()
+        if validate and not os.path.isdir(previous_path):
+            self._log(f"Not a directory: {previous_path}")
+            self.navigation_error.emit(f"Not a directory: {previous_path}")
+            return False
+        
         self.current_local_path = previous_path
         self.local_path_changed.emit(self.current_local_path)
         return True
@@ -97,6 +132,94 @@ class NavigationController(QObject):
         """Get current local path"""
         return self.current_local_path
     
+    # Remote Listing Cache
+    
+    def _use_cache_for(self, manager):
+        """Drop cached listings that belong to a different connection"""
+        if manager is not self._remote_cache_manager:
+            self._remote_cache.clear()
+            self._remote_cache_manager = manager
+    
+    def _store_listing(self, path: str, files: List[RemoteFile]):
+        """Record a fresh listing, evicting the least recently used one"""
+        self._remote_cache[path] = (time.monotonic(), files)
+        self._remote_cache.move_to_end(path)
+        if len(self._remote_cache) > self._remote_cache_max:
+            self._remote_cache.popitem(last=False)
+    
+    def _list_remote(self, manager, path: str) -> List[RemoteFile]:
+        """List a remote directory, reusing a recent listing when available"""
+        self._use_cache_for(manager)
+        
+        cached = self._remote_cache.get(path)
+        if cached is not None:
+            stamp, files = cached
+            if time.monotonic() - stamp < self._remote_cache_ttl:
+                self._remote_cache.move_to_end(path)
+                self._log(f"Remote listing cache hit: {path}")
+                return files
+            del self._remote_cache[path]
+        
+        files = manager.list_files(path)
+        self._store_listing(path, files)
+        return files
+    
+    def invalidate_remote_cache(self, path: Optional[str] = None):
+        """
+        Drop cached remote listings
+        
+        Args:
+            path: Directory whose listing changed, or None to drop everything
+        """
+        if path is None:
+            self._remote_cache.clear()
+        else:
+            self._remote_cache.pop(path, None)
+    
+    def _invalidate_remote_entry(self, path: str):
+        """Drop the listings a change to one remote entry makes stale"""
+        path = path.rstrip('/') or '/'
+        self.invalidate_remote_cache(posixpath.dirname(path) or '/')
+        prefix = path + '/'
+        for cached in [p for p in self._remote_cache if p == path or p.startswith(prefix)]:
+            del self._remote_cache[cached]
+    
+    def watch_transfers(self, transfer_controller):
+        """Drop the listing of each remote directory an upload completes into"""
+        transfer_controller.transfer_completed.connect(self._on_transfer_completed)
+    
+    def _on_transfer_completed(self, item):
+        """Drop the listing an uploaded file now appears in"""
+        if item.direction == 'upload':
+            self._invalidate_remote_entry(item.remote_path)
+    
+    def delete_remote(self, manager, remote_file: RemoteFile):
+        """
+        Delete a remote file or folder, dropping the listings it appeared in
+        
+        Args:
+            manager: FTP/SFTP manager
+            remote_file: Entry to delete
+        """
+        if remote_file.is_dir:
+            manager.delete_folder(remote_file.path)
+        else:
+            manager.delete_file(remote_file.path)
+        self._invalidate_remote_entry(remote_file.path)
+    
+    def rename_remote(self, manager, old_path: str, new_path: str):
+        """
+        Rename a remote entry, dropping the listings of both locations
+        
+        Args:
+            manager: FTP/SFTP manager
+            old_path: Current remote path
+            new_path: New remote path
+        """
+        manager.rename_file(old_path, new_path)
+        self._invalidate_remote_entry(old_path)
+        self._invalidate_remote_entry(new_path)
+    
     # Remote Navigation
     
     def navigate_remote(self, manager, path: str) -> bool:
@@ -117,7 +240,7 @@ class NavigationController(QObject):
         
         try:
             # Try to list files in the path to verify it exists
-            files = manager.list_files(path)
+            files = self._list_remote(manager, path)
             
             # Add to history
             if self.current_remote_path != path:
@@ -143,14 +266,10 @@ class NavigationController(QObject):
         if self.current_remote_path in ['/', '.']:
             return False
         
-        # Get parent directory
-        parts = self.current_remote_path.rstrip('/').split('/')
-        if len(parts) > 1:
-            parent = '/'.join(parts[:-1])
-            if not parent.startswith('/'):
-                parent = '/' + parent
-        else:
-            parent = '/'
+        # Get parent directory (remote paths are always POSIX-style)
+        parent = posixpath.dirname(self.current_remote_path.rstrip('/')) or '/'
+        if not parent.startswith('/'):
+            parent = '/' + parent
         
         return self.navigate_remote(manager, parent)
     
@@ -168,16 +287,28 @@ class NavigationController(QObject):
     
     # File Listing
     
-    def load_local_files(self) -> List[Path]:
+    def load_local_files(self) -> List[LocalFile]:
         """
         Load files from current local directory
         
+        Entries come from a single os.scandir() pass, so the size, mtime
+        and type are read once here and never re-stat'ed by the views.
+        
         Returns:
-            List of Path objects
+            List of LocalFile objects
         """
         try:
-            path = Path(self.current_local_path)
-            files = list(path.iterdir())
+            files = []
+            with os.scandir(self.current_local_path) as it:
+                for entry in it:
+                    try:
+                        st = entry.stat(follow_symlinks=False)
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                        is_file = entry.is_file(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    files.append(LocalFile(entry.name, entry.path, is_dir, is_file,
+                                           st.st_size, st.st_mtime))
             self.local_files_loaded.emit(files)
             return files
         except Exception as e:
@@ -185,28 +316,75 @@ class NavigationController(QObject):
             self.navigation_error.emit(str(e))
             return []
     
-    def load_remote_files(self, manager) -> List[RemoteFile]:
+    def load_local_paths(self) -> List[Path]:
+        """
+        Load files from current local directory as Path objects
+        
+        Compatibility wrapper for callers that still expect Paths.
+        """
+        return [f.path_obj for f in self.load_local_files()]
+    
+    def load_remote_files(self, manager, use_cache: bool = False) -> List[RemoteFile]:
         """
         Load files from current remote directory
         
+        This is an explicit refresh, so the directory is listed again
+        unless use_cache is set, e.g. straight after navigate_remote()
+        has just listed it.
+        
+        Listings longer than max_immediate_load are emitted a page at a
+        time: the first page goes out through remote_files_loaded, then
+        remote_files_more_available reports the remainder, which views
+        page in with load_more_remote_files().
+        
         Args:
             manager: FTP/SFTP manager
+            use_cache: Reuse a cached listing that has not expired
             
         Returns:
-            List of RemoteFile objects
+            List of all RemoteFile objects in the directory
         """
         if not manager:
             return []
         
+        if not use_cache:
+            self.invalidate_remote_cache(self.current_remote_path)
         try:
-            files = manager.list_files(self.current_remote_path)
-            self.remote_files_loaded.emit(files)
+            files = self._list_remote(manager, self.current_remote_path)
+            self._remote_listing = files
+            limit = self.max_immediate_load
+            if limit and len(files) > limit:
+                self.remote_files_loaded.emit(files[:limit])
+                self.remote_files_more_available.emit(len(files) - limit)
+            else:
+                self.remote_files_loaded.emit(files)
             return files
         except Exception as e:
             self._log(f"Error loading remote files: {str(e)}")
             self.navigation_error.emit(str(e))
             return []
     
+    def load_more_remote_files(self, offset: int, limit: Optional[int] = None) -> List[RemoteFile]:
+        """
+        Emit another page of the last remote listing
+        
+        Args:
+            offset: Index of the first entry to emit
+            limit: Page size, defaults to max_immediate_load
+            
+        Returns:
+            List of RemoteFile objects in the page
+        """
+        if limit is None:
+            limit = self.max_immediate_load or len(self._remote_listing)
+        page = self._remote_listing[offset:offset + limit]
+        if page:
+            self.remote_files_appended.emit(page)
+            remaining = len(self._remote_listing) - offset - len(page)
+            if remaining > 0:
+                self.remote_files_more_available.emit(remaining)
+        return page
+    
     # Synchronized Browsing
     
     def sync_local_to_remote(self, manager, local_path: str) -> bool:
@@ -3,19 +3,52 @@ Transfer Controller - Manages file transfer operations and queue
 Extracted from main_window.py as part of Phase 13 refactoring
 """
 
-from typing import Optional, Callable, List
+import os
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Callable, Deque, Dict, Iterable, List, Set, Tuple
 from pathlib import Path
 from PyQt6.QtCore import QObject, pyqtSignal
 
 from ...managers import SFTPManager, FTPManager
+from ...models import LocalFile
 from ..transfer_engine import TransferEngine
+from .navigation_controller import _stat_or_none
+
+# Batches at least this large are stat'ed on a thread pool
+_BULK_STAT_THRESHOLD = 64
+_BULK_STAT_WORKERS = 8
+
+# Minimum seconds between progress signals when the percentage is unchanged
+_PROGRESS_EMIT_INTERVAL = 0.1
+
+
+def _bulk_stat(paths: List[Path]) -> Dict[int, Optional[os.stat_result]]:
+    """
+    stat() many paths, keyed by id() of each path object
+    
+    Small batches are stat'ed inline; larger ones are spread over a thread
+    pool so the per-call latency overlaps (os.stat releases the GIL).
+    Returns an empty dict for small batches so callers stat on demand.
+    """
+    if len(paths) < _BULK_STAT_THRESHOLD:
+        return {}
+    with ThreadPoolExecutor(max_workers=_BULK_STAT_WORKERS) as executor:
+        results = executor.map(_stat_or_none, paths)
+        return {id(path): st for path, st in zip(paths, results)}
 
 
 class TransferItem:
     """Represents a single transfer operation"""
     
+    __slots__ = ('local_path', 'local_path_str', 'remote_path', 'direction', 'size',
+                 'progress', 'status', 'error_message', 'speed', 'eta', 'mtime', 'mode',
+                 'last_emit_time')
+    
     def __init__(self, local_path: Path, remote_path: str, direction: str, size: int = 0):
         self.local_path = local_path
+        self.local_path_str = os.fspath(local_path)
         self.remote_path = remote_path
         self.direction = direction  # 'upload' or 'download'
         self.size = size
@@ -24,6 +57,9 @@ class TransferItem:
         self.error_message = None
         self.speed = 0
         self.eta = 0
+        self.mtime = 0.0
+        self.mode = 0
+        self.last_emit_time = 0.0  # monotonic time of the last progress signal
 
 
 class TransferController(QObject):
@@ -39,8 +75,9 @@ class TransferController(QObject):
     def __init__(self, parent=None, max_concurrent: int = 10):
         super().__init__(parent)
         self.max_concurrent_transfers = max_concurrent
-        self.transfer_queue: List[TransferItem] = []
-        self.active_transfers: List[TransferEngine] = []
+        self.transfer_queue: Deque[TransferItem] = deque()
+        self._queued: Set[int] = set()  # id() of items still waiting in the queue
+        self.active_transfers: Dict[int, TransferEngine] = {}  # keyed by id(engine)
         self.completed_transfers: List[TransferItem] = []
         self.failed_transfers: List[TransferItem] = []
         
@@ -77,9 +114,8 @@ class TransferController(QObject):
         Returns:
             TransferItem representing this transfer
         """
-        size = local_path.stat().st_size if local_path.exists() else 0
-        item = TransferItem(local_path, remote_path, 'upload', size)
-        self.transfer_queue.append(item)
+        item = self._make_upload_item(local_path, remote_path)
+        self._enqueue(item)
         
         self._log(f"Added to upload queue: {local_path.name}")
         self.queue_updated.emit()
@@ -101,7 +137,7 @@ class TransferController(QObject):
             TransferItem representing this transfer
         """
         item = TransferItem(local_path, remote_path, 'download', size)
-        self.transfer_queue.append(item)
+        self._enqueue(item)
         
         self._log(f"Added to download queue: {Path(remote_path).name}")
         self.queue_updated.emit()
@@ -109,12 +145,100 @@ class TransferController(QObject):
         
         return item
     
+    def add_uploads_bulk(self, manager, pairs: Iterable[Tuple[Path, str]]) -> List[TransferItem]:
+        """
+        Add many uploads to the queue at once
+        
+        Emits a single queue_updated for the whole batch instead of one per file.
+        
+        Args:
+            manager: FTP/SFTP manager
+            pairs: (local path, remote destination path) tuples; the local side
+                may be a LocalFile from NavigationController.load_local_files()
+                to reuse its stat data
+            
+        Returns:
+            List of TransferItems in the order given
+        """
+        pairs = list(pairs)
+        stats = _bulk_stat([local for local, _ in pairs if not isinstance(local, LocalFile)])
+        
+        items = []
+        for local, remote_path in pairs:
+            if isinstance(local, LocalFile):
+                item = self._make_upload_item(local, remote_path)
+            else:
+                item = self._make_upload_item(local, remote_path, stats.get(id(local), False))
+            self._enqueue(item)
+            items.append(item)
+        
+        if items:
+            self._log(f"Added {len(items)} files to upload queue")
+            self.queue_updated.emit()
+            self._process_queue(manager)
+        return items
+    
+    def _make_upload_item(self, local, remote_path: str, st=False) -> TransferItem:
+        """
+        Build an upload item, reading size and mtime from one stat() at most
+        
+        Args:
+            local: Local Path or LocalFile
+            remote_path: Remote destination path
+            st: Pre-fetched stat result for a Path (None if it failed);
+                False means stat here
+        """
+        if isinstance(local, LocalFile):
+            item = TransferItem(local.path_obj, remote_path, 'upload', local.size)
+            item.mtime = local.mtime
+            return item
+        
+        if st is False:
+            st = _stat_or_none(local)
+        if st is None:
+            return TransferItem(local, remote_path, 'upload', 0)
+        item = TransferItem(local, remote_path, 'upload', st.st_size)
+        item.mtime = st.st_mtime
+        item.mode = st.st_mode
+        return item
+    
+    def add_downloads_bulk(self, manager, entries: Iterable[Tuple[str, Path, int]]) -> List[TransferItem]:
+        """
+        Add many downloads to the queue at once
+        
+        Args:
+            manager: FTP/SFTP manager
+            entries: (remote path, local destination path, size) tuples
+            
+        Returns:
+            List of TransferItems in the order given
+        """
+        items = []
+        for remote_path, local_path, size in entries:
+            item = TransferItem(local_path, remote_path, 'download', size)
+            self._enqueue(item)
+            items.append(item)
+        
+        if items:
+            self._log(f"Added {len(items)} files to download queue")
+            self.queue_updated.emit()
+            self._process_queue(manager)
+        return items
+    
+    def _enqueue(self, item: TransferItem):
+        """Append an item to the pending queue"""
+        self.transfer_queue.append(item)
+        self._queued.add(id(item))
+    
     def _process_queue(self, manager):
         """Process queued transfers up to max concurrent limit"""
         while (len(self.active_transfers) < self.max_concurrent_transfers and 
                len(self.transfer_queue) > 0):
             
-            item = self.transfer_queue.pop(0)
+            item = self.transfer_queue.popleft()
+            if id(item) not in self._queued:
+                continue  # cancelled while waiting
+            self._queued.discard(id(item))
             self._start_transfer(manager, item)
     
     def _start_transfer(self, manager, item: TransferItem):
@@ -125,31 +249,47 @@ class TransferController(QObject):
         # Create transfer engine
         engine = TransferEngine(
             manager=manager,
-            local_path=str(item.local_path),
+            local_path=item.local_path_str,
             remote_path=item.remote_path,
             direction=item.direction,
             parent=self
         )
         
-        # Connect signals
-        engine.progress_updated.connect(
-            lambda current, total: self._on_progress(item, current, total)
-        )
-        engine.transfer_completed.connect(
-            lambda: self._on_completed(item, engine, manager)
-        )
-        engine.transfer_failed.connect(
-            lambda error: self._on_failed(item, engine, error, manager)
-        )
+        # Connect signals to bound methods; the handlers find the item and
+        # manager on the sending engine instead of capturing them in closures
+        engine._transfer_item = item
+        engine._manager = manager
+        engine.progress_updated.connect(self._on_engine_progress)
+        engine.transfer_completed.connect(self._on_engine_completed)
+        engine.transfer_failed.connect(self._on_engine_failed)
         
-        self.active_transfers.append(engine)
+        self.active_transfers[id(engine)] = engine
         engine.start()
         
         self._log(f"Started {item.direction}: {item.local_path.name}")
     
+    def _on_engine_progress(self, current: int, total: int):
+        self._on_progress(self.sender()._transfer_item, current, total)
+    
+    def _on_engine_completed(self):
+        engine = self.sender()
+        self._on_completed(engine._transfer_item, engine, engine._manager)
+    
+    def _on_engine_failed(self, error: str):
+        engine = self.sender()
+        self._on_failed(engine._transfer_item, engine, error, engine._manager)
+    
     def _on_progress(self, item: TransferItem, current: int, total: int):
         """Handle transfer progress update"""
-        item.progress = int((current / total * 100)) if total > 0 else 0
+        # Only forward updates that change the percentage, finish the
+        # transfer, or arrive after a quiet period (keeps speed/ETA fresh)
+        new_progress = int((current / total * 100)) if total > 0 else 0
+        now = time.monotonic()
+        if (new_progress == item.progress and current != total
+                and now - item.last_emit_time < _PROGRESS_EMIT_INTERVAL):
+            return
+        item.progress = new_progress
+        item.last_emit_time = now
         self.transfer_progress.emit(item, current, total)
     
     def _on_completed(self, item: TransferItem, engine: TransferEngine, manager):
@@ -157,8 +297,7 @@ class TransferController(QObject):
         item.status = 'completed'
         item.progress = 100
         
-        if engine in self.active_transfers:
-            self.active_transfers.remove(engine)
+        self.active_transfers.pop(id(engine), None)
         
         self.completed_transfers.append(item)
         self.transfer_completed.emit(item)
@@ -174,8 +313,7 @@ class TransferController(QObject):
         item.status = 'failed'
         item.error_message = error
         
-        if engine in self.active_transfers:
-            self.active_transfers.remove(engine)
+        self.active_transfers.pop(id(engine), None)
         
         self.failed_transfers.append(item)
         self.transfer_failed.emit(item, error)
@@ -188,8 +326,10 @@ class TransferController(QObject):
     
     def cancel_transfer(self, item: TransferItem):
         """Cancel a specific transfer"""
-        if item.status == 'queued' and item in self.transfer_queue:
-            self.transfer_queue.remove(item)
+        # The entry is skipped when it reaches the front of the queue
+        if item.status == 'queued' and id(item) in self._queued:
+            self._queued.discard(id(item))
+            item.status = 'cancelled'
             self._log(f"Cancelled queued transfer: {item.local_path.name}")
             self.queue_updated.emit()
     
@@ -206,7 +346,7 @@ class TransferController(QObject):
     def get_queue_status(self) -> dict:
         """Get current queue statistics"""
         return {
-            'queued': len(self.transfer_queue),
+            'queued': len(self._queued),
             'active': len(self.active_transfers),
             'completed': len(self.completed_transfers),
             'failed': len(self.failed_transfers)
@@ -2,22 +2,61 @@
 Enhanced drag-and-drop table widget for Fftp
 """
 
+import json
+import os
+from contextlib import contextmanager
 from pathlib import Path
 from typing import List, Callable
 from PyQt6.QtWidgets import QTableWidget, QApplication
-from PyQt6.QtCore import Qt, QMimeData, QUrl, QPoint
+from PyQt6.QtCore import Qt, QEvent, QMimeData, QUrl, QPoint
 from PyQt6.QtGui import QDragEnterEvent, QDropEvent, QDrag, QPixmap, QColor
 
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    # orjson not available, use the standard library encoder
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+    _loads = json.loads
+
+
+# URL schemes that denote remote files
+_REMOTE_SCHEMES = frozenset(('ftp', 'ftps', 'sftp'))
+
+# Mime type carrying serialised Fftp file info between our own tables
+_FFTP_MIME_TYPE = "application/x-fttp-file-data"
+
+# Translucent light blue used for the drag pixmap
+_DRAG_PIXMAP_COLOR = QColor(100, 149, 237, 128)
+
+
+def _lexists(path_str) -> bool:
+    """Check a local path with a single lstat() call"""
+    try:
+        os.lstat(path_str)
+    except (OSError, ValueError):
+        return False
+    return True
+
 
 class DragDropTableWidget(QTableWidget):
     """Enhanced table widget with comprehensive drag-and-drop support"""
 
+    # Drag pixmaps keyed by edge size, created on first use
+    _DRAG_PIXMAP_CACHE = {}
+
+    # QApplication.startDragDistance(), read on the first drag attempt
+    _start_drag_distance = None
+
     def __init__(self, parent=None, drop_callback=None, drag_callback=None, enabled=True):
         super().__init__(parent)
         self.drop_callback = drop_callback
         self.drag_callback = drag_callback
         self.drag_drop_enabled = enabled
         self.drag_start_position = None
+        self._pending_drop = None  # (mime data, [(url, local path)]) from dragEnterEvent
 
         if enabled:
             self.setAcceptDrops(True)
@@ -36,6 +75,21 @@ class DragDropTableWidget(QTableWidget):
             self.setAcceptDrops(False)
             self.setDragDropMode(QTableWidget.DragDropMode.NoDragDrop)
 
+    @contextmanager
+    def batch_updates(self):
+        """Suspend repaints while many rows are inserted; one repaint follows"""
+        self.setUpdatesEnabled(False)
+        try:
+            yield self
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def changeEvent(self, event):
+        """Re-read the drag distance when the style changes"""
+        if event.type() == QEvent.Type.StyleChange:
+            self._start_drag_distance = None
+        super().changeEvent(event)
+
     def mousePressEvent(self, event):
         """Handle mouse press for drag start"""
         if event.button() == Qt.MouseButton.LeftButton:
@@ -51,44 +105,23 @@ class DragDropTableWidget(QTableWidget):
             return
 
         # Check if we've moved enough to start a drag
+        if self._start_drag_distance is None:
+            self._start_drag_distance = QApplication.startDragDistance()
         distance = (event.pos() - self.drag_start_position).manhattanLength()
-        if distance < QApplication.startDragDistance():
+        if distance < self._start_drag_distance:
             return
 
-        # Get selected items
-        selected_rows = set()
-        for item in self.selectedItems():
-            if item.column() == 0:  # Only consider first column
-                selected_rows.add(item.row())
-
-        if not selected_rows:
-            return
-
-        # Collect file information for drag
+        # Collect file information for drag in one pass over the selection;
+        # each row contributes its first-column item exactly once
         drag_files = []
-        for row in selected_rows:
-            item = self.item(row, 0)
-            if item:
+        for item in self.selectedItems():
+            if item.column() == 0:
                 file_data = item.data(Qt.ItemDataRole.UserRole)
                 if file_data:
                     drag_files.append(file_data)
 
         if drag_files and self.drag_callback:
             self.startDrag(drag_files)
-        elif not drag_files:
-            # Try to get file paths from table data
-            drag_paths = []
-            for row in selected_rows:
-                item = self.item(row, 0)
-                if item:
-                    path_str = item.data(Qt.ItemDataRole.UserRole)
-                    if path_str and isinstance(path_str, str):
-                        path = Path(path_str)
-                        if path.exists():
-                            drag_paths.append(path)
-
-            if drag_paths:
-                self.startDrag(drag_paths)
 
     def startDrag(self, files):
         """Start a drag operation"""
@@ -107,8 +140,7 @@ class DragDropTableWidget(QTableWidget):
                 # Remote file
                 urls.append(QUrl(f"ftp://{file_item.path}"))
             elif isinstance(file_item, str):
-                path = Path(file_item)
-                if path.exists():
+                if _lexists(file_item):
                     urls.append(QUrl.fromLocalFile(file_item))
 
         if urls:
@@ -120,13 +152,21 @@ class DragDropTableWidget(QTableWidget):
 
         # Set drag pixmap (optional)
         if len(files) == 1:
-            pixmap = QPixmap(32, 32)
-            pixmap.fill(QColor(100, 149, 237, 128))  # Light blue with transparency
-            drag.setPixmap(pixmap)
+            drag.setPixmap(self._drag_pixmap(32))
 
         # Execute drag
         drag.exec(Qt.DropAction.CopyAction | Qt.DropAction.MoveAction)
 
+    @classmethod
+    def _drag_pixmap(cls, size: int) -> QPixmap:
+        """Return the shared drag pixmap of the given size"""
+        pixmap = cls._DRAG_PIXMAP_CACHE.get(size)
+        if pixmap is None:
+            pixmap = QPixmap(size, size)
+            pixmap.fill(_DRAG_PIXMAP_COLOR)
+            cls._DRAG_PIXMAP_CACHE[size] = pixmap
+        return pixmap
+
     def dragEnterEvent(self, event: QDragEnterEvent):
         """Handle drag enter event with enhanced validation"""
         if not self.drag_drop_enabled:
@@ -135,32 +175,28 @@ class DragDropTableWidget(QTableWidget):
 
         mime_data = event.mimeData()
 
-        # Accept URLs (files/folders)
+        # Accept URLs (files/folders); existence is only checked on drop.
+        # The decoded local paths are kept for dropEvent.
         if mime_data.hasUrls():
-            urls = mime_data.urls()
-            valid_files = 0
-
-            for url in urls:
-                file_path = url.toLocalFile()
-                if file_path:
-                    path = Path(file_path)
-                    if path.exists():
-                        valid_files += 1
-                elif url.scheme() in ['ftp', 'ftps', 'sftp']:
-                    # Remote URL
-                    valid_files += 1
-
-            if valid_files > 0:
-                event.acceptProposedAction()
-                return
+            pending = [(url, url.toLocalFile()) for url in mime_data.urls()]
+            self._pending_drop = (mime_data, pending)
+            for url, file_path in pending:
+                if file_path or url.scheme() in _REMOTE_SCHEMES:
+                    event.acceptProposedAction()
+                    return
 
         # Accept custom data (from our own tables)
-        if mime_data.hasFormat("application/x-fttp-file-data"):
+        if mime_data.hasFormat(_FFTP_MIME_TYPE):
             event.acceptProposedAction()
             return
 
         event.ignore()
 
+    def dragLeaveEvent(self, event):
+        """Forget the URLs decoded for a drag that left the widget"""
+        self._pending_drop = None
+        super().dragLeaveEvent(event)
+
     def dragMoveEvent(self, event):
         """Handle drag move event with visual feedback"""
         if not self.drag_drop_enabled:
@@ -169,7 +205,7 @@ class DragDropTableWidget(QTableWidget):
 
         mime_data = event.mimeData()
 
-        if mime_data.hasUrls() or mime_data.hasFormat("application/x-fttp-file-data"):
+        if mime_data.hasUrls() or mime_data.hasFormat(_FFTP_MIME_TYPE):
             event.acceptProposedAction()
 
             # Provide visual feedback by highlighting the drop target
@@ -184,19 +220,23 @@ class DragDropTableWidget(QTableWidget):
             return
 
         mime_data = event.mimeData()
+        pending_drop, self._pending_drop = self._pending_drop, None
 
         if mime_data.hasUrls() and self.drop_callback:
             files = []
             remote_files = []
 
-            for url in mime_data.urls():
-                file_path = url.toLocalFile()
+            if pending_drop is not None and pending_drop[0] is mime_data:
+                url_paths = pending_drop[1]
+            else:
+                url_paths = [(url, url.toLocalFile()) for url in mime_data.urls()]
+
+            for url, file_path in url_paths:
                 if file_path:
                     # Local file/folder
-                    path = Path(file_path)
-                    if path.exists():
-                        files.append(path)
-                elif url.scheme() in ['ftp', 'ftps', 'sftp']:
+                    if _lexists(file_path):
+                        files.append(Path(file_path))
+                elif url.scheme() in _REMOTE_SCHEMES:
                     # Remote URL - extract path
                     remote_path = url.path()
                     if remote_path:
@@ -215,9 +255,9 @@ class DragDropTableWidget(QTableWidget):
                 return
 
         # Handle custom Fftp data
-        elif mime_data.hasFormat("application/x-fttp-file-data") and self.drop_callback:
+        elif mime_data.hasFormat(_FFTP_MIME_TYPE) and self.drop_callback:
             # This would be used for dragging between our own tables
-            data = mime_data.data("application/x-fttp-file-data")
+            data = mime_data.data(_FFTP_MIME_TYPE)
             # Parse and handle custom data
             self.drop_callback(data, source="fttp")
             event.acceptProposedAction()
@@ -248,16 +288,19 @@ class DragDropTableWidget(QTableWidget):
                 urls.append(QUrl.fromLocalFile(str(file_obj)))
             elif isinstance(file_obj, str):
                 # String path
-                path = Path(file_obj)
-                if path.exists():
+                if _lexists(file_obj):
                     urls.append(QUrl.fromLocalFile(file_obj))
 
         if file_data:
             # Store custom Fftp data
-            import json
-            mime_data.setData("application/x-fttp-file-data", json.dumps(file_data).encode())
+            mime_data.setData(_FFTP_MIME_TYPE, _dumps(file_data))
 
         if urls:
             mime_data.setUrls(urls)
 
         return mime_data
+
+    @staticmethod
+    def decode_file_data(data) -> list:
+        """Decode an application/x-fttp-file-data payload into file info dicts"""
+        return _loads(bytes(data))
@@ -2,20 +2,71 @@
 Remote file editor for Fftp - allows viewing and editing remote text files
 """
 
-from pathlib import Path
+import io
+import os
 from typing import Optional
 from PyQt6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QTextEdit, QPushButton,
+    QDialog, QVBoxLayout, QHBoxLayout, QPlainTextEdit, QPushButton,
     QLabel, QMessageBox, QProgressBar, QFileDialog, QSplitter
 )
 from PyQt6.QtCore import Qt, QThread, pyqtSignal
 from PyQt6.QtGui import QFont, QTextCursor
 
+# Downloaded text is handed to the editor in slices of this many characters
+_LOAD_CHUNK_CHARS = 64 * 1024
+
+# Extensions that can be opened in the editor
+_TEXT_EXTENSIONS = frozenset({
+    '.txt', '.md', '.py', '.js', '.java', '.cpp', '.c', '.h', '.php',
+    '.html', '.css', '.xml', '.json', '.yaml', '.yml', '.ini', '.cfg',
+    '.conf', '.log', '.sh', '.bat', '.ps1', '.sql', '.csv'
+})
+
+# Editor style groups: code, plain text and markup/web files
+_CODE_EXTS = frozenset({'.py', '.js', '.java', '.cpp', '.c', '.h', '.php'})
+_TEXT_EXTS = frozenset({'.txt', '.md', '.log'})
+_MARKUP_EXTS = frozenset({'.xml', '.html', '.css', '.json'})
+
+_CODE_CSS = """
+    QPlainTextEdit {
+        background-color: #f8f8f8;
+        color: #2c3e50;
+        selection-background-color: #3498db;
+    }
+"""
+_TEXT_CSS = """
+    QPlainTextEdit {
+        background-color: #ffffff;
+        color: #2c3e50;
+        selection-background-color: #3498db;
+    }
+"""
+_MARKUP_CSS = """
+    QPlainTextEdit {
+        background-color: #f9f9f9;
+        color: #2c3e50;
+        selection-background-color: #3498db;
+    }
+"""
+
+# Extension -> editor style sheet
+_EXT_STYLE = {
+    ext: css
+    for exts, css in ((_CODE_EXTS, _CODE_CSS), (_TEXT_EXTS, _TEXT_CSS), (_MARKUP_EXTS, _MARKUP_CSS))
+    for ext in exts
+}
+
+
+def _file_extension(file_name: str) -> str:
+    """Lower-cased extension including the dot, as Path.suffix would give"""
+    return os.path.splitext(file_name)[1].lower()
+
 
 class FileDownloadWorker(QThread):
     """Worker thread for downloading files"""
-    finished = pyqtSignal(str, bool, str)  # content, success, error_message
+    finished = pyqtSignal(str, bool, str)  # content (empty, already sent as chunks), success, error_message
     progress = pyqtSignal(int)  # progress percentage
+    chunk_ready = pyqtSignal(str)  # next slice of the content, sent before finished
 
     def __init__(self, manager, remote_path: str):
         super().__init__()
@@ -24,40 +75,22 @@ class FileDownloadWorker(QThread):
 
     def run(self):
         try:
-            # Create a temporary local file
-            import tempfile
-            with tempfile.NamedTemporaryFile(mode='w+b', delete=False) as temp_file:
-                temp_path = temp_file.name
-
-            # Download the file
-            success, message = self.manager.download_file(self.remote_path, temp_path)
-
-            if success:
-                # Read the content
-                try:
-                    with open(temp_path, 'r', encoding='utf-8', errors='replace') as f:
-                        content = f.read()
-                    self.finished.emit(content, True, "")
-                except UnicodeDecodeError:
-                    # Try binary mode for non-text files
-                    try:
-                        with open(temp_path, 'rb') as f:
-                            content = f.read().decode('latin-1', errors='replace')
-                        self.finished.emit(content, True, "")
-                    except Exception as e:
-                        self.finished.emit("", False, f"Cannot display file as text: {e}")
-                finally:
-                    # Clean up temp file
-                    try:
-                        Path(temp_path).unlink()
-                    except:
-                        pass
-            else:
-                self.finished.emit("", False, message)
+            # Download straight into memory; the content only feeds the editor
+            buf = io.BytesIO()
+            self.manager.download_to_buffer(self.remote_path, buf)
 
+            # errors='replace' never raises, so undecodable bytes show as U+FFFD
+            content = buf.getvalue().decode('utf-8', errors='replace')
+            self._emit_content(content)
         except Exception as e:
             self.finished.emit("", False, str(e))
 
+    def _emit_content(self, content: str):
+        """Stream the content in slices so the editor can paint early"""
+        for start in range(0, len(content), _LOAD_CHUNK_CHARS):
+            self.chunk_ready.emit(content[start:start + _LOAD_CHUNK_CHARS])
+        self.finished.emit("", True, "")
+
 
 class FileUploadWorker(QThread):
     """Worker thread for uploading edited files"""
@@ -68,26 +101,16 @@ class FileUploadWorker(QThread):
         self.manager = manager
         self.remote_path = remote_path
         self.content = content
+        self.payload_size = 0  # bytes uploaded, known once encoded
 
     def run(self):
         try:
-            import tempfile
-
-            # Create a temporary local file with the content
-            with tempfile.NamedTemporaryFile(mode='w', encoding='utf-8', delete=False) as temp_file:
-                temp_file.write(self.content)
-                temp_path = temp_file.name
-
-            try:
-                # Upload the file
-                success, message = self.manager.upload_file(temp_path, self.remote_path)
-                self.finished.emit(success, message if not success else "")
-            finally:
-                # Clean up temp file
-                try:
-                    Path(temp_path).unlink()
-                except:
-                    pass
+            # Encode once on the worker thread and upload straight from
+            # memory; BytesIO shares the bytes object rather than copying it
+            payload = self.content.encode('utf-8')
+            self.payload_size = len(payload)
+            self.manager.upload_from_buffer(io.BytesIO(payload), self.remote_path)
+            self.finished.emit(True, "")
 
         except Exception as e:
             self.finished.emit(False, str(e))
@@ -101,6 +124,7 @@ class RemoteFileEditor(QDialog):
         self.manager = manager
         self.remote_path = remote_path
         self.file_name = file_name
+        self._ext = _file_extension(file_name)
         self.original_content = ""
         self.is_modified = False
 
@@ -129,10 +153,11 @@ class RemoteFileEditor(QDialog):
         layout.addLayout(info_layout)
 
         # Text editor
-        self.text_edit = QTextEdit()
+        self.text_edit = QPlainTextEdit()
         self.text_edit.setFont(QFont("Consolas", 10))
-        self.text_edit.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)
-        self.text_edit.textChanged.connect(self.on_text_changed)
+        self.text_edit.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        self.text_edit.textChanged.connect(self.update_stats)
+        self.text_edit.document().modificationChanged.connect(self.on_modification_changed)
         layout.addWidget(self.text_edit)
 
         # Progress bar for operations
@@ -169,35 +194,9 @@ class RemoteFileEditor(QDialog):
 
     def setup_syntax_highlighting(self):
         """Set up basic syntax highlighting based on file extension"""
-        ext = Path(self.file_name).suffix.lower()
-
-        if ext in ['.py', '.js', '.java', '.cpp', '.c', '.h', '.php']:
-            # Basic code highlighting
-            self.text_edit.setStyleSheet("""
-                QTextEdit {
-                    background-color: #f8f8f8;
-                    color: #2c3e50;
-                    selection-background-color: #3498db;
-                }
-            """)
-        elif ext in ['.txt', '.md', '.log']:
-            # Plain text
-            self.text_edit.setStyleSheet("""
-                QTextEdit {
-                    background-color: #ffffff;
-                    color: #2c3e50;
-                    selection-background-color: #3498db;
-                }
-            """)
-        elif ext in ['.xml', '.html', '.css', '.json']:
-            # Markup/Web files
-            self.text_edit.setStyleSheet("""
-                QTextEdit {
-                    background-color: #f9f9f9;
-                    color: #2c3e50;
-                    selection-background-color: #3498db;
-                }
-            """)
+        css = _EXT_STYLE.get(self._ext)
+        if css:
+            self.text_edit.setStyleSheet(css)
 
     def download_file(self):
         """Download the remote file"""
@@ -206,19 +205,32 @@ class RemoteFileEditor(QDialog):
         self.text_edit.setEnabled(False)
         self.save_btn.setEnabled(False)
 
+        # Chunks are appended as they arrive; loading is not an undo step
+        self.text_edit.clear()
+        self.text_edit.setUndoRedoEnabled(False)
+
         self.download_worker = FileDownloadWorker(self.manager, self.remote_path)
+        self.download_worker.chunk_ready.connect(self.on_download_chunk)
         self.download_worker.finished.connect(self.on_download_finished)
         self.download_worker.progress.connect(self.progress_bar.setValue)
         self.download_worker.start()
 
+    def on_download_chunk(self, chunk: str):
+        """Append the next slice of downloaded text"""
+        cursor = QTextCursor(self.text_edit.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertText(chunk)
+
     def on_download_finished(self, content: str, success: bool, error: str):
         """Handle download completion"""
         self.progress_bar.setVisible(False)
         self.text_edit.setEnabled(True)
+        self.text_edit.setUndoRedoEnabled(True)
 
         if success:
-            self.original_content = content
-            self.text_edit.setPlainText(content)
+            # The text itself already arrived through on_download_chunk
+            self.original_content = self.text_edit.toPlainText()
+            self.text_edit.document().setModified(False)
             self.is_modified = False
             self.update_stats()
             self.save_btn.setEnabled(False)
@@ -227,18 +239,16 @@ class RemoteFileEditor(QDialog):
                                f"Failed to download file:\n{error}")
             self.reject()
 
-    def on_text_changed(self):
-        """Handle text changes"""
-        self.is_modified = self.text_edit.toPlainText() != self.original_content
-        self.save_btn.setEnabled(self.is_modified)
-        self.update_stats()
+    def on_modification_changed(self, modified: bool):
+        """Track the document's dirty flag"""
+        self.is_modified = modified
+        self.save_btn.setEnabled(modified)
 
     def update_stats(self):
         """Update line and character count"""
-        text = self.text_edit.toPlainText()
-        lines = text.count('\n') + 1
-        chars = len(text)
-        self.stats_label.setText(f"Lines: {lines} | Characters: {chars}")
+        # Both counts are kept by the document, no need to copy the text out
+        doc = self.text_edit.document()
+        self.stats_label.setText(f"Lines: {doc.blockCount()} | Characters: {doc.characterCount() - 1}")
 
     def save_file(self):
         """Save the file back to the remote server"""
@@ -272,7 +282,8 @@ class RemoteFileEditor(QDialog):
         self.text_edit.setEnabled(True)
 
         if success:
-            self.original_content = self.text_edit.toPlainText()
+            self.original_content = self.upload_worker.content
+            self.text_edit.document().setModified(False)
             self.is_modified = False
             self.save_btn.setEnabled(False)
             QMessageBox.information(self, "Success", "File saved successfully!")
@@ -353,15 +364,9 @@ def edit_remote_file(manager, remote_path: str, file_name: str, parent=None) ->
         bool: True if file was opened for editing
     """
     # Check if it's a text file (by extension)
-    text_extensions = {
-        '.txt', '.md', '.py', '.js', '.java', '.cpp', '.c', '.h', '.php',
-        '.html', '.css', '.xml', '.json', '.yaml', '.yml', '.ini', '.cfg',
-        '.conf', '.log', '.sh', '.bat', '.ps1', '.sql', '.csv'
-    }
-
-    file_ext = Path(file_name).suffix.lower()
+    file_ext = _file_extension(file_name)
 
-    if file_ext in text_extensions or not file_ext:
+    if file_ext in _TEXT_EXTENSIONS or not file_ext:
         # Open in editor
         editor = RemoteFileEditor(manager, remote_path, file_name, parent)
         editor.exec()
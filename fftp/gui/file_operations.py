@@ -2,26 +2,486 @@
 File operations: upload, download, delete, create folder, rename
 """
 
+import posixpath
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache, partial
 from pathlib import Path
-from PyQt6.QtWidgets import QMessageBox, QInputDialog
+from PyQt6.QtWidgets import QCheckBox, QMessageBox, QInputDialog, QLineEdit
+from PyQt6.QtCore import QCoreApplication, QObject, QThread, QTimer, pyqtSignal
 from ..models import RemoteFile
 
+# Refresh requests arriving within this window (ms) collapse into one call
+_REFRESH_DELAY_MS = 150
+_pending_refreshes = set()
+
+
+def _schedule_refresh(refresh_callback):
+    """Run refresh_callback shortly, once per burst of requests (GUI thread only)"""
+    if refresh_callback in _pending_refreshes:
+        return
+    _pending_refreshes.add(refresh_callback)
+    QTimer.singleShot(_REFRESH_DELAY_MS, partial(_run_refresh, refresh_callback))
+
+
+def _run_refresh(refresh_callback):
+    _pending_refreshes.discard(refresh_callback)
+    refresh_callback()
+
+
+class TransferPool(QObject):
+    """Run uploads/downloads concurrently, one server connection per worker
+
+    FTP control channels and SFTP clients cannot be shared between
+    threads, so each worker lazily opens its own connection from the
+    source manager's config. Tasks wait in the executor's queue and are
+    picked up by whichever worker frees up first. Results are reported
+    through signals, which Qt delivers on the receiver's (GUI) thread.
+
+    all_finished is emitted once, after seal() has been called and every
+    submitted task has completed; the pool then shuts itself down. Without
+    a parent it is owned by the application until then.
+    """
+
+    transfer_finished = pyqtSignal(str, str, bool, str)  # direction, local path, success, error_message
+    transfer_skipped = pyqtSignal(str, str)  # local path, reason
+    all_finished = pyqtSignal()
+
+    def __init__(self, manager, max_workers: int = 4, parent=None):
+        super().__init__(parent if parent is not None else QCoreApplication.instance())
+        self.config = manager.config
+        self._manager_cls = type(manager)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._managers = []
+        self._pending = 0
+        self._sealed = False
+        self.all_finished.connect(self.shutdown)
+
+    def _worker_manager(self):
+        """Return this worker thread's own connected manager"""
+        manager = getattr(self._local, 'manager', None)
+        if manager is None:
+            manager = self._manager_cls(self.config)
+            success, message = manager.connect()
+            if not success:
+                raise Exception(message)
+            self._local.manager = manager
+            with self._lock:
+                self._managers.append(manager)
+        return manager
+
+    def submit_upload(self, local_path: Path, remote_path: str, resolve=None):
+        """Queue an upload
+
+        resolve(manager, local_path, remote_path), if given, runs on the
+        worker before the transfer and returns (remote_path, None) with the
+        path to upload to, or (None, reason) to skip the file.
+        """
+        self._submit(self._run_upload, local_path, remote_path, resolve)
+
+    def submit_download(self, remote_path: str, local_path: Path):
+        """Queue a download"""
+        self._submit(self._run_download, remote_path, str(local_path))
+
+    def _submit(self, func, *args):
+        with self._lock:
+            self._pending += 1
+        self._executor.submit(func, *args)
+
+    def seal(self):
+        """Mark the batch as complete; no tasks may be submitted afterwards"""
+        with self._lock:
+            self._sealed = True
+            done = self._pending == 0
+        if done:
+            self.all_finished.emit()
+
+    def _run_upload(self, local_path: Path, remote_path: str, resolve):
+        try:
+            manager = self._worker_manager()
+            if resolve is not None:
+                remote_path, reason = resolve(manager, local_path, remote_path)
+                if remote_path is None:
+                    self.transfer_skipped.emit(str(local_path), reason)
+                    self._task_done()
+                    return
+            manager.upload_file(str(local_path), remote_path)
+            self._finish("Upload", str(local_path), True, "")
+        except Exception as e:
+            self._finish("Upload", str(local_path), False, str(e))
+
+    def _run_download(self, remote_path: str, local_path: str):
+        try:
+            self._worker_manager().download_file(remote_path, local_path)
+            self._finish("Download", local_path, True, "")
+        except Exception as e:
+            self._finish("Download", local_path, False, str(e))
+
+    def _finish(self, direction: str, local_path: str, success: bool, error: str):
+        self.transfer_finished.emit(direction, local_path, success, error)
+        self._task_done()
+
+    def _task_done(self):
+        with self._lock:
+            self._pending -= 1
+            done = self._sealed and self._pending == 0
+        if done:
+            self.all_finished.emit()
+
+    def shutdown(self):
+        """Stop accepting work, close the worker connections and release the pool"""
+        self._executor.shutdown(wait=False)
+        with self._lock:
+            managers, self._managers = self._managers, []
+        for manager in managers:
+            try:
+                manager.disconnect()
+            except Exception:
+                pass
+        self.deleteLater()
+
+
+def _on_pool_transfer_finished(log_callback, status_callback, finished_callback,
+                               direction, local_path, success, error):
+    """Report one finished pooled transfer (runs on the GUI thread)"""
+    name = Path(local_path).name
+    verb = "uploaded" if direction == "Upload" else "downloaded"
+    if success:
+        if log_callback:
+            log_callback(f"File {verb} successfully: {name}", "success")
+        if status_callback:
+            status_callback(f"{direction}ed {name}")
+    else:
+        error_msg = f"{direction} error for {name}: {error}"
+        if log_callback:
+            log_callback(error_msg, "error")
+        if status_callback:
+            status_callback(error_msg)
+    if finished_callback:
+        finished_callback(local_path, "Completed" if success else "Failed", error)
+
+
+def _on_pool_transfer_skipped(log_callback, status_callback, finished_callback, local_path, reason):
+    """Report one pooled upload skipped by its overwrite mode (runs on the GUI thread)"""
+    name = Path(local_path).name
+    if log_callback:
+        log_callback(f"Skipped {name} - {reason}")
+    if status_callback:
+        status_callback(f"Skipped {name}")
+    if finished_callback:
+        finished_callback(local_path, "Skipped", reason)
+
+
+def _on_pool_finished(move_completed_callback, refresh_callback):
+    """Finish a pooled batch (runs on the GUI thread, after the pool shut down)"""
+    if move_completed_callback:
+        move_completed_callback()
+    if refresh_callback:
+        refresh_callback()
+
+
+def _start_pool(manager, max_workers, log_callback, status_callback,
+                move_completed_callback, refresh_callback, parent=None, finished_callback=None):
+    """Create a TransferPool wired to the usual callbacks"""
+    pool = TransferPool(manager, max_workers, parent)
+    pool.transfer_finished.connect(partial(_on_pool_transfer_finished, log_callback,
+                                           status_callback, finished_callback))
+    pool.transfer_skipped.connect(partial(_on_pool_transfer_skipped, log_callback,
+                                          status_callback, finished_callback))
+    pool.all_finished.connect(partial(_on_pool_finished, move_completed_callback, refresh_callback))
+    return pool
+
+
+class _GuiInvoker(QObject):
+    """Run a callable on the GUI thread on behalf of a worker thread"""
+
+    invoke_requested = pyqtSignal(object)
+
+    def __init__(self):
+        super().__init__()
+        self.invoke_requested.connect(self._invoke)
+
+    def _invoke(self, call):
+        func, args, result, done = call
+        try:
+            result.append(func(*args))
+        finally:
+            done.set()
+
+
+_gui_invoker = None
+_gui_call_lock = threading.Lock()
+
+
+def _call_on_gui_thread(func, *args):
+    """Call func(*args) on the GUI thread and return its result
+
+    upload_file() may run on a transfer thread, where dialogs cannot be
+    shown. In that case the call is queued to the GUI thread and the
+    worker waits until the user has answered. Workers take turns, so
+    concurrent uploads never open the shared dialog twice and each one
+    sees an "Apply to all" answer given to the one before it.
+    """
+    global _gui_invoker
+    app = QCoreApplication.instance()
+    if app is None or QThread.currentThread() is app.thread():
+        return func(*args)
+    result, done = [], threading.Event()
+    with _gui_call_lock:
+        if _gui_invoker is None:
+            invoker = _GuiInvoker()
+            invoker.moveToThread(app.thread())
+            _gui_invoker = invoker
+        _gui_invoker.invoke_requested.emit((func, args, result, done))
+        done.wait()
+    return result[0] if result else None
+
+
+class OverwriteBatch:
+    """Overwrite answers shared by the uploads of one multi-file operation
+
+    The caller creates one per operation (a selection upload, a drop) and
+    hands it to every upload_file() call in it. An "Apply to all" answer
+    is stored here, so it ends with the operation instead of carrying
+    over to unrelated uploads later.
+    """
+    __slots__ = ('choice',)
+
+    def __init__(self):
+        self.choice = None
+
+
+def _overwrite_dialog(parent_widget):
+    """Return the parent's overwrite dialog, building it on first use"""
+    msg_box = getattr(parent_widget, '_overwrite_dialog', None)
+    if msg_box is None:
+        msg_box = QMessageBox(parent_widget)
+        msg_box.setIcon(QMessageBox.Icon.Question)
+        msg_box.setWindowTitle("File Already Exists")
+
+        # Add buttons
+        msg_box.overwrite_btn = msg_box.addButton("Overwrite", QMessageBox.ButtonRole.AcceptRole)
+        msg_box.skip_btn = msg_box.addButton("Skip", QMessageBox.ButtonRole.RejectRole)
+        msg_box.rename_btn = msg_box.addButton("Rename", QMessageBox.ButtonRole.ActionRole)
+        msg_box.setDefaultButton(msg_box.overwrite_btn)
+        msg_box.setCheckBox(QCheckBox("Apply to all conflicting files"))
+        parent_widget._overwrite_dialog = msg_box
+    return msg_box
+
+
+def _ask_overwrite(parent_widget, file_name, local_size_str, remote_size_str, show_remote,
+                   batch=None):
+    """Ask whether to overwrite an existing remote file
+
+    The dialog is created once per parent widget and reused. "Apply to
+    all" is only offered when the upload is part of a batch; ticking it
+    stores an overwrite/skip answer on the batch for its remaining
+    conflicts.
+
+    Returns "overwrite", "skip" or "rename".
+    """
+    if batch is not None and batch.choice:
+        return batch.choice
+
+    msg_box = _overwrite_dialog(parent_widget)
+
+    msg_box.setText(f"The file '{file_name}' already exists on the remote server.")
+
+    # Add file details
+    details = f"Local file: {local_size_str}"
+    if show_remote:
+        details += f"\nRemote file: {remote_size_str}"
+
+    msg_box.setDetailedText(details)
+    msg_box.checkBox().setChecked(False)
+    msg_box.checkBox().setVisible(batch is not None)
+    msg_box.exec()
+
+    clicked_button = msg_box.clickedButton()
+    if clicked_button == msg_box.skip_btn:
+        choice = "skip"
+    elif clicked_button == msg_box.rename_btn:
+        # Each renamed file needs its own name, so this is never remembered
+        return "rename"
+    else:
+        choice = "overwrite"
+
+    if batch is not None and msg_box.checkBox().isChecked():
+        batch.choice = choice
+    return choice
+
+
+def _join_remote(base: str, name: str) -> str:
+    """Join a remote directory and an entry name
+
+    An empty or "." base yields the bare name; "/" yields "/name".
+    """
+    if not base or base == ".":
+        return name
+    return f"{base.rstrip('/')}/{name}"
+
+
+@lru_cache(maxsize=8)
+def _memoized_size_formatter(format_size_func):
+    """Return format_size_func wrapped in a size -> string cache
+
+    The wrapper itself is cached per formatter, so the memo carries over
+    between upload_file()/download_file() calls.
+    """
+    return lru_cache(maxsize=256)(format_size_func)
+
+
+def _remote_mtime(remote_file) -> float:
+    """Return a remote file's modification time as a timestamp
+
+    The parsed value is cached on the object so repeated comparisons
+    against the same listing entry do not parse the date again.
+    """
+    cached = getattr(remote_file, '_mtime_float', None)
+    if cached is not None:
+        return cached
+
+    # Convert remote timestamp to float for comparison
+    modified = remote_file.modified
+    if isinstance(modified, str):
+        # ISO-style date string such as "2024-01-01 12:00" or "2024-01-01 12:00:00"
+        remote_time = datetime.fromisoformat(modified).timestamp()
+    else:
+        remote_time = modified.timestamp() if hasattr(modified, 'timestamp') else float(modified)
+
+    remote_file._mtime_float = remote_time
+    return remote_time
+
+
+def _free_remote_name(manager, local_path: Path, remote_dir: str) -> str:
+    """Return the first "name (n).ext" not already used in remote_dir"""
+    # Only renaming needs the full listing
+    try:
+        taken = {f.name for f in manager.list_files(remote_dir)}
+    except Exception:
+        taken = set()
+    base_name = local_path.stem
+    extension = local_path.suffix
+    counter = 1
+    while True:
+        new_name = f"{base_name} ({counter}){extension}"
+        if new_name not in taken:
+            return new_name
+        counter += 1
+
+
+def _resolve_upload_target(manager, local_path: Path, remote_path: str, overwrite_mode="ask",
+                           overwrite_batch=None, parent_widget=None, format_size_func=None,
+                           local_stat=None):
+    """Apply overwrite_mode to an upload whose target may already exist
+
+    May run on a transfer thread; questions are asked on the GUI thread.
+
+    Returns (remote_path, None) with the path to upload to, or
+    (None, reason) when the file should be skipped.
+    """
+    if overwrite_mode == "overwrite":
+        return remote_path, None
+
+    try:
+        # Probe just this path rather than listing the whole directory
+        remote_file_info = manager.stat(remote_path)
+    except Exception:
+        # If we can't check, assume file doesn't exist
+        remote_file_info = None
+    if remote_file_info is None:
+        return remote_path, None
+
+    remote_dir = posixpath.dirname(remote_path) or "/"
+    if overwrite_mode == "skip":
+        return None, "file already exists"
+    if overwrite_mode == "rename":
+        return _join_remote(remote_dir, _free_remote_name(manager, local_path, remote_dir)), None
+
+    if local_stat is None:
+        try:
+            local_stat = local_path.stat()
+        except OSError:
+            return remote_path, None
+
+    # Compare files to determine if they're different
+    local_size = local_stat.st_size
+    size_different = local_size != remote_file_info.size
+
+    # Compare modification times (with some tolerance)
+    time_different = False
+    if getattr(remote_file_info, 'modified', None):
+        try:
+            time_diff = abs(local_stat.st_mtime - _remote_mtime(remote_file_info))
+            time_different = time_diff > 60  # 1 minute tolerance
+        except:
+            time_different = True  # If we can't compare times, assume different
+
+    if not size_different and not time_different:
+        # Files are identical, no need to upload
+        return None, "identical file already exists"
+    if not parent_widget:
+        # If no parent widget, default to overwrite
+        return remote_path, None
+
+    local_size_str = format_size_func(local_size) if format_size_func else f"{local_size} bytes"
+    remote_size_str = format_size_func(remote_file_info.size) if format_size_func else f"{remote_file_info.size} bytes"
+    show_remote = bool(getattr(remote_file_info, 'modified', None))
+
+    choice = _call_on_gui_thread(_ask_overwrite, parent_widget, local_path.name,
+                                 local_size_str, remote_size_str, show_remote,
+                                 overwrite_batch)
+    if choice == "skip":
+        return None, "user chose to skip"
+    if choice == "rename":
+        new_name = _free_remote_name(manager, local_path, remote_dir)
+        new_name, ok = _call_on_gui_thread(QInputDialog.getText, parent_widget, "Rename File",
+                                           "New name:", QLineEdit.EchoMode.Normal, new_name)
+        if not ok or not new_name:
+            return None, "rename cancelled"
+        return _join_remote(remote_dir, new_name), None
+    # Otherwise overwrite
+    return remote_path, None
+
 
 def upload_file(manager, local_path: Path, current_remote_path: str,
                 log_callback=None, status_callback=None,
                 queue_callback=None, move_completed_callback=None,
                 refresh_callback=None, format_size_func=None,
-                parent_widget=None, overwrite_mode="ask"):
+                parent_widget=None, overwrite_mode="ask", overwrite_batch=None,
+                finished_callback=None):
     """Upload a local file to remote server with overwrite checking
 
+    Passing a list of paths uploads them concurrently on a TransferPool,
+    applying overwrite_mode to each file on its worker, and returns True
+    once they are queued. Their queue_callback entries are added as
+    "Transferring" and each outcome is reported to finished_callback.
+
     Args:
         overwrite_mode: "ask", "overwrite", "skip", "rename"
+        overwrite_batch: OverwriteBatch shared by the other uploads of the
+            same operation, enabling "Apply to all"
+        finished_callback: For a list, called on the GUI thread as
+            finished_callback(local_path, status, message) with status
+            "Completed", "Skipped" or "Failed"
     """
     if not manager:
         if status_callback:
             status_callback("Not connected")
         return False
 
+    if format_size_func:
+        format_size_func = _memoized_size_formatter(format_size_func)
+
+    if isinstance(local_path, (list, tuple)):
+        return _upload_many(manager, local_path, current_remote_path,
+                            log_callback, status_callback, queue_callback,
+                            move_completed_callback, refresh_callback, format_size_func,
+                            parent_widget, overwrite_mode, overwrite_batch, finished_callback)
+
     try:
         if current_remote_path == "." or current_remote_path == "":
             try:
@@ -40,129 +500,27 @@ def upload_file(manager, local_path: Path, current_remote_path: str,
                     remote_path = f"/{remote_path}"
             else:
                 base_path = current_remote_path if current_remote_path.startswith('/') else f"/{current_remote_path}"
-                remote_path = f"{base_path.rstrip('/')}/{local_path.name}"
+                remote_path = _join_remote(base_path, local_path.name)
         else:
             base_path = current_remote_path if current_remote_path.startswith('/') else f"/{current_remote_path}"
-            remote_path = f"{base_path.rstrip('/')}/{local_path.name}"
-
-        # Check if remote file exists and handle overwrite
-        remote_file_exists = False
-        remote_file_info = None
+            remote_path = _join_remote(base_path, local_path.name)
 
         try:
-            # List current directory to check if file exists
-            files = manager.list_files(current_remote_path)
-            for file_info in files:
-                if file_info.name == local_path.name:
-                    remote_file_exists = True
-                    remote_file_info = file_info
-                    break
-        except Exception:
-            # If we can't list directory, assume file doesn't exist
-            pass
-
-        if remote_file_exists and remote_file_info:
-            # Compare files to determine if they're different
-            local_size = local_path.stat().st_size
-            local_mtime = local_path.stat().st_mtime
-
-            size_different = local_size != remote_file_info.size
-
-            # Compare modification times (with some tolerance)
-            time_different = False
-            if hasattr(remote_file_info, 'modified') and remote_file_info.modified:
-                try:
-                    # Convert remote timestamp to float for comparison
-                    if isinstance(remote_file_info.modified, str):
-                        # Parse the date string (assuming format like "2024-01-01 12:00:00")
-                        from datetime import datetime
-                        remote_time = datetime.strptime(remote_file_info.modified, "%Y-%m-%d %H:%M:%S").timestamp()
-                    else:
-                        remote_time = remote_file_info.modified.timestamp() if hasattr(remote_file_info.modified, 'timestamp') else float(remote_file_info.modified)
-
-                    time_diff = abs(local_mtime - remote_time)
-                    time_different = time_diff > 60  # 1 minute tolerance
-                except:
-                    time_different = True  # If we can't compare times, assume different
-
-            files_identical = not size_different and not time_different
-
-            if files_identical and overwrite_mode == "ask":
-                # Files are identical, no need to upload
-                if log_callback:
-                    log_callback(f"Skipping {local_path.name} - identical file already exists")
-                if status_callback:
-                    status_callback(f"Skipped {local_path.name} (identical)")
-                return True
-            elif remote_file_exists and overwrite_mode == "ask":
-                # Ask user what to do
-                if not parent_widget:
-                    # If no parent widget, default to overwrite
-                    pass
-                else:
-                    from PyQt6.QtWidgets import QMessageBox
-                    from PyQt6.QtCore import Qt
-
-                    # Create detailed overwrite dialog
-                    msg_box = QMessageBox(parent_widget)
-                    msg_box.setIcon(QMessageBox.Icon.Question)
-                    msg_box.setWindowTitle("File Already Exists")
-                    msg_box.setText(f"The file '{local_path.name}' already exists on the remote server.")
-
-                    # Add file details
-                    local_size_str = format_size_func(local_size) if format_size_func else f"{local_size} bytes"
-                    remote_size_str = format_size_func(remote_file_info.size) if format_size_func else f"{remote_file_info.size} bytes"
-
-                    details = f"Local file: {local_size_str}"
-                    if hasattr(remote_file_info, 'modified') and remote_file_info.modified:
-                        details += f"\nRemote file: {remote_size_str}"
-
-                    msg_box.setDetailedText(details)
-
-                    # Add buttons
-                    overwrite_btn = msg_box.addButton("Overwrite", QMessageBox.ButtonRole.AcceptRole)
-                    skip_btn = msg_box.addButton("Skip", QMessageBox.ButtonRole.RejectRole)
-                    rename_btn = msg_box.addButton("Rename", QMessageBox.ButtonRole.ActionRole)
-
-                    msg_box.setDefaultButton(overwrite_btn)
-                    msg_box.exec()
-
-                    clicked_button = msg_box.clickedButton()
-
-                    if clicked_button == skip_btn:
-                        if log_callback:
-                            log_callback(f"Skipped {local_path.name} - user chose to skip")
-                        if status_callback:
-                            status_callback(f"Skipped {local_path.name}")
-                        return True
-                    elif clicked_button == rename_btn:
-                        # Generate new name
-                        from PyQt6.QtWidgets import QInputDialog
-                        base_name = local_path.stem
-                        extension = local_path.suffix
-                        counter = 1
-                        while True:
-                            new_name = f"{base_name} ({counter}){extension}"
-                            # Check if this name exists
-                            name_exists = False
-                            for file_info in files:
-                                if file_info.name == new_name:
-                                    name_exists = True
-                                    break
-                            if not name_exists:
-                                break
-                            counter += 1
-
-                        new_name, ok = QInputDialog.getText(parent_widget, "Rename File",
-                                                          "New name:", text=new_name)
-                        if ok and new_name:
-                            remote_path = f"{current_remote_path.rstrip('/')}/{new_name}".lstrip("./")
-                        else:
-                            # User cancelled rename, skip
-                            return True
-                    # If overwrite_btn clicked, continue with upload
-
-        size_str = format_size_func(local_path.stat().st_size) if local_path.exists() and format_size_func else "Unknown"
+            local_stat = local_path.stat()
+        except OSError:
+            local_stat = None
+
+        remote_path, skip_reason = _resolve_upload_target(
+            manager, local_path, remote_path, overwrite_mode, overwrite_batch,
+            parent_widget, format_size_func, local_stat)
+        if remote_path is None:
+            if log_callback:
+                log_callback(f"Skipped {local_path.name} - {skip_reason}")
+            if status_callback:
+                status_callback(f"Skipped {local_path.name}")
+            return True
+
+        size_str = format_size_func(local_stat.st_size) if local_stat and format_size_func else "Unknown"
 
         if queue_callback:
             queue_callback("Upload", str(local_path), remote_path, size_str, "In Progress")
@@ -180,9 +538,7 @@ def upload_file(manager, local_path: Path, current_remote_path: str,
         if move_completed_callback:
             move_completed_callback()
         if refresh_callback:
-            import time
-            time.sleep(0.3)
-            refresh_callback()
+            _schedule_refresh(refresh_callback)
         return True
     except Exception as e:
         error_msg = f"Upload error for {local_path.name}: {str(e)}"
@@ -197,8 +553,23 @@ def download_file(manager, remote_file: RemoteFile, current_local_path: str,
                   log_callback=None, status_callback=None,
                   queue_callback=None, move_completed_callback=None,
                   refresh_callback=None, format_size_func=None):
-    """Download a remote file to local directory"""
-    if not manager or remote_file.is_dir:
+    """Download a remote file to local directory
+
+    Passing a list of remote files downloads them concurrently on a
+    TransferPool and returns True once they are queued.
+    """
+    if not manager:
+        return False
+
+    if format_size_func:
+        format_size_func = _memoized_size_formatter(format_size_func)
+
+    if isinstance(remote_file, (list, tuple)):
+        return _download_many(manager, remote_file, current_local_path,
+                              log_callback, status_callback, queue_callback,
+                              move_completed_callback, refresh_callback, format_size_func)
+
+    if remote_file.is_dir:
         return False
     
     try:
@@ -239,6 +610,67 @@ def download_file(manager, remote_file: RemoteFile, current_local_path: str,
         return False
 
 
+def _upload_many(manager, local_paths, current_remote_path, log_callback, status_callback,
+                 queue_callback, move_completed_callback, refresh_callback, format_size_func,
+                 parent_widget=None, overwrite_mode="ask", overwrite_batch=None,
+                 finished_callback=None, max_workers: int = 4):
+    """Queue several uploads on a TransferPool"""
+    if current_remote_path == "." or current_remote_path == "":
+        try:
+            current_remote_path = manager.get_current_directory() or "/"
+        except Exception:
+            current_remote_path = "/"
+    base_path = current_remote_path if current_remote_path.startswith('/') else f"/{current_remote_path}"
+
+    pool = _start_pool(manager, max_workers, log_callback, status_callback,
+                       move_completed_callback, refresh_callback, parent_widget, finished_callback)
+    resolve = partial(_resolve_upload_target, overwrite_mode=overwrite_mode,
+                      overwrite_batch=overwrite_batch, parent_widget=parent_widget,
+                      format_size_func=format_size_func)
+    for local_path in local_paths:
+        remote_path = _join_remote(base_path, local_path.name)
+        if queue_callback:
+            try:
+                size = local_path.stat().st_size
+            except OSError:
+                size = None
+            size_str = format_size_func(size) if size is not None and format_size_func else "Unknown"
+            # Not "Queued", which the transfer queue would start a second time
+            queue_callback("Upload", str(local_path), remote_path, size_str, "Transferring")
+        pool.submit_upload(local_path, remote_path, resolve)
+
+    if not local_paths:
+        pool.shutdown()
+        return True
+    if log_callback:
+        log_callback(f"Queued {len(local_paths)} files for upload to {base_path}")
+    pool.seal()
+    return True
+
+
+def _download_many(manager, remote_files, current_local_path, log_callback, status_callback,
+                   queue_callback, move_completed_callback, refresh_callback, format_size_func,
+                   max_workers: int = 4):
+    """Queue several downloads on a TransferPool"""
+    files = [f for f in remote_files if not f.is_dir]
+    pool = _start_pool(manager, max_workers, log_callback, status_callback,
+                       move_completed_callback, refresh_callback)
+    for remote_file in files:
+        local_path = Path(current_local_path) / remote_file.name
+        if queue_callback:
+            size_str = format_size_func(remote_file.size) if format_size_func else str(remote_file.size)
+            queue_callback("Download", str(local_path), remote_file.path, size_str, "Queued")
+        pool.submit_download(remote_file.path, local_path)
+
+    if not files:
+        pool.shutdown()
+        return True
+    if log_callback:
+        log_callback(f"Queued {len(files)} files for download to {current_local_path}")
+    pool.seal()
+    return True
+
+
 def delete_remote_file(manager, remote_file: RemoteFile, parent_widget=None,
                       log_callback=None, status_callback=None, refresh_callback=None):
     """Delete a remote file or folder"""
@@ -298,7 +730,7 @@ def create_remote_folder(manager, current_remote_path: str, parent_widget=None,
     try:
         # Ensure path starts with / and is absolute
         base_path = current_remote_path if current_remote_path.startswith('/') else f"/{current_remote_path}"
-        remote_path = f"{base_path.rstrip('/')}/{name}"
+        remote_path = _join_remote(base_path, name)
         if log_callback:
             log_callback(f"Creating remote folder: {name} at {remote_path}")
         
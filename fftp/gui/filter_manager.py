@@ -3,124 +3,443 @@ File filtering system for Fftp
 """
 
 import re
+import sys
+import time
 from typing import List, Dict, Any, Optional
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from operator import attrgetter
 from pathlib import Path
 
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    _loads = orjson.loads
+except ImportError:
+    # orjson not available, use the standard library encoder
+    import json
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+    _loads = json.loads
+
+# How long (seconds) a relative date condition's target date is reused
+_DATE_REFRESH_SECONDS = 60
+
+# Rough relative cost of evaluating a condition, used to run cheap ones first
+_MATCH_COSTS = {"begins": 1, "equals": 1, "contains": 2, "ends": 2, "regex": 10}
+_TYPE_COSTS = {"size": 1, "date": 3}
+
+# FileListing column and value test used by each filter type in batch mode
+_FIELD_COLUMNS = {"filename": ("names", "_matches_string"), "path": ("paths", "_matches_string"),
+                  "size": ("sizes", "_matches_size"), "date": ("modified", "_matches_date")}
+
+# Expression templates used when a filter set compiles its conditions inline
+_INLINE_TEXT_TESTS = {"contains": "{value} in {text}", "equals": "{text} == {value}",
+                      "begins": "{text}.startswith({value})", "ends": "{text}.endswith({value})"}
+_INLINE_SIZE_OPS = {"equals": "==", "greater": ">", "less": "<"}
+
+# Method names handling each filter type and string match type
+_FIELD_MATCHERS = {"filename": "_match_filename", "path": "_match_path",
+                   "size": "_match_size", "date": "_match_date"}
+_TEXT_TESTS = {"contains": "_text_contains", "equals": "_text_equals", "begins": "_text_begins",
+               "ends": "_text_ends", "regex": "_text_regex"}
+
+# Bumped by every edit to a condition or a filter set's condition list;
+# filter sets compare it with the count they compiled at to spot changes
+_edit_count = 0
+
+
+def _note_edit():
+    global _edit_count
+    _edit_count += 1
+
+
+class FileInfo:
+    """The attributes of a file or folder that filters look at
+
+    modified is preferably epoch seconds (e.g. st_mtime); a datetime is
+    also accepted. Treat instances as read-only: the lowercased name and
+    path are memoized so several case-insensitive filters lower them once.
+    """
+
+    __slots__ = ('name', 'path', 'size', 'modified', 'is_dir', '_name_lower', '_path_lower')
+
+    def __init__(self, name: str = "", path: str = "", size: int = 0,
+                 modified=None, is_dir: bool = False):
+        self.name = name
+        self.path = path
+        self.size = size
+        self.modified = modified
+        self.is_dir = is_dir
+        self._name_lower = None
+        self._path_lower = None
+
+    @property
+    def name_lower(self) -> str:
+        """Lowercased name, computed on first use"""
+        value = self._name_lower
+        if value is None:
+            value = self._name_lower = self.name.lower()
+        return value
+
+    @property
+    def path_lower(self) -> str:
+        """Lowercased path, computed on first use"""
+        value = self._path_lower
+        if value is None:
+            value = self._path_lower = self.path.lower()
+        return value
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'FileInfo':
+        """Create from a legacy file info dictionary"""
+        return cls(
+            name=data.get('name', ''),
+            path=data.get('path', ''),
+            size=data.get('size', 0),
+            modified=data.get('modified'),
+            is_dir=data.get('is_dir', False)
+        )
+
+
+class FileListing:
+    """A listing stored column-wise: one list per FileInfo attribute
+
+    Batch filtering walks a single column per condition, e.g. only the
+    sizes for a size condition, instead of one object per entry.
+    """
+
+    __slots__ = ('names', 'paths', 'sizes', 'modified', 'is_dirs')
+
+    def __init__(self, names: List[str], paths: List[str], sizes: List[int],
+                 modified: list, is_dirs: List[bool]):
+        self.names = names
+        self.paths = paths
+        self.sizes = sizes
+        self.modified = modified
+        self.is_dirs = is_dirs
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @classmethod
+    def from_file_infos(cls, file_infos: List[FileInfo]) -> 'FileListing':
+        """Create from a list of FileInfo objects"""
+        return cls(
+            names=[fi.name for fi in file_infos],
+            paths=[fi.path for fi in file_infos],
+            sizes=[fi.size for fi in file_infos],
+            modified=[fi.modified for fi in file_infos],
+            is_dirs=[fi.is_dir for fi in file_infos]
+        )
+
+
+_name_lower = attrgetter('name_lower')
+_path_lower = attrgetter('path_lower')
+
+
+def _as_file_info(file_info) -> FileInfo:
+    """Accept either a FileInfo or a legacy dictionary"""
+    return FileInfo.from_dict(file_info) if isinstance(file_info, dict) else file_info
+
+
+def _local_midnight(day: date) -> float:
+    """Epoch seconds at the start of day in local time"""
+    return datetime(day.year, day.month, day.day).timestamp()
+
+
+def _prepared_attribute(name: str) -> property:
+    """Attribute whose assignment refreshes the condition's precomputed state"""
+    private = f"_{name}"
+
+    def fget(self):
+        return getattr(self, private)
+
+    def fset(self, value):
+        setattr(self, private, value)
+        self._prepare()
+
+    return property(fget, fset)
+
 
 class FilterCondition:
     """Represents a single filter condition"""
 
+    __slots__ = ('_filter_type', '_match_type', '_value', '_case_sensitive', 'cost',
+                 '_value_lower', '_first_chars', '_target_size', '_date_parsed_at',
+                 '_target_epoch_lo', '_target_epoch_hi', '_date_is_range', '_compiled',
+                 '_match_fn', '_column', '_value_test', '_text_test', '_text_value',
+                 '_lower_text', '_version')
+
+    filter_type = _prepared_attribute("filter_type")
+    match_type = _prepared_attribute("match_type")
+    value = _prepared_attribute("value")
+    case_sensitive = _prepared_attribute("case_sensitive")
+
     def __init__(self, filter_type: str = "", match_type: str = "contains",
                  value: str = "", case_sensitive: bool = False):
-        self.filter_type = filter_type  # "filename", "path", "size", "date"
-        self.match_type = match_type    # "contains", "equals", "begins", "ends", "regex"
-        self.value = value
-        self.case_sensitive = case_sensitive
-
-    def matches(self, file_info: Dict[str, Any]) -> bool:
+        self._filter_type = filter_type  # "filename", "path", "size", "date"
+        self._match_type = match_type    # "contains", "equals", "begins", "ends", "regex"
+        self._value = value
+        self._case_sensitive = case_sensitive
+        self._version = 0
+        self._prepare()
+
+    def _prepare(self):
+        """Precompute per-condition state so matching does no repeated work
+
+        Bumps _version so filter sets holding this condition recompile.
+        """
+        self._version += 1
+        _note_edit()
+        if self._match_type == "regex":
+            self.cost = _MATCH_COSTS["regex"]
+        else:
+            self.cost = _TYPE_COSTS.get(self._filter_type) or _MATCH_COSTS.get(self._match_type, 1)
+        self._value_lower = sys.intern(self._value.lower())
+        self._first_chars = None
+        if self._match_type in ("begins", "equals") and self._value.isascii() and self._value:
+            # The text's first character must be one of these to match. When
+            # ignoring case this only holds for ASCII text: non-ASCII
+            # characters such as "İ" or the Kelvin sign lower to ASCII ones
+            first = self._value[0]
+            self._first_chars = {first} if self._case_sensitive else {first.lower(), first.upper()}
+        self._target_size = self._parse_size() if self._filter_type == "size" else None
+        if self._filter_type == "date":
+            self._parse_date()
+        self._compiled = None
+        if self._match_type == "regex":
+            try:
+                flags = 0 if self._case_sensitive else re.IGNORECASE
+                self._compiled = re.compile(self._value, flags)
+            except re.error:
+                pass  # An invalid pattern matches nothing
+
+        # Bind the matchers once so matches() does no string dispatch
+        self._match_fn = getattr(self, _FIELD_MATCHERS.get(self._filter_type, "_match_any"))
+        self._column, value_test = _FIELD_COLUMNS.get(self._filter_type, (None, "_match_any"))
+        self._value_test = getattr(self, value_test)
+        text_test = _TEXT_TESTS.get(self._match_type, "_text_never")
+        if self._match_type == "regex" and self._compiled is None:
+            text_test = "_text_never"
+        self._text_test = getattr(self, text_test)
+        self._text_value = self._value if self._case_sensitive else self._value_lower
+        self._lower_text = not self._case_sensitive and self._match_type != "regex"
+
+    def matches(self, file_info: FileInfo) -> bool:
         """Check if this condition matches the file info"""
-        if self.filter_type == "filename":
-            return self._matches_string(file_info.get('name', ''))
-        elif self.filter_type == "path":
-            return self._matches_string(file_info.get('path', ''))
-        elif self.filter_type == "size":
-            return self._matches_size(file_info.get('size', 0))
-        elif self.filter_type == "date":
-            return self._matches_date(file_info.get('modified'))
+        return self._match_fn(file_info)
+
+    def matches_dict(self, file_info: Dict[str, Any]) -> bool:
+        """Check a legacy file info dictionary"""
+        return self._match_fn(FileInfo.from_dict(file_info))
+
+    def select(self, listing: FileListing, indices) -> List[int]:
+        """Return the indices (from indices) of listing entries that match"""
+        if self._column is None:
+            return list(indices)
+        column = getattr(listing, self._column)
+
+        if self._column == "sizes":
+            # Compare the size column directly instead of calling per entry
+            target = self._target_size
+            if target is None:
+                return []
+            if self._match_type == "equals":
+                return [i for i in indices if column[i] == target]
+            elif self._match_type == "greater":
+                return [i for i in indices if column[i] > target]
+            elif self._match_type == "less":
+                return [i for i in indices if column[i] < target]
+            return []
+
+        test = self._value_test
+        return [i for i in indices if test(column[i])]
+
+    def _inline_expr(self, index: int, namespace: dict) -> Optional[str]:
+        """Python expression over "fi" equivalent to matches(fi), or None
+
+        Values the expression needs are added to namespace under names
+        suffixed with index. Date conditions return None because their
+        target moves with the clock.
+        """
+        filter_type, match_type = self._filter_type, self._match_type
+        if filter_type in _COMBINABLE_FIELDS:
+            raw = f"fi.{_COMBINABLE_FIELDS[filter_type][0]}"
+            if match_type == "regex":
+                if self._compiled is None:
+                    return "False"
+                namespace[f"s{index}"] = self._compiled.search
+                return f"{raw} and s{index}({raw}) is not None"
+            template = _INLINE_TEXT_TESTS.get(match_type)
+            if template is None:
+                return "False"
+            namespace[f"v{index}"] = self._text_value
+            text = raw if self._case_sensitive else f"{raw}_lower"
+            test = template.format(text=text, value=f"v{index}")
+            if self._first_chars is not None:
+                namespace[f"c{index}"] = frozenset(self._first_chars)
+                if self._case_sensitive:
+                    return f"{raw} and {raw}[0] in c{index} and {test}"
+                return f"{raw} and ({raw}[0] in c{index} or not {raw}.isascii()) and {test}"
+            return f"{raw} and {test}"
+        if filter_type == "size":
+            op = _INLINE_SIZE_OPS.get(match_type)
+            if op is None or self._target_size is None:
+                return "False"
+            namespace[f"t{index}"] = self._target_size
+            return f"fi.size {op} t{index}"
+        if filter_type == "date":
+            return None
+        return "True"
+
+    def _match_filename(self, file_info: FileInfo) -> bool:
+        return self._matches_string(file_info.name, file_info, _name_lower)
+
+    def _match_path(self, file_info: FileInfo) -> bool:
+        return self._matches_string(file_info.path, file_info, _path_lower)
+
+    def _match_size(self, file_info: FileInfo) -> bool:
+        return self._matches_size(file_info.size)
+
+    def _match_date(self, file_info: FileInfo) -> bool:
+        return self._matches_date(file_info.modified)
+
+    def _match_any(self, file_info: FileInfo) -> bool:
         return True
 
-    def _matches_string(self, text: str) -> bool:
-        """Match string patterns"""
+    def _matches_string(self, text: str, file_info: Optional[FileInfo] = None,
+                        lowered=None) -> bool:
+        """Match string patterns
+
+        lowered, if given, fetches the memoized lowercase text from file_info.
+        """
         if not text:
             return False
 
-        value = self.value if self.case_sensitive else self.value.lower()
-        text = text if self.case_sensitive else text.lower()
-
-        if self.match_type == "contains":
-            return value in text
-        elif self.match_type == "equals":
-            return value == text
-        elif self.match_type == "begins":
-            return text.startswith(value)
-        elif self.match_type == "ends":
-            return text.endswith(value)
-        elif self.match_type == "regex":
-            try:
-                flags = 0 if self.case_sensitive else re.IGNORECASE
-                return bool(re.search(value, text, flags))
-            except re.error:
-                return False
+        # Cheap rejection before lowercasing the whole text; non-ASCII text
+        # may lower to a different first character, so it goes to the full test
+        first_chars = self._first_chars
+        if (first_chars is not None and text[0] not in first_chars
+                and not (self._lower_text and not text.isascii())):
+            return False
+
+        if self._lower_text:
+            text = lowered(file_info) if lowered is not None else text.lower()
+        return self._text_test(text)
+
+    def _text_contains(self, text: str) -> bool:
+        return self._text_value in text
+
+    def _text_equals(self, text: str) -> bool:
+        return self._text_value == text
+
+    def _text_begins(self, text: str) -> bool:
+        return text.startswith(self._text_value)
+
+    def _text_ends(self, text: str) -> bool:
+        return text.endswith(self._text_value)
+
+    def _text_regex(self, text: str) -> bool:
+        return self._compiled.search(text) is not None
+
+    def _text_never(self, text: str) -> bool:
         return False
 
-    def _matches_size(self, file_size: int) -> bool:
-        """Match file size conditions"""
+    def _parse_size(self) -> Optional[int]:
+        """Parse the size value (e.g., "1MB", "500KB", "1024") into bytes"""
         try:
-            # Parse size value (e.g., "1MB", "500KB", "1024")
-            size_str = self.value.strip()
+            size_str = self._value.strip()
             if size_str.endswith('KB'):
-                target_size = int(size_str[:-2]) * 1024
+                return int(size_str[:-2]) * 1024
             elif size_str.endswith('MB'):
-                target_size = int(size_str[:-2]) * 1024 * 1024
+                return int(size_str[:-2]) * 1024 * 1024
             elif size_str.endswith('GB'):
-                target_size = int(size_str[:-2]) * 1024 * 1024 * 1024
-            else:
-                target_size = int(size_str)
-
-            if self.match_type == "equals":
-                return file_size == target_size
-            elif self.match_type == "greater":
-                return file_size > target_size
-            elif self.match_type == "less":
-                return file_size < target_size
+                return int(size_str[:-2]) * 1024 * 1024 * 1024
+            return int(size_str)
         except (ValueError, IndexError):
-            pass
-        return False
+            return None
 
-    def _matches_date(self, file_date: Optional[datetime]) -> bool:
-        """Match date conditions"""
-        if not file_date:
-            return False
+    def _parse_date(self):
+        """Work out the target day as epoch bounds relative to now
+
+        Sets _target_epoch_lo/_target_epoch_hi to the local midnights that
+        start and end the target day, or the "this week"/"last week" range
+        (flagged by _date_is_range). Both are None for an invalid value.
+        """
+        self._date_parsed_at = time.monotonic()
+        self._target_epoch_lo = self._target_epoch_hi = None
+        self._date_is_range = False
+        now = datetime.now()
+        value = self._value.lower()
 
         try:
-            # Parse date value
-            now = datetime.now()
-
-            if self.value.lower() == "today":
-                target_date = now.date()
-                file_date_only = file_date.date()
-            elif self.value.lower() == "yesterday":
-                target_date = (now - timedelta(days=1)).date()
-                file_date_only = file_date.date()
-            elif self.value.lower() == "this week":
-                # Monday of this week
-                target_date = now - timedelta(days=now.weekday())
-                target_date = target_date.date()
-                file_date_only = file_date.date()
-                return file_date_only >= target_date
-            elif self.value.lower() == "last week":
+            if value == "today":
+                start, days = now.date(), 1
+            elif value == "yesterday":
+                start, days = (now - timedelta(days=1)).date(), 1
+            elif value == "this week":
+                # Monday of this week, open-ended
+                start, days = (now - timedelta(days=now.weekday())).date(), None
+                self._date_is_range = True
+            elif value == "last week":
                 # Monday of last week
-                last_week = now - timedelta(days=now.weekday() + 7)
-                target_date = last_week.date()
-                next_week = target_date + timedelta(days=7)
-                file_date_only = file_date.date()
-                return target_date <= file_date_only < next_week
+                start, days = (now - timedelta(days=now.weekday() + 7)).date(), 7
+                self._date_is_range = True
             else:
                 # Try to parse as relative days
-                days = int(self.value)
-                target_date = (now - timedelta(days=days)).date()
-                file_date_only = file_date.date()
-
-            if self.match_type == "equals":
-                return file_date_only == target_date
-            elif self.match_type == "before":
-                return file_date_only < target_date
-            elif self.match_type == "after":
-                return file_date_only > target_date
-
-        except (ValueError, AttributeError):
-            pass
+                start, days = (now - timedelta(days=int(self._value))).date(), 1
+
+            self._target_epoch_lo = _local_midnight(start)
+            self._target_epoch_hi = (_local_midnight(start + timedelta(days=days))
+                                     if days is not None else float('inf'))
+        except (ValueError, OverflowError, OSError):
+            self._target_epoch_lo = self._target_epoch_hi = None
+
+    def _matches_size(self, file_size: int) -> bool:
+        """Match file size conditions"""
+        target_size = self._target_size
+        if target_size is None:
+            return False
+
+        if self.match_type == "equals":
+            return file_size == target_size
+        elif self.match_type == "greater":
+            return file_size > target_size
+        elif self.match_type == "less":
+            return file_size < target_size
+        return False
+
+    def _matches_date(self, file_date) -> bool:
+        """Match date conditions against epoch seconds (or a datetime)"""
+        if not file_date:
+            return False
+
+        # Relative dates ("today", "7") move with the clock
+        if time.monotonic() - self._date_parsed_at > _DATE_REFRESH_SECONDS:
+            self._parse_date()
+
+        lo = self._target_epoch_lo
+        if lo is None:
+            return False
+
+        if not isinstance(file_date, (int, float)):
+            try:
+                file_date = file_date.timestamp()
+            except (AttributeError, OverflowError, OSError, ValueError):
+                return False
+
+        if self._date_is_range:
+            return lo <= file_date < self._target_epoch_hi
+
+        if self.match_type == "equals":
+            return lo <= file_date < self._target_epoch_hi
+        elif self.match_type == "before":
+            return file_date < lo
+        elif self.match_type == "after":
+            return file_date >= self._target_epoch_hi
         return False
 
     def to_dict(self) -> Dict[str, Any]:
@@ -143,43 +462,236 @@ class FilterCondition:
         )
 
 
+def _match_everything(file_info: FileInfo) -> bool:
+    return True
+
+
+# Regex templates matching each plain string test, for combining OR'ed conditions
+_ALTERNATION_TEMPLATES = {"contains": "{}", "begins": r"\A{}", "ends": r"{}\Z", "equals": r"\A{}\Z"}
+_COMBINABLE_FIELDS = {"filename": ("name", _name_lower), "path": ("path", _path_lower)}
+
+
+def _combined_string_matcher(filter_type: str, case_sensitive: bool,
+                             conditions: List['FilterCondition']):
+    """Match several OR'ed string conditions on one field with one regex scan
+
+    Each condition becomes an escaped alternative anchored like its
+    match type. Case-insensitive groups search the lowercased text with
+    lowercased values, exactly as the individual tests do.
+    """
+    search = re.compile("|".join(
+        _ALTERNATION_TEMPLATES[c.match_type].format(re.escape(c._text_value))
+        for c in conditions)).search
+    attr, lowered = _COMBINABLE_FIELDS[filter_type]
+    get_text = attrgetter(attr) if case_sensitive else lowered
+
+    def matcher(file_info: FileInfo) -> bool:
+        text = get_text(file_info)
+        return bool(text) and search(text) is not None
+    return matcher
+
+
+def _or_matchers(conditions: List['FilterCondition']) -> list:
+    """Conditions of an OR set, merging string conditions that share a field
+
+    A group of two or more contains/begins/ends/equals conditions on the
+    same field and case mode becomes one combined matcher function,
+    placed where the group's cheapest member was.
+    """
+    groups = {}
+    for condition in conditions:
+        if (condition.filter_type in _COMBINABLE_FIELDS
+                and condition.match_type in _ALTERNATION_TEMPLATES):
+            key = (condition.filter_type, condition.case_sensitive)
+            groups.setdefault(key, []).append(condition)
+
+    parts = []
+    emitted = set()
+    for condition in conditions:
+        key = (condition.filter_type, condition.case_sensitive)
+        group = groups.get(key)
+        if group is None or len(group) < 2 or condition not in group:
+            parts.append(condition)
+        elif key not in emitted:
+            emitted.add(key)
+            parts.append(_combined_string_matcher(key[0], key[1], group))
+    return parts
+
+
+class _ConditionList(list):
+    """A filter set's condition list; in-place edits mark compiled sets stale"""
+
+    __slots__ = ()
+
+
+def _recording_edit(name: str):
+    method = getattr(list, name)
+
+    def wrapper(self, *args):
+        _note_edit()
+        return method(self, *args)
+    wrapper.__name__ = name
+    return wrapper
+
+
+for _name in ('append', 'extend', 'insert', 'pop', 'remove', 'clear', 'sort', 'reverse',
+              '__setitem__', '__delitem__', '__iadd__', '__imul__'):
+    setattr(_ConditionList, _name, _recording_edit(_name))
+del _name
+
+
+def _compile_matcher(parts: list, match_all: bool):
+    """Generate one specialized function evaluating a filter set's conditions
+
+    parts holds FilterConditions and ready-made matcher functions. Each
+    condition contributes an inlined expression (e.g. "fi.size > t1")
+    where it has one and a call to its bound matcher otherwise; values
+    and patterns are bound as default arguments. The expressions are
+    joined with "and"/"or" into straight-line code, so a filter set costs
+    one call per file.
+    """
+    if not parts:
+        return _match_everything
+
+    namespace = {}
+    exprs = []
+    for i, part in enumerate(parts):
+        expr = part._inline_expr(i, namespace) if isinstance(part, FilterCondition) else None
+        if expr is None:
+            namespace[f"fn{i}"] = part._match_fn if isinstance(part, FilterCondition) else part
+            expr = f"fn{i}(fi)"
+        exprs.append(f"({expr})")
+
+    joiner = " and " if match_all else " or "
+    params = "".join(f", {name}={name}" for name in namespace)
+    source = (f"def matcher(fi{params}):\n"
+              f"    return True if {joiner.join(exprs)} else False\n")
+    exec(source, namespace)
+    return namespace["matcher"]
+
+
 class FilterSet:
     """A set of filter conditions"""
 
+    __slots__ = ('name', '_conditions', '_match_all', 'apply_to_dirs', 'apply_to_files',
+                 '_sorted_conditions', '_matcher', '_compiled_at', '_compiled_state')
+
     def __init__(self, name: str = "", conditions: List[FilterCondition] = None,
                  match_all: bool = True, apply_to_dirs: bool = True,
                  apply_to_files: bool = True):
         self.name = name
-        self.conditions = conditions or []
-        self.match_all = match_all  # True = AND, False = OR
+        self._conditions = _ConditionList(conditions or [])
+        self._match_all = match_all  # True = AND, False = OR
         self.apply_to_dirs = apply_to_dirs
         self.apply_to_files = apply_to_files
-
-    def matches(self, file_info: Dict[str, Any]) -> bool:
+        self.refresh()
+
+    @property
+    def conditions(self) -> List[FilterCondition]:
+        return self._conditions
+
+    @conditions.setter
+    def conditions(self, conditions: List[FilterCondition]):
+        self._conditions = _ConditionList(conditions)
+        _note_edit()
+
+    @property
+    def match_all(self) -> bool:
+        return self._match_all
+
+    @match_all.setter
+    def match_all(self, match_all: bool):
+        self._match_all = match_all
+        _note_edit()
+
+    def _state(self) -> tuple:
+        """What the compiled matcher depends on"""
+        conditions = tuple(self._conditions)
+        return self._match_all, conditions, tuple(c._version for c in conditions)
+
+    def _ensure_current(self):
+        """Recompile if a condition, the condition list or match_all changed"""
+        if self._compiled_at != _edit_count:
+            if self._state() != self._compiled_state:
+                self.refresh()
+            else:
+                self._compiled_at = _edit_count
+
+    def refresh(self):
+        """Rebuild the matcher
+
+        Edits are picked up automatically on the next match; calling this
+        just compiles eagerly. Conditions are ordered cheapest first so
+        evaluation short-circuits early, then fused into one function.
+        """
+        self._compiled_at = _edit_count
+        self._compiled_state = self._state()
+        self._sorted_conditions = sorted(self._conditions, key=lambda c: c.cost)
+        if self._match_all:
+            parts = self._sorted_conditions
+        else:
+            parts = _or_matchers(self._sorted_conditions)
+        self._matcher = _compile_matcher(parts, self._match_all)
+
+    def matches(self, file_info: FileInfo) -> bool:
         """Check if this filter set matches the file"""
         # Check if filter applies to this file type
-        is_dir = file_info.get('is_dir', False)
+        is_dir = file_info.is_dir
         if is_dir and not self.apply_to_dirs:
             return True  # Don't filter directories if not enabled
         if not is_dir and not self.apply_to_files:
             return True  # Don't filter files if not enabled
 
-        if not self.conditions:
-            return True
-
-        if self.match_all:  # AND logic
-            return all(condition.matches(file_info) for condition in self.conditions)
-        else:  # OR logic
-            return any(condition.matches(file_info) for condition in self.conditions)
+        if self._compiled_at != _edit_count:
+            self._ensure_current()
+        return self._matcher(file_info)
+
+    def match_indices(self, listing: FileListing, indices) -> List[int]:
+        """Return the indices (from indices) of the listing entries this set matches
+
+        Evaluates one condition at a time across the whole batch, so each
+        condition only sees the entries still undecided by cheaper ones.
+        """
+        self._ensure_current()
+        conditions = self._sorted_conditions
+        is_dirs = listing.is_dirs
+        matched = []
+        pending = []
+        for i in indices:
+            is_dir = is_dirs[i]
+            if (not conditions or (is_dir and not self.apply_to_dirs)
+                    or (not is_dir and not self.apply_to_files)):
+                matched.append(i)
+            else:
+                pending.append(i)
+
+        if self._match_all:  # AND logic: keep entries passing every condition
+            for condition in conditions:
+                pending = condition.select(listing, pending)
+                if not pending:
+                    break
+            matched.extend(pending)
+        else:  # OR logic: accept entries as soon as any condition passes
+            for condition in conditions:
+                hits = condition.select(listing, pending)
+                if hits:
+                    matched.extend(hits)
+                    hit_set = set(hits)
+                    pending = [i for i in pending if i not in hit_set]
+                    if not pending:
+                        break
+        return matched
 
     def add_condition(self, condition: FilterCondition):
         """Add a condition to this filter set"""
         self.conditions.append(condition)
+        self.refresh()
 
     def remove_condition(self, index: int):
         """Remove a condition by index"""
         if 0 <= index < len(self.conditions):
             self.conditions.pop(index)
+            self.refresh()
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
@@ -209,46 +721,76 @@ class FilterManager:
     """Manages file filtering"""
 
     def __init__(self):
-        self.filter_sets: List[FilterSet] = []
-        self.active_filters: List[FilterSet] = []
+        # Both keep insertion order; active_filters is used as an ordered set
+        self.filter_sets: Dict[str, FilterSet] = {}
+        self.active_filters: Dict[FilterSet, None] = {}
         self.filters_enabled = True
 
     def add_filter_set(self, filter_set: FilterSet):
-        """Add a filter set"""
-        self.filter_sets.append(filter_set)
+        """Add a filter set, replacing any existing set with the same name"""
+        replaced = self.filter_sets.get(filter_set.name)
+        if replaced is not None:
+            self.active_filters.pop(replaced, None)
+        self.filter_sets[filter_set.name] = filter_set
 
     def remove_filter_set(self, name: str):
         """Remove a filter set by name"""
-        self.filter_sets = [fs for fs in self.filter_sets if fs.name != name]
+        self.filter_sets.pop(name, None)
 
     def get_filter_set(self, name: str) -> Optional[FilterSet]:
         """Get a filter set by name"""
-        for fs in self.filter_sets:
-            if fs.name == name:
-                return fs
-        return None
+        return self.filter_sets.get(name)
 
     def activate_filter(self, filter_set: FilterSet):
         """Activate a filter set"""
-        if filter_set not in self.active_filters:
-            self.active_filters.append(filter_set)
+        self.active_filters[filter_set] = None
 
     def deactivate_filter(self, filter_set: FilterSet):
         """Deactivate a filter set"""
-        if filter_set in self.active_filters:
-            self.active_filters.remove(filter_set)
+        self.active_filters.pop(filter_set, None)
 
     def clear_active_filters(self):
         """Clear all active filters"""
         self.active_filters.clear()
 
-    def is_filtered(self, file_info: Dict[str, Any]) -> bool:
-        """Check if a file should be filtered (hidden)"""
+    def is_filtered(self, file_info) -> bool:
+        """Check if a file (FileInfo or dictionary) should be filtered (hidden)"""
         if not self.filters_enabled or not self.active_filters:
             return False
 
+        file_info = _as_file_info(file_info)
+
         # File is filtered if ANY active filter matches it
-        return any(fs.matches(file_info) for fs in self.active_filters)
+        for fs in self.active_filters:
+            if fs.matches(file_info):
+                return True
+        return False
+
+    def filter_batch(self, file_infos: list) -> List[bool]:
+        """Check a list of FileInfo objects or dictionaries at once
+
+        Gives the same result as calling is_filtered() on each entry.
+        """
+        if not self.filters_enabled or not self.active_filters:
+            return [False] * len(file_infos)
+
+        return self.filter_listing(
+            FileListing.from_file_infos([_as_file_info(file_info) for file_info in file_infos]))
+
+    def filter_listing(self, listing: FileListing) -> List[bool]:
+        """Check a whole column-wise listing; True marks entries to hide"""
+        filtered = [False] * len(listing)
+        if not self.filters_enabled or not self.active_filters:
+            return filtered
+
+        remaining = range(len(listing))
+        for fs in self.active_filters:
+            for i in fs.match_indices(listing, remaining):
+                filtered[i] = True
+            remaining = [i for i in remaining if not filtered[i]]
+            if not remaining:
+                break
+        return filtered
 
     def toggle_filters(self):
         """Toggle filtering on/off"""
@@ -276,34 +818,44 @@ class FilterManager:
 
     def save_filters(self, filepath: str):
         """Save filter sets to file"""
-        import json
         data = {
-            'filter_sets': [fs.to_dict() for fs in self.filter_sets],
+            'filter_sets': [fs.to_dict() for fs in self.filter_sets.values()],
             'active_filters': [fs.name for fs in self.active_filters],
             'filters_enabled': self.filters_enabled
         }
         try:
-            with open(filepath, 'w') as f:
-                json.dump(data, f, indent=2)
+            with open(filepath, 'wb') as f:
+                f.write(_dumps(data))
         except Exception as e:
             print(f"Error saving filters: {e}")
 
-    def load_filters(self, filepath: str):
-        """Load filter sets from file"""
-        import json
+    def load_filters(self, filepath: str) -> bool:
+        """Load filter sets from file
+
+        Returns False if the file could not be read or parsed; the current
+        filters are then left as they are and the caller decides whether
+        to fall back to create_default_filters().
+        """
         try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
+            with open(filepath, 'rb') as f:
+                data = _loads(f.read())
+        except (OSError, ValueError) as e:
+            # ValueError covers malformed JSON from either decoder
+            print(f"Error loading filters: {e}")
+            return False
 
-            self.filter_sets = [FilterSet.from_dict(fs_data)
-                              for fs_data in data.get('filter_sets', [])]
+        self.filters_enabled = data.get('filters_enabled', True)
 
-            active_names = data.get('active_filters', [])
-            self.active_filters = [fs for fs in self.filter_sets if fs.name in active_names]
+        # Skip rebuilding (and recompiling) filters that are already loaded
+        sets_data = data.get('filter_sets', [])
+        active_names = data.get('active_filters', [])
+        if (sets_data == [fs.to_dict() for fs in self.filter_sets.values()]
+                and active_names == [fs.name for fs in self.active_filters]):
+            return True
 
-            self.filters_enabled = data.get('filters_enabled', True)
+        filter_sets = [FilterSet.from_dict(fs_data) for fs_data in sets_data]
+        self.filter_sets = {fs.name: fs for fs in filter_sets}
 
-        except (FileNotFoundError, json.JSONDecodeError, Exception) as e:
-            print(f"Error loading filters: {e}")
-            # Create default filters if loading fails
-            self.create_default_filters()
\ No newline at end of file
+        active_names = set(active_names)
+        self.active_filters = {fs: None for fs in self.filter_sets.values() if fs.name in active_names}
+        return True
@@ -2,17 +2,105 @@
 Help and About Dialog
 """
 
+from typing import Optional
 from PyQt6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QTabWidget, QWidget,
+    QApplication, QDialog, QVBoxLayout, QHBoxLayout, QTabWidget, QWidget,
     QLabel, QPushButton, QTextEdit, QScrollArea
 )
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QPixmap, QFont
+from PyQt6.QtGui import QPixmap, QFont, QTextDocument
 from pathlib import Path
 
+_HELP_HTML = """
+<h2>Getting Started</h2>
+<h3>Quick Connect</h3>
+<p>Use the toolbar to quickly connect to a server:</p>
+<ul>
+    <li>Enter the hostname or IP address</li>
+    <li>Enter your username and password</li>
+    <li>Set the port (22 for SFTP, 21 for FTP)</li>
+    <li>Click "Connect"</li>
+</ul>
+
+<h3>Site Manager</h3>
+<p>Save and manage multiple connections:</p>
+<ul>
+    <li>Click "Site Manager" in the toolbar</li>
+    <li>Click "New Site" to create a connection</li>
+    <li>Fill in connection details</li>
+    <li>Click "Save" to save (master password required)</li>
+    <li>Click "Connect" to connect to selected server</li>
+</ul>
+
+<h2>File Operations</h2>
+<h3>Upload Files</h3>
+<ul>
+    <li>Right-click a local file → "Upload"</li>
+    <li>Or drag and drop files to remote panel</li>
+</ul>
+
+<h3>Download Files</h3>
+<ul>
+    <li>Right-click a remote file → "Download"</li>
+    <li>Files are saved to current local directory</li>
+</ul>
+
+<h3>Delete Files</h3>
+<ul>
+    <li>Right-click a remote file → "Delete"</li>
+    <li>Confirm deletion in the dialog</li>
+</ul>
+
+<h3>Create Directory</h3>
+<ul>
+    <li>Right-click in remote panel → "Create Directory"</li>
+    <li>Enter directory name</li>
+</ul>
+
+<h2>Navigation</h2>
+<ul>
+    <li>Double-click folders to open them</li>
+    <li>Click "↑" button to go to parent directory</li>
+    <li>Type path in path bar and press Enter</li>
+</ul>
+
+<h2>Security</h2>
+<h3>Master Password</h3>
+<p>When saving connections, you'll be prompted for a master password:</p>
+<ul>
+    <li>First time: Create a master password (min 8 characters)</li>
+    <li>Subsequent saves: Enter your master password</li>
+    <li>All saved connections are encrypted</li>
+</ul>
+
+<h2>Keyboard Shortcuts</h2>
+<ul>
+    <li><b>F5</b> - Refresh file lists</li>
+    <li><b>Ctrl+O</b> - Open Site Manager</li>
+    <li><b>Ctrl+S</b> - Settings</li>
+    <li><b>F1</b> - Help</li>
+</ul>
+"""
+
+# Scaled logo pixmaps keyed by path (None if the file is missing)
+_logo_cache = {}
+
+
+def _logo_pixmap(logo_path: Path) -> Optional[QPixmap]:
+    """Load and scale the logo once per path"""
+    if logo_path not in _logo_cache:
+        pixmap = None
+        if logo_path.exists():
+            pixmap = QPixmap(str(logo_path)).scaled(
+                128, 128, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+        _logo_cache[logo_path] = pixmap
+    return _logo_cache[logo_path]
+
 
 class HelpDialog(QDialog):
     """Help and About dialog"""
+    _cached_doc: Optional[QTextDocument] = None
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Help - Fftp")
@@ -29,11 +117,9 @@ class HelpDialog(QDialog):
         about_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
         about_layout.setSpacing(20)
         
-        logo_path = Path(__file__).parent.parent / "logo.png"
-        if logo_path.exists():
+        scaled_pixmap = _logo_pixmap(Path(__file__).parent.parent / "logo.png")
+        if scaled_pixmap is not None:
             logo_label = QLabel()
-            pixmap = QPixmap(str(logo_path))
-            scaled_pixmap = pixmap.scaled(128, 128, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
             logo_label.setPixmap(scaled_pixmap)
             logo_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
             about_layout.addWidget(logo_label)
@@ -71,76 +157,11 @@ class HelpDialog(QDialog):
         
         help_text = QTextEdit()
         help_text.setReadOnly(True)
-        help_text.setHtml("""
-        <h2>Getting Started</h2>
-        <h3>Quick Connect</h3>
-        <p>Use the toolbar to quickly connect to a server:</p>
-        <ul>
-            <li>Enter the hostname or IP address</li>
-            <li>Enter your username and password</li>
-            <li>Set the port (22 for SFTP, 21 for FTP)</li>
-            <li>Click "Connect"</li>
-        </ul>
-        
-        <h3>Site Manager</h3>
-        <p>Save and manage multiple connections:</p>
-        <ul>
-            <li>Click "Site Manager" in the toolbar</li>
-            <li>Click "New Site" to create a connection</li>
-            <li>Fill in connection details</li>
-            <li>Click "Save" to save (master password required)</li>
-            <li>Click "Connect" to connect to selected server</li>
-        </ul>
-        
-        <h2>File Operations</h2>
-        <h3>Upload Files</h3>
-        <ul>
-            <li>Right-click a local file → "Upload"</li>
-            <li>Or drag and drop files to remote panel</li>
-        </ul>
-        
-        <h3>Download Files</h3>
-        <ul>
-            <li>Right-click a remote file → "Download"</li>
-            <li>Files are saved to current local directory</li>
-        </ul>
-        
-        <h3>Delete Files</h3>
-        <ul>
-            <li>Right-click a remote file → "Delete"</li>
-            <li>Confirm deletion in the dialog</li>
-        </ul>
-        
-        <h3>Create Directory</h3>
-        <ul>
-            <li>Right-click in remote panel → "Create Directory"</li>
-            <li>Enter directory name</li>
-        </ul>
-        
-        <h2>Navigation</h2>
-        <ul>
-            <li>Double-click folders to open them</li>
-            <li>Click "↑" button to go to parent directory</li>
-            <li>Type path in path bar and press Enter</li>
-        </ul>
-        
-        <h2>Security</h2>
-        <h3>Master Password</h3>
-        <p>When saving connections, you'll be prompted for a master password:</p>
-        <ul>
-            <li>First time: Create a master password (min 8 characters)</li>
-            <li>Subsequent saves: Enter your master password</li>
-            <li>All saved connections are encrypted</li>
-        </ul>
-        
-        <h2>Keyboard Shortcuts</h2>
-        <ul>
-            <li><b>F5</b> - Refresh file lists</li>
-            <li><b>Ctrl+O</b> - Open Site Manager</li>
-            <li><b>Ctrl+S</b> - Settings</li>
-            <li><b>F1</b> - Help</li>
-        </ul>
-        """)
+        if HelpDialog._cached_doc is None:
+            # Parse the help HTML once and share the document between dialogs
+            HelpDialog._cached_doc = QTextDocument(QApplication.instance())
+            HelpDialog._cached_doc.setHtml(_HELP_HTML)
+        help_text.setDocument(HelpDialog._cached_doc)
         help_layout.addWidget(help_text)
         
         tabs.addTab(help_tab, "Help")
@@ -1,38 +1,62 @@
 
+from PyQt6.QtWidgets import QApplication, QStyle
+
+# Map common names to StandardPixmap
+_ICON_PIXMAPS = {
+    "connect": QStyle.StandardPixmap.SP_DialogYesButton,
+    "disconnect": QStyle.StandardPixmap.SP_DialogNoButton,
+    "refresh": QStyle.StandardPixmap.SP_BrowserReload,
+    "folder": QStyle.StandardPixmap.SP_DirIcon,
+    "file": QStyle.StandardPixmap.SP_FileIcon,
+    "site_manager": QStyle.StandardPixmap.SP_DriveNetIcon,
+    "server": QStyle.StandardPixmap.SP_ComputerIcon,
+    "upload": QStyle.StandardPixmap.SP_ArrowUp,
+    "download": QStyle.StandardPixmap.SP_ArrowDown,
+    "delete": QStyle.StandardPixmap.SP_TrashIcon,
+    "settings": QStyle.StandardPixmap.SP_FileDialogDetailedView,
+    "cancel": QStyle.StandardPixmap.SP_DialogCancelButton,
+}
+
+
 class IconThemeManager:
     def __init__(self):
         self.themes = ["Default", "Flat", "High Contrast"]
+        self._icon_cache = {}  # (name, theme) -> QIcon
+        self._cache_style = None
 
     def get_available_themes(self):
         return self.themes
 
     def get_icon(self, name, theme="Default"):
         """Get standard QIcon for a given name"""
-        from PyQt6.QtWidgets import QApplication, QStyle
-        
         style = QApplication.style()
         if not style:
             return None
-            
-        # Map common names to StandardPixmap
-        mapping = {
-            "connect": QStyle.StandardPixmap.SP_DialogYesButton,
-            "disconnect": QStyle.StandardPixmap.SP_DialogNoButton,
-            "refresh": QStyle.StandardPixmap.SP_BrowserReload,
-            "folder": QStyle.StandardPixmap.SP_DirIcon,
-            "file": QStyle.StandardPixmap.SP_FileIcon,
-            "site_manager": QStyle.StandardPixmap.SP_DriveNetIcon,
-            "upload": QStyle.StandardPixmap.SP_ArrowUp,
-            "download": QStyle.StandardPixmap.SP_ArrowDown,
-            "delete": QStyle.StandardPixmap.SP_TrashIcon,
-            "settings": QStyle.StandardPixmap.SP_FileDialogDetailedView,
-            "cancel": QStyle.StandardPixmap.SP_DialogCancelButton,
-        }
-        
-        if name in mapping:
-            return style.standardIcon(mapping[name])
-            
-        return None
+
+        # Icons come from the style, so a style change invalidates them
+        if style is not self._cache_style:
+            self._icon_cache.clear()
+            self._cache_style = style
+
+        key = (name, theme)
+        icon = self._icon_cache.get(key)
+        if icon is None:
+            pixmap = _ICON_PIXMAPS.get(name)
+            if pixmap is None:
+                return None
+            icon = self._icon_cache[key] = style.standardIcon(pixmap)
+        return icon
+
+    def get_file_icon(self, kind, theme="Default"):
+        """Get the icon for a file kind ('folder', 'file'), created on first use"""
+        icon = self.get_icon(kind, theme)
+        if icon is None and kind != "file":
+            icon = self.get_icon("file", theme)
+        return icon
+
+    def get_ui_icon(self, name, theme="Default"):
+        """Get a UI icon by name, created on first use"""
+        return self.get_icon(name, theme)
 
 _instance = None
 
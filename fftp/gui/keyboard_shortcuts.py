@@ -4,7 +4,7 @@ Keyboard shortcuts system for Fftp
 
 from PyQt6.QtGui import QShortcut, QKeySequence
 from PyQt6.QtCore import Qt
-from typing import Dict, Callable
+from typing import Dict
 
 
 class KeyboardShortcutsManager:
@@ -13,237 +13,161 @@ class KeyboardShortcutsManager:
     def __init__(self, parent):
         self.parent = parent
         self.shortcuts: Dict[str, QShortcut] = {}
+        # The panels are built after the shortcuts, so these are looked up on first use
+        self._local_table = None
+        self._remote_tabs = None
         self.setup_shortcuts()
 
     def setup_shortcuts(self):
-        """Set up all keyboard shortcuts"""
+        """Set up all keyboard shortcuts
+
+        Targets are either the name of a parent method, resolved once here,
+        or a callable of our own. Shortcuts whose target the parent cannot
+        handle are not installed.
+        """
+        has_bookmarks = hasattr(self.parent, 'bookmark_manager')
         shortcuts_config = {
             # Connection shortcuts
-            "connect": ("Ctrl+Shift+C", "Connect to server", self._connect),
-            "disconnect": ("Ctrl+Shift+D", "Disconnect from server", self._disconnect),
+            "connect": ("Ctrl+Shift+C", "Connect to server", 'quick_connect'),
+            "disconnect": ("Ctrl+Shift+D", "Disconnect from server", 'disconnect'),
 
             # File operations
-            "upload": ("Ctrl+U", "Upload selected files", self._upload),
-            "download": ("Ctrl+D", "Download selected files", self._download),
-            "new_folder": ("Ctrl+Shift+N", "Create new folder", self._new_folder),
+            "upload": ("Ctrl+U", "Upload selected files", 'upload_selected_local'),
+            "download": ("Ctrl+D", "Download selected files", 'download_selected_remote'),
+            "new_folder": ("Ctrl+Shift+N", "Create new folder", 'create_local_folder'),
             "delete": ("Delete", "Delete selected items", self._delete),
             "rename": ("F2", "Rename selected item", self._rename),
 
             # Navigation
-            "refresh": ("F5", "Refresh file lists", self._refresh),
+            "refresh": ("F5", "Refresh file lists", 'refresh_files'),
             "parent_directory": ("Backspace", "Go to parent directory", self._parent_directory),
             "enter_directory": ("Return", "Enter selected directory", self._enter_directory),
 
             # Search and find
-            "search": ("Ctrl+F", "Search files", self._search),
-            "filter": ("Ctrl+Shift+F", "Toggle filters", self._toggle_filters),
+            "search": ("Ctrl+F", "Search files", 'show_search_dialog'),
+            "filter": ("Ctrl+Shift+F", "Toggle filters", 'toggle_filters'),
 
             # Bookmarks
-            "bookmarks": ("Ctrl+B", "Show bookmarks", self._show_bookmarks),
-            "add_bookmark": ("Ctrl+Shift+B", "Add current directory to bookmarks", self._add_bookmark),
+            "bookmarks": ("Ctrl+B", "Show bookmarks", self._show_bookmarks if has_bookmarks else None),
+            # This would open a quick add dialog or use current directory
+            # For now, just show the bookmarks dialog
+            "add_bookmark": ("Ctrl+Shift+B", "Add current directory to bookmarks",
+                             self._show_bookmarks if has_bookmarks else None),
 
             # View operations
-            "directory_comparison": ("Ctrl+Shift+M", "Toggle directory comparison", self._toggle_comparison),
-            "synchronized_browsing": ("Ctrl+Alt+S", "Toggle synchronized browsing", self._toggle_sync),
+            "directory_comparison": ("Ctrl+Shift+M", "Toggle directory comparison", 'toggle_directory_comparison'),
+            "synchronized_browsing": ("Ctrl+Alt+S", "Toggle synchronized browsing", 'toggle_synchronized_browsing'),
 
             # Application
-            "settings": ("Ctrl+,", "Open settings", self._settings),
-            "help": ("F1", "Show help", self._help),
-            "quit": ("Ctrl+Q", "Quit application", self._quit),
+            "settings": ("Ctrl+,", "Open settings", 'show_settings'),
+            "help": ("F1", "Show help", 'show_help'),
+            "quit": ("Ctrl+Q", "Quit application", 'close'),
 
             # Tab operations (for multiple connections)
-            "new_tab": ("Ctrl+T", "New connection tab", self._new_tab),
-            "close_tab": ("Ctrl+W", "Close current tab", self._close_tab),
+            "new_tab": ("Ctrl+T", "New connection tab", 'create_new_tab'),
+            "close_tab": ("Ctrl+W", "Close current tab",
+                          self._close_tab if hasattr(self.parent, 'close_connection_tab') else None),
             "next_tab": ("Ctrl+Tab", "Next tab", self._next_tab),
             "prev_tab": ("Ctrl+Shift+Tab", "Previous tab", self._prev_tab),
 
             # Transfer queue
-            "process_queue": ("Ctrl+P", "Process transfer queue", self._process_queue),
-            "cancel_all": ("Ctrl+Shift+X", "Cancel all transfers", self._cancel_all),
-            "pause_all": ("Ctrl+Shift+P", "Pause/resume all transfers", self._pause_resume_all),
+            "process_queue": ("Ctrl+P", "Process transfer queue", 'process_queue_manually'),
+            "cancel_all": ("Ctrl+Shift+X", "Cancel all transfers", 'cancel_all_transfers'),
+            "pause_all": ("Ctrl+Shift+P", "Pause/resume all transfers", 'pause_all_transfers'),
         }
 
-        for action_name, (key_sequence, description, callback) in shortcuts_config.items():
+        for action_name, (key_sequence, description, target) in shortcuts_config.items():
+            callback = getattr(self.parent, target, None) if isinstance(target, str) else target
+            if callback is None:
+                continue
             shortcut = QShortcut(QKeySequence(key_sequence), self.parent)
             shortcut.activated.connect(callback)
             shortcut.setWhatsThis(description)
             self.shortcuts[action_name] = shortcut
 
-    # Connection shortcuts
-    def _connect(self):
-        """Connect to server"""
-        if hasattr(self.parent, 'quick_connect'):
-            self.parent.quick_connect()
-
-    def _disconnect(self):
-        """Disconnect from server"""
-        if hasattr(self.parent, 'disconnect'):
-            self.parent.disconnect()
+    # Focus helpers
+    def _local_has_focus(self) -> bool:
+        """Whether the local file table has keyboard focus"""
+        table = self._local_table
+        if table is None:
+            table = self._local_table = getattr(self.parent, 'local_table', None)
+        return table is not None and table.hasFocus()
+
+    def _tabs(self):
+        """The parent's connection tab widget, or None before it exists"""
+        tabs = self._remote_tabs
+        if tabs is None:
+            tabs = self._remote_tabs = getattr(self.parent, 'remote_tabs', None)
+        return tabs
+
+    def _focused_remote_tab(self):
+        """The current connection tab if its remote table has focus"""
+        if self._tabs() is None:
+            return None
+        current_tab = self.parent.get_current_tab()
+        remote_table = getattr(current_tab, 'remote_table', None)
+        if remote_table is not None and remote_table.hasFocus():
+            return current_tab
+        return None
 
     # File operations
-    def _upload(self):
-        """Upload selected files"""
-        if hasattr(self.parent, 'upload_selected_local'):
-            self.parent.upload_selected_local()
-
-    def _download(self):
-        """Download selected files"""
-        if hasattr(self.parent, 'download_selected_remote'):
-            self.parent.download_selected_remote()
-
-    def _new_folder(self):
-        """Create new folder"""
-        if hasattr(self.parent, 'create_local_folder'):
-            self.parent.create_local_folder()
-
     def _delete(self):
         """Delete selected items"""
-        # Determine which table has focus
-        if hasattr(self.parent, 'local_table') and self.parent.local_table.hasFocus():
-            if hasattr(self.parent, 'delete_selected_local'):
-                self.parent.delete_selected_local()
-        elif hasattr(self.parent, 'remote_tabs'):
-            current_tab = self.parent.get_current_tab()
-            if current_tab and hasattr(current_tab, 'remote_table') and current_tab.remote_table.hasFocus():
-                if hasattr(self.parent, 'delete_selected_remote'):
-                    self.parent.delete_selected_remote()
+        if self._local_has_focus():
+            self.parent.delete_selected_local()
+        elif self._focused_remote_tab():
+            self.parent.delete_selected_remote()
 
     def _rename(self):
         """Rename selected item"""
-        # Determine which table has focus
-        if hasattr(self.parent, 'local_table') and self.parent.local_table.hasFocus():
-            if hasattr(self.parent, 'rename_selected_local'):
-                self.parent.rename_selected_local()
-        elif hasattr(self.parent, 'remote_tabs'):
-            current_tab = self.parent.get_current_tab()
-            if current_tab and hasattr(current_tab, 'remote_table') and current_tab.remote_table.hasFocus():
-                if hasattr(self.parent, 'rename_selected_remote'):
-                    self.parent.rename_selected_remote()
+        if self._local_has_focus():
+            self.parent.rename_selected_local()
+        elif self._focused_remote_tab():
+            self.parent.rename_selected_remote()
 
     # Navigation
-    def _refresh(self):
-        """Refresh file lists"""
-        if hasattr(self.parent, 'refresh_files'):
-            self.parent.refresh_files()
-
     def _parent_directory(self):
         """Go to parent directory"""
-        # Determine which side has focus
-        if hasattr(self.parent, 'local_table') and self.parent.local_table.hasFocus():
-            if hasattr(self.parent, 'local_up'):
-                self.parent.local_up()
-        elif hasattr(self.parent, 'remote_tabs'):
-            current_tab = self.parent.get_current_tab()
-            if current_tab and hasattr(current_tab, 'remote_table') and current_tab.remote_table.hasFocus():
-                if hasattr(current_tab, 'remote_up'):
-                    current_tab.remote_up()
+        if self._local_has_focus():
+            self.parent.local_up()
+        else:
+            current_tab = self._focused_remote_tab()
+            if current_tab and hasattr(current_tab, 'remote_up'):
+                current_tab.remote_up()
 
     def _enter_directory(self):
         """Enter selected directory"""
-        # Determine which table has focus
-        if hasattr(self.parent, 'local_table') and self.parent.local_table.hasFocus():
-            if hasattr(self.parent, 'enter_selected_local_directory'):
-                self.parent.enter_selected_local_directory()
-        elif hasattr(self.parent, 'remote_tabs'):
-            current_tab = self.parent.get_current_tab()
-            if current_tab and hasattr(current_tab, 'remote_table') and current_tab.remote_table.hasFocus():
-                if hasattr(self.parent, 'enter_selected_remote_directory'):
-                    self.parent.enter_selected_remote_directory()
-
-    # Search and find
-    def _search(self):
-        """Search files"""
-        if hasattr(self.parent, 'show_search_dialog'):
-            self.parent.show_search_dialog()
-
-    def _toggle_filters(self):
-        """Toggle filters"""
-        if hasattr(self.parent, 'toggle_filters'):
-            self.parent.toggle_filters()
+        if self._local_has_focus():
+            self.parent.enter_selected_local_directory()
+        elif self._focused_remote_tab():
+            self.parent.enter_selected_remote_directory()
 
     # Bookmarks
     def _show_bookmarks(self):
         """Show bookmarks dialog"""
         from .bookmarks import show_bookmark_dialog
-        if hasattr(self.parent, 'bookmark_manager'):
-            show_bookmark_dialog(self.parent.bookmark_manager, self.parent)
-
-    def _add_bookmark(self):
-        """Add current directory to bookmarks"""
-        if hasattr(self.parent, 'bookmark_manager'):
-            # This would open a quick add dialog or use current directory
-            # For now, just show the bookmarks dialog
-            self._show_bookmarks()
-
-    # View operations
-    def _toggle_comparison(self):
-        """Toggle directory comparison"""
-        if hasattr(self.parent, 'toggle_directory_comparison'):
-            self.parent.toggle_directory_comparison()
-
-    def _toggle_sync(self):
-        """Toggle synchronized browsing"""
-        if hasattr(self.parent, 'toggle_synchronized_browsing'):
-            self.parent.toggle_synchronized_browsing()
-
-    # Application
-    def _settings(self):
-        """Open settings"""
-        if hasattr(self.parent, 'show_settings'):
-            self.parent.show_settings()
-
-    def _help(self):
-        """Show help"""
-        if hasattr(self.parent, 'show_help'):
-            self.parent.show_help()
-
-    def _quit(self):
-        """Quit application"""
-        if hasattr(self.parent, 'close'):
-            self.parent.close()
+        show_bookmark_dialog(self.parent.bookmark_manager, self.parent)
 
     # Tab operations
-    def _new_tab(self):
-        """New connection tab"""
-        if hasattr(self.parent, 'create_new_tab'):
-            self.parent.create_new_tab()
-
     def _close_tab(self):
         """Close current tab"""
-        if hasattr(self.parent, 'close_connection_tab'):
-            current_index = self.parent.remote_tabs.currentIndex()
+        tabs = self._tabs()
+        if tabs is not None:
+            current_index = tabs.currentIndex()
             if current_index >= 0:
                 self.parent.close_connection_tab(current_index)
 
     def _next_tab(self):
         """Next tab"""
-        if hasattr(self.parent, 'remote_tabs'):
-            current_index = self.parent.remote_tabs.currentIndex()
-            next_index = (current_index + 1) % self.parent.remote_tabs.count()
-            self.parent.remote_tabs.setCurrentIndex(next_index)
+        tabs = self._tabs()
+        if tabs is not None:
+            tabs.setCurrentIndex((tabs.currentIndex() + 1) % tabs.count())
 
     def _prev_tab(self):
         """Previous tab"""
-        if hasattr(self.parent, 'remote_tabs'):
-            current_index = self.parent.remote_tabs.currentIndex()
-            prev_index = (current_index - 1) % self.parent.remote_tabs.count()
-            self.parent.remote_tabs.setCurrentIndex(prev_index)
-
-    # Transfer queue
-    def _process_queue(self):
-        """Process transfer queue"""
-        if hasattr(self.parent, 'process_queue_manually'):
-            self.parent.process_queue_manually()
-
-    def _cancel_all(self):
-        """Cancel all transfers"""
-        if hasattr(self.parent, 'cancel_all_transfers'):
-            self.parent.cancel_all_transfers()
-
-    def _pause_resume_all(self):
-        """Pause/resume all transfers"""
-        if hasattr(self.parent, 'pause_all_transfers'):
-            self.parent.pause_all_transfers()
+        tabs = self._tabs()
+        if tabs is not None:
+            tabs.setCurrentIndex((tabs.currentIndex() - 1) % tabs.count())
 
     def get_shortcuts_list(self) -> list:
         """Get list of all shortcuts for display"""
@@ -44,7 +44,7 @@ except ImportError:
             pass
 from .file_operations import (
     upload_file, download_file, delete_remote_file, create_remote_folder,
-    rename_remote_file, delete_local_file, open_local_file
+    rename_remote_file, delete_local_file, open_local_file, OverwriteBatch
 )
 from .connection_handler import connect_to_server, handle_connection_finished, disconnect as disconnect_handler
 from .context_menus import ContextMenuManager
@@ -921,8 +921,7 @@ class FTPClientGUI(QMainWindow):
             tab.connection_worker = worker
             self.connection_worker = worker
             self.config = tab.config
-            worker.status_update.connect(self.on_connection_status)
-            worker.log_message.connect(self.log)
+            worker.log_message.connect(self.on_connection_progress)
             worker.finished.connect(self.on_connection_finished)
             worker.start()
     
@@ -930,6 +929,11 @@ class FTPClientGUI(QMainWindow):
         """Update status bar with connection progress"""
         self.statusBar().showMessage(message)
     
+    def on_connection_progress(self, message, level):
+        """Log connection progress and mirror it in the status bar"""
+        self.log(message, level)
+        self.on_connection_status(message)
+    
     def on_connection_finished(self, success, msg):
         """Handle connection completion"""
         tab = self.get_current_tab()
@@ -1255,10 +1259,12 @@ class FTPClientGUI(QMainWindow):
         selected_items = tab.remote_table.selectedItems()
         self.context_menu_manager.create_remote_context_menu(tab.remote_table, position, selected_items)
     
-    def add_to_transfer_queue(self, direction, local_file, remote_file, size, status="Queued"):
+    def add_to_transfer_queue(self, direction, local_file, remote_file, size, status="Queued",
+                              overwrite_batch=None):
         """Add transfer to queue via QueuePanel"""
         if self.queue_panel:
-            self.queue_panel.add_to_transfer_queue(direction, local_file, remote_file, size, status)
+            self.queue_panel.add_to_transfer_queue(direction, local_file, remote_file, size, status,
+                                                   overwrite_batch)
 
     def process_next_transfer(self):
         """Process next pending transfer from the queue"""
@@ -1285,7 +1291,8 @@ class FTPClientGUI(QMainWindow):
                 table.item(row, 4).setText("Starting...")
                 
                 # Create and start transfer engine
-                engine = TransferEngine(direction, local_file, remote_file, row, self)
+                engine = TransferEngine(direction, local_file, remote_file, row, self,
+                                        self.queue_panel.overwrite_batch(row))
                 self.transfer_engines.append(engine)
                 engine.start()
                 return
@@ -1360,7 +1367,8 @@ class FTPClientGUI(QMainWindow):
                 QMessageBox.warning(self, "No Selection", "Please select a file to upload first")
                 return
 
-        for row in selected_rows:
+        paths = []
+        for row in sorted(selected_rows):
             item = self.local_panel.local_table.item(row, 0)
             if not item: continue
             
@@ -1369,18 +1377,61 @@ class FTPClientGUI(QMainWindow):
             
             path = Path(path_str)
             if path.is_file():
-                size = format_size(path.stat().st_size)
-                # Construct full remote path
-                remote_path = f"{tab.current_remote_path.rstrip('/')}/{path.name}"
-                if not remote_path.startswith('/'):
-                    remote_path = f"/{remote_path}"
-                
-                # Add to queue (Manager will pick it up)
-                self.add_to_transfer_queue("Upload", str(path), remote_path, size)
+                paths.append(path)
+        
+        # "Apply to all" answers cover this selection only
+        overwrite_batch = OverwriteBatch()
+        if len(paths) > 1:
+            # Several files go up concurrently, one connection per worker
+            upload_file(
+                tab.manager, paths, tab.current_remote_path,
+                log_callback=self.log,
+                status_callback=lambda msg: self.statusBar().showMessage(msg),
+                queue_callback=lambda d, l, r, s, st: self.add_to_transfer_queue(d, l, r, s, st),
+                refresh_callback=self.load_remote_files,
+                format_size_func=self.format_size,
+                parent_widget=self,
+                overwrite_mode=self.upload_overwrite_mode,
+                overwrite_batch=overwrite_batch,
+                finished_callback=self._on_pooled_upload_finished
+            )
+            return
+        
+        for path in paths:
+            size = format_size(path.stat().st_size)
+            # Construct full remote path
+            remote_path = f"{tab.current_remote_path.rstrip('/')}/{path.name}"
+            if not remote_path.startswith('/'):
+                remote_path = f"/{remote_path}"
+            
+            # Add to queue (Manager will pick it up)
+            self.add_to_transfer_queue("Upload", str(path), remote_path, size,
+                                       overwrite_batch=overwrite_batch)
         
         # Trigger processing
         self.process_next_transfer()
     
+    def _on_pooled_upload_finished(self, local_file, status, message):
+        """Update the queue row of an upload started by upload_selected_local()"""
+        if not hasattr(self, 'queue_panel') or not self.queue_panel.active_queue_table:
+            return
+        active_queue_table = self.queue_panel.active_queue_table
+        for row in range(active_queue_table.rowCount()):
+            if (active_queue_table.item(row, 0).text() == "Upload"
+                    and active_queue_table.item(row, 1).text() == local_file
+                    and active_queue_table.item(row, 4).text() == "Transferring"):
+                break
+        else:
+            return
+        
+        if status == "Completed":
+            active_queue_table.item(row, 4).setText("Completed")
+            self.move_to_completed(row)
+        elif status == "Skipped":
+            active_queue_table.removeRow(row)
+        else:
+            active_queue_table.item(row, 4).setText(f"Failed: {message}")
+    
     def download_selected_remote(self):
         """Download selected remote file"""
         tab = self.get_current_tab()
@@ -1507,10 +1558,12 @@ class FTPClientGUI(QMainWindow):
         if app:
             ThemeManager.apply_theme(app)
     
-    def add_to_transfer_queue(self, direction, local_file, remote_file, size, status=None):
+    def add_to_transfer_queue(self, direction, local_file, remote_file, size, status=None,
+                              overwrite_batch=None):
         """Add transfer to active queue (delegates to queue_panel)"""
         if hasattr(self, 'queue_panel'):
-            self.queue_panel.add_to_transfer_queue(direction, local_file, remote_file, size, status)
+            self.queue_panel.add_to_transfer_queue(direction, local_file, remote_file, size, status,
+                                                   overwrite_batch)
     
     def move_to_completed(self, row):
         """Move transfer from active to completed queue (delegates to queue_panel)"""
@@ -1554,7 +1607,8 @@ class FTPClientGUI(QMainWindow):
         active_queue_table.item(row, 4).setText("Transferring")
 
         # Create transfer engine
-        engine = TransferEngine(direction, local_file, remote_file, row, self)
+        engine = TransferEngine(direction, local_file, remote_file, row, self,
+                                self.queue_panel.overwrite_batch(row))
         self.transfer_engines.append(engine)
         engine.start()
 
@@ -2076,8 +2130,7 @@ class FTPClientGUI(QMainWindow):
     def _handle_fttp_drop_to_local(self, data):
         """Handle Fftp file data dropped onto local table"""
         try:
-            import json
-            file_data = json.loads(data.decode())
+            file_data = DragDropTableWidget.decode_file_data(data)
 
             # Convert to local file operations
             for file_info in file_data:
@@ -2106,6 +2159,8 @@ class FTPClientGUI(QMainWindow):
 
         uploaded_count = 0
         failed_count = 0
+        # "Apply to all" answers cover this drop only
+        overwrite_batch = OverwriteBatch()
 
         for path in files:
             try:
@@ -2117,7 +2172,7 @@ class FTPClientGUI(QMainWindow):
                     if not remote_path.startswith('/'):
                         remote_path = f"/{remote_path}"
 
-                    success = self._upload_single_file(path, remote_path, tab.manager)
+                    success = self._upload_single_file(path, remote_path, tab.manager, overwrite_batch)
                     if success:
                         uploaded_count += 1
                         self.log(f"Uploaded {path.name} to {remote_path}")
@@ -2127,7 +2182,8 @@ class FTPClientGUI(QMainWindow):
 
                 elif path.is_dir():
                     # Upload directory recursively
-                    success = self._upload_directory(path, tab.current_remote_path, tab.manager)
+                    success = self._upload_directory(path, tab.current_remote_path, tab.manager,
+                                                     overwrite_batch)
                     if success:
                         uploaded_count += 1
                         self.log(f"Uploaded directory {path.name}")
@@ -2188,8 +2244,7 @@ class FTPClientGUI(QMainWindow):
     def _handle_fttp_file_drop(self, data):
         """Handle files dragged between Fftp tables"""
         try:
-            import json
-            file_data = json.loads(data.decode())
+            file_data = DragDropTableWidget.decode_file_data(data)
 
             # Determine source and destination
             # This is a simplified implementation
@@ -2202,7 +2257,7 @@ class FTPClientGUI(QMainWindow):
         except Exception as e:
             self.log(f"Error handling Fftp file drop: {str(e)}", "error")
 
-    def _upload_single_file(self, local_path, remote_path, manager):
+    def _upload_single_file(self, local_path, remote_path, manager, overwrite_batch=None):
         """Upload a single file with proper error handling"""
         try:
             # Add to transfer queue instead of direct upload
@@ -2211,14 +2266,15 @@ class FTPClientGUI(QMainWindow):
                 str(local_path),
                 remote_path,
                 local_path.stat().st_size,
-                "Queued"
+                "Queued",
+                overwrite_batch
             )
             return True
         except Exception as e:
             self.log(f"Failed to queue upload for {local_path.name}: {str(e)}", "error")
             return False
 
-    def _upload_directory(self, local_dir, remote_base, manager):
+    def _upload_directory(self, local_dir, remote_base, manager, overwrite_batch=None):
         """Upload a directory recursively"""
         try:
             # Create remote directory first
@@ -2239,7 +2295,8 @@ class FTPClientGUI(QMainWindow):
                         str(item),
                         remote_path,
                         item.stat().st_size,
-                        "Queued"
+                        "Queued",
+                        overwrite_batch
                     )
 
             return True
@@ -1,5 +1,6 @@
 from PyQt6.QtWidgets import QToolBar, QLabel, QPushButton, QLineEdit, QWidget
 from PyQt6.QtCore import Qt
+from ..icon_themes import get_icon_theme_manager
 
 class ToolbarManager:
     """Manages the main window toolbar and quick connect bar"""
@@ -24,7 +25,6 @@ class ToolbarManager:
         self.parent.addToolBar(Qt.ToolBarArea.TopToolBarArea, self.toolbar)
 
         # Icon Manager
-        from ..icon_themes import get_icon_theme_manager
         icons = get_icon_theme_manager()
 
         # Site Manager
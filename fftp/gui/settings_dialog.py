@@ -9,6 +9,7 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt
 from pathlib import Path
+from .icon_themes import get_icon_theme_manager
 
 
 class SettingsDialog(QDialog):
@@ -212,7 +213,6 @@ class SettingsDialog(QDialog):
         table_layout.addRow(self.show_file_icons_check)
 
         self.icon_theme_combo = QComboBox()
-        from .icon_themes import get_icon_theme_manager
         icon_theme_manager = get_icon_theme_manager()
         self.icon_theme_combo.addItems(icon_theme_manager.get_available_themes())
         current_theme = self.settings.get('icon_theme', 'Default')
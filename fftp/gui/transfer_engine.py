@@ -16,13 +16,14 @@ class TransferEngine(QObject):
     transfer_completed = pyqtSignal(int, bool, str)  # row, success, message
     transfer_cancelled = pyqtSignal(int)  # row
 
-    def __init__(self, direction, local_file, remote_file, queue_row, parent):
+    def __init__(self, direction, local_file, remote_file, queue_row, parent, overwrite_batch=None):
         super().__init__()
         self.direction = direction  # "Upload" or "Download"
         self.local_file = local_file
         self.remote_file = remote_file
         self.queue_row = queue_row
         self.parent = parent
+        self.overwrite_batch = overwrite_batch
         self.cancelled = False
         self.paused = False
         self.thread = None
@@ -95,7 +96,8 @@ class TransferEngine(QObject):
                 refresh_callback=None,
                 format_size_func=self.parent.format_size if hasattr(self.parent, 'format_size') else None,
                 parent_widget=self.parent,
-                overwrite_mode=self.parent.upload_overwrite_mode if hasattr(self.parent, 'upload_overwrite_mode') else "ask"
+                overwrite_mode=self.parent.upload_overwrite_mode if hasattr(self.parent, 'upload_overwrite_mode') else "ask",
+                overwrite_batch=self.overwrite_batch
             )
 
             if self.cancelled:
@@ -11,6 +11,7 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QPixmap, QFont
+from .icon_themes import get_icon_theme_manager
 
 
 class WelcomeWizard(QWizard):
@@ -260,7 +261,6 @@ class ThemePage(QWizardPage):
         icon_layout.addWidget(icon_desc)
 
         self.icon_theme_combo = QComboBox()
-        from .icon_themes import get_icon_theme_manager
         icon_theme_manager = get_icon_theme_manager()
         self.icon_theme_combo.addItems(icon_theme_manager.get_available_themes())
         self.icon_theme_combo.setCurrentText("Default")
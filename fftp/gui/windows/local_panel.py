@@ -23,6 +23,7 @@ except ImportError:
     def format_size(size):
         return f"{size}"
 from ..drag_drop_table import DragDropTableWidget
+from ..filter_manager import FileListing
 
 
 class LocalFilePanel(QWidget):
@@ -189,6 +190,12 @@ class LocalFilePanel(QWidget):
             # Collect file data for comparison
             local_files_data = []
 
+            # Build the comparison hide predicate once per listing
+            if hasattr(self.parent, 'comparison_manager'):
+                hide = self.parent.comparison_manager.build_hide_predicate()
+            else:
+                hide = None
+
             if path.parent != path:
                 row = self.local_table.rowCount()
                 self.local_table.insertRow(row)
@@ -197,97 +204,119 @@ class LocalFilePanel(QWidget):
                 self.local_table.setItem(row, 2, QTableWidgetItem("Parent Directory"))
                 self.local_table.setItem(row, 3, QTableWidgetItem(""))
 
+            # Stat the listing up front so the filters can check it in one batch
+            dir_entries = []
+            file_entries = []
             for item in sorted(path.iterdir()):
                 if item.is_dir():
-                    # Create file info for filtering
-                    file_info = {
-                        'name': item.name,
-                        'path': str(path),
-                        'full_path': str(item),
-                        'size': 0,
-                        'modified': datetime.fromtimestamp(item.stat().st_mtime),
-                        'is_dir': True
-                    }
-
-                    # Check if filtered
-                    if hasattr(self.parent, 'filter_manager') and self.parent.filter_manager.is_filtered(file_info):
-                        continue
-
-                    # Check if should be hidden in comparison mode
-                    if hasattr(self.parent, 'comparison_manager') and self.parent.comparison_manager.comparator.should_hide_file(item.name):
-                        continue
-
-                    local_files_data.append(file_info)
-
-                    row = self.local_table.rowCount()
-                    self.local_table.insertRow(row)
-                    name_item = QTableWidgetItem(item.name)
-                    self.local_table.setItem(row, 0, name_item)
-                    size_item = QTableWidgetItem("")
-                    size_item.setData(Qt.ItemDataRole.UserRole, 0)
-                    self.local_table.setItem(row, 1, size_item)
-                    self.local_table.setItem(row, 2, QTableWidgetItem("Directory"))
-                    try:
-                        mtime = datetime.fromtimestamp(item.stat().st_mtime).strftime("%Y-%m-%d %H:%M")
-                    except:
-                        mtime = ""
-                    self.local_table.setItem(row, 3, QTableWidgetItem(mtime))
-                    self.local_table.item(row, 0).setData(Qt.ItemDataRole.UserRole, str(item))
-
-                    # Apply comparison highlighting
-                    if hasattr(self.parent, 'comparison_manager'):
-                        comparison_result = self.parent.comparison_manager.comparator.get_comparison_result(item.name, True)
-                        if comparison_result:
-                            color = self.parent.comparison_manager.get_comparison_color(comparison_result)
-                            if color:
-                                name_item.setBackground(QColor(color))
+                    dir_entries.append((item, item.stat()))
+                elif item.is_file():
+                    file_entries.append((item, item.stat()))
+
+            filtered = [False] * (len(dir_entries) + len(file_entries))
+            if hasattr(self.parent, 'filter_manager'):
+                entries = dir_entries + file_entries
+                filtered = self.parent.filter_manager.filter_listing(FileListing(
+                    names=[item.name for item, _ in entries],
+                    paths=[str(path)] * len(entries),
+                    sizes=[0] * len(dir_entries) + [st.st_size for _, st in file_entries],
+                    modified=[st.st_mtime for _, st in entries],
+                    is_dirs=[True] * len(dir_entries) + [False] * len(file_entries)
+                ))
+            dirs_filtered = filtered[:len(dir_entries)]
+            files_filtered = filtered[len(dir_entries):]
+
+            for (item, st), is_filtered in zip(dir_entries, dirs_filtered):
+                # Check if filtered
+                if is_filtered:
+                    continue
+
+                # Create file info for comparison
+                mtime_epoch = st.st_mtime
+                file_info = {
+                    'name': item.name,
+                    'path': str(path),
+                    'full_path': str(item),
+                    'size': 0,
+                    'modified': datetime.fromtimestamp(mtime_epoch),
+                    'is_dir': True
+                }
+
+                # Check if should be hidden in comparison mode
+                if hide is not None and hide(item.name):
+                    continue
+
+                local_files_data.append(file_info)
 
-            for item in sorted(path.iterdir()):
-                if item.is_file():
-                    # Create file info for filtering
-                    size = item.stat().st_size
-                    file_info = {
-                        'name': item.name,
-                        'path': str(path),
-                        'full_path': str(item),
-                        'size': size,
-                        'modified': datetime.fromtimestamp(item.stat().st_mtime),
-                        'is_dir': False
-                    }
-
-                    # Check if filtered
-                    if hasattr(self.parent, 'filter_manager') and self.parent.filter_manager.is_filtered(file_info):
-                        continue
-
-                    # Check if should be hidden in comparison mode
-                    if hasattr(self.parent, 'comparison_manager') and self.parent.comparison_manager.comparator.should_hide_file(item.name):
-                        continue
-
-                    local_files_data.append(file_info)
-
-                    row = self.local_table.rowCount()
-                    self.local_table.insertRow(row)
-                    name_item = QTableWidgetItem(item.name)
-                    self.local_table.setItem(row, 0, name_item)
-                    size_str = format_size(size)
-                    size_item = NumericTableWidgetItem(size_str)
-                    size_item.setData(Qt.ItemDataRole.UserRole, size)
-                    self.local_table.setItem(row, 1, size_item)
-                    self.local_table.setItem(row, 2, QTableWidgetItem(item.suffix.lstrip('.') or "File"))
-                    try:
-                        mtime = datetime.fromtimestamp(item.stat().st_mtime).strftime("%Y-%m-%d %H:%M")
-                    except:
-                        mtime = ""
-                    self.local_table.setItem(row, 3, QTableWidgetItem(mtime))
-                    self.local_table.item(row, 0).setData(Qt.ItemDataRole.UserRole, str(item))
-
-                    # Apply comparison highlighting
-                    if hasattr(self.parent, 'comparison_manager'):
-                        comparison_result = self.parent.comparison_manager.comparator.get_comparison_result(item.name, True)
-                        if comparison_result:
-                            color = self.parent.comparison_manager.get_comparison_color(comparison_result)
-                            if color:
-                                name_item.setBackground(QColor(color))
+                row = self.local_table.rowCount()
+                self.local_table.insertRow(row)
+                name_item = QTableWidgetItem(item.name)
+                self.local_table.setItem(row, 0, name_item)
+                size_item = QTableWidgetItem("")
+                size_item.setData(Qt.ItemDataRole.UserRole, 0)
+                self.local_table.setItem(row, 1, size_item)
+                self.local_table.setItem(row, 2, QTableWidgetItem("Directory"))
+                try:
+                    mtime = file_info['modified'].strftime("%Y-%m-%d %H:%M")
+                except:
+                    mtime = ""
+                self.local_table.setItem(row, 3, QTableWidgetItem(mtime))
+                self.local_table.item(row, 0).setData(Qt.ItemDataRole.UserRole, str(item))
+
+                # Apply comparison highlighting
+                if hasattr(self.parent, 'comparison_manager'):
+                    comparison_result = self.parent.comparison_manager.comparator.get_comparison_result(item.name, True)
+                    if comparison_result:
+                        color = self.parent.comparison_manager.get_comparison_color(comparison_result)
+                        if color:
+                            name_item.setBackground(QColor(color))
+
+            for (item, st), is_filtered in zip(file_entries, files_filtered):
+                # Check if filtered
+                if is_filtered:
+                    continue
+
+                # Create file info for comparison
+                size = st.st_size
+                mtime_epoch = st.st_mtime
+                file_info = {
+                    'name': item.name,
+                    'path': str(path),
+                    'full_path': str(item),
+                    'size': size,
+                    'modified': datetime.fromtimestamp(mtime_epoch),
+                    'is_dir': False
+                }
+
+                # Check if should be hidden in comparison mode
+                if hide is not None and hide(item.name):
+                    continue
+
+                local_files_data.append(file_info)
+
+                row = self.local_table.rowCount()
+                self.local_table.insertRow(row)
+                name_item = QTableWidgetItem(item.name)
+                self.local_table.setItem(row, 0, name_item)
+                size_str = format_size(size)
+                size_item = NumericTableWidgetItem(size_str)
+                size_item.setData(Qt.ItemDataRole.UserRole, size)
+                self.local_table.setItem(row, 1, size_item)
+                self.local_table.setItem(row, 2, QTableWidgetItem(item.suffix.lstrip('.') or "File"))
+                try:
+                    mtime = file_info['modified'].strftime("%Y-%m-%d %H:%M")
+                except:
+                    mtime = ""
+                self.local_table.setItem(row, 3, QTableWidgetItem(mtime))
+                self.local_table.item(row, 0).setData(Qt.ItemDataRole.UserRole, str(item))
+
+                # Apply comparison highlighting
+                if hasattr(self.parent, 'comparison_manager'):
+                    comparison_result = self.parent.comparison_manager.comparator.get_comparison_result(item.name, True)
+                    if comparison_result:
+                        color = self.parent.comparison_manager.get_comparison_color(comparison_result)
+                        if color:
+                            name_item.setBackground(QColor(color))
 
             # Update comparison manager with local file data
             if hasattr(self.parent, 'comparison_manager'):
@@ -92,14 +92,21 @@ class QueuePanel(QWidget):
 
         layout.addWidget(self.queue_tabs)
 
-    def add_to_transfer_queue(self, direction, local_file, remote_file, size, status):
-        """Add transfer to active queue"""
+    def add_to_transfer_queue(self, direction, local_file, remote_file, size, status, overwrite_batch=None):
+        """Add transfer to active queue
+
+        overwrite_batch is kept on the row until it leaves the active
+        queue, so the batch lives exactly as long as its transfers.
+        """
         if not self.active_queue_table:
             return
 
         row = self.active_queue_table.rowCount()
         self.active_queue_table.insertRow(row)
-        self.active_queue_table.setItem(row, 0, QTableWidgetItem(direction))
+        direction_item = QTableWidgetItem(direction)
+        if overwrite_batch is not None:
+            direction_item.setData(Qt.ItemDataRole.UserRole, overwrite_batch)
+        self.active_queue_table.setItem(row, 0, direction_item)
         self.active_queue_table.setItem(row, 1, QTableWidgetItem(local_file))
         self.active_queue_table.setItem(row, 2, QTableWidgetItem(remote_file))
         self.active_queue_table.setItem(row, 3, QTableWidgetItem(size))
@@ -125,6 +132,11 @@ class QueuePanel(QWidget):
         self.failed_queue_table.setItem(row, 3, QTableWidgetItem(size))
         self.failed_queue_table.setItem(row, 4, QTableWidgetItem(error_msg))
 
+    def overwrite_batch(self, row):
+        """Return the OverwriteBatch of an active queue row, if any"""
+        item = self.active_queue_table.item(row, 0) if self.active_queue_table else None
+        return item.data(Qt.ItemDataRole.UserRole) if item else None
+
     def move_to_completed(self, row):
         """Move transfer from active to completed queue"""
         if not self.active_queue_table or not self.completed_queue_table:
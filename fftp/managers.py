@@ -2,8 +2,8 @@
 FTP and SFTP connection managers
 """
 
-from typing import List
-from datetime import datetime
+from typing import List, Optional
+from datetime import datetime, timezone
 from pathlib import Path
 import paramiko
 import ftplib
@@ -182,10 +182,32 @@ class SFTPManager:
         except Exception as e:
             raise Exception(f"List error: {str(e)}")
     
+    def stat(self, remote_path: str) -> Optional[RemoteFile]:
+        """Look up a single remote entry, or None if it does not exist"""
+        try:
+            attrs = self.sftp.stat(remote_path)
+        except IOError:
+            return None
+        is_dir = paramiko.stat.S_ISDIR(attrs.st_mode)
+        return RemoteFile(
+            name=remote_path.rstrip('/').rsplit('/', 1)[-1],
+            path=remote_path,
+            is_dir=is_dir,
+            size=attrs.st_size if not is_dir else 0,
+            modified=datetime.fromtimestamp(attrs.st_mtime).strftime("%Y-%m-%d %H:%M") if attrs.st_mtime is not None else ""
+        )
+    
     def download_file(self, remote_path: str, local_path: str):
         """Download file from remote"""
         self.sftp.get(remote_path, local_path)
     
+    def download_to_buffer(self, remote_path: str, buf):
+        """Download file from remote into a writable file-like object"""
+        try:
+            self.sftp.getfo(remote_path, buf)
+        except Exception as e:
+            raise Exception(f"Download failed: {str(e)}")
+    
     def upload_file(self, local_path: str, remote_path: str):
         """Upload file to remote"""
         try:
@@ -205,6 +227,13 @@ class SFTPManager:
         except Exception as e:
             raise Exception(f"Upload failed: {str(e)}")
     
+    def upload_from_buffer(self, buf, remote_path: str):
+        """Upload the contents of a readable file-like object to remote"""
+        try:
+            self.sftp.putfo(buf, remote_path)
+        except Exception as e:
+            raise Exception(f"Upload failed: {str(e)}")
+    
     def delete_file(self, remote_path: str):
         """Delete remote file"""
         self.sftp.remove(remote_path)
@@ -400,6 +429,31 @@ class FTPManager:
         except Exception:
             pass
     
+    def stat(self, remote_path: str) -> Optional[RemoteFile]:
+        """Look up a single remote file via SIZE/MDTM, or None if it does not exist"""
+        try:
+            self.ftp.voidcmd('TYPE I')  # SIZE is only reliable in binary mode
+            size = self.ftp.size(remote_path)
+        except ftplib.error_perm:
+            return None
+        
+        modified = ""
+        try:
+            response = self.ftp.sendcmd(f'MDTM {remote_path}')
+            # MDTM replies in UTC (RFC 3659); show local time like the SFTP listing
+            mdtm = datetime.strptime(response.split()[-1][:14], "%Y%m%d%H%M%S")
+            modified = mdtm.replace(tzinfo=timezone.utc).astimezone().strftime("%Y-%m-%d %H:%M:%S")
+        except (ftplib.error_perm, ValueError, OverflowError, OSError):
+            pass
+        
+        return RemoteFile(
+            name=remote_path.rstrip('/').rsplit('/', 1)[-1],
+            path=remote_path,
+            is_dir=False,
+            size=size or 0,
+            modified=modified
+        )
+    
     def download_file(self, remote_path: str, local_path: str):
         """Download file"""
         try:
@@ -409,6 +463,13 @@ class FTPManager:
         except Exception as e:
             raise Exception(f"Download failed: {str(e)}")
     
+    def download_to_buffer(self, remote_path: str, buf):
+        """Download file into a writable file-like object"""
+        try:
+            self.ftp.retrbinary(f'RETR {remote_path}', buf.write, blocksize=1 << 16)
+        except Exception as e:
+            raise Exception(f"Download failed: {str(e)}")
+    
     def upload_file(self, local_path: str, remote_path: str):
         """Upload file"""
         try:
@@ -426,6 +487,13 @@ class FTPManager:
         except Exception as e:
             raise Exception(f"Upload failed: {str(e)}")
     
+    def upload_from_buffer(self, buf, remote_path: str):
+        """Upload the contents of a readable file-like object"""
+        try:
+            self.ftp.storbinary(f'STOR {remote_path}', buf, 1 << 16)
+        except Exception as e:
+            raise Exception(f"Upload failed: {str(e)}")
+    
     def delete_file(self, remote_path: str):
         """Delete file"""
         self.ftp.delete(remote_path)
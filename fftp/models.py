@@ -3,6 +3,8 @@ Data models for FTP/SFTP client
 """
 
 from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
 
 
 @dataclass
@@ -29,3 +31,19 @@ class RemoteFile:
     is_dir: bool
     size: int
     modified: str
+
+
+@dataclass
+class LocalFile:
+    """Represent local file/folder with the stat data read while listing"""
+    name: str
+    path: str
+    is_dir: bool
+    is_file: bool
+    size: int
+    mtime: float
+
+    @cached_property
+    def path_obj(self) -> Path:
+        """Path for this entry, built on first use"""
+        return Path(self.path)
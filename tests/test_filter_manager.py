@@ -0,0 +1,55 @@
+"""
+Tests for the file filtering system
+"""
+
+import importlib.util
+from pathlib import Path
+
+# filter_manager has no Qt imports; load it directly so the tests do not
+# need PyQt6 (importing fftp.gui pulls in the main window)
+_spec = importlib.util.spec_from_file_location(
+    "filter_manager", Path(__file__).resolve().parent.parent / "fftp" / "gui" / "filter_manager.py")
+filter_manager = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(filter_manager)
+
+FileInfo = filter_manager.FileInfo
+FileListing = filter_manager.FileListing
+FilterCondition = filter_manager.FilterCondition
+FilterSet = filter_manager.FilterSet
+
+
+def _all_paths_agree(condition, name):
+    """Result of the condition, the compiled set and batch filtering for one name"""
+    file_info = FileInfo(name=name)
+    listing = FileListing.from_file_infos([file_info])
+    results = {
+        condition.matches(file_info),
+        FilterSet("single", [condition]).matches(file_info),
+        # A second condition keeps the set from being a single inlined test
+        FilterSet("and", [condition, FilterCondition("size", "less", "1")]).matches(file_info),
+        bool(FilterSet("batch", [condition]).match_indices(listing, [0])),
+    }
+    assert len(results) == 1
+    return results.pop()
+
+
+def test_case_insensitive_begins_with_non_ascii_name():
+    # "İ".lower() starts with "i", so the name begins with "i" ignoring case
+    assert _all_paths_agree(FilterCondition("filename", "begins", "i"), "İx")
+
+
+def test_case_insensitive_begins_with_kelvin_sign():
+    # The Kelvin sign lowers to an ASCII "k"
+    assert _all_paths_agree(FilterCondition("filename", "begins", "k"), "\u212aey")
+    assert _all_paths_agree(FilterCondition("filename", "equals", "key"), "\u212aey")
+
+
+def test_case_sensitive_begins_keeps_exact_first_character():
+    assert not _all_paths_agree(FilterCondition("filename", "begins", "k", True), "\u212aey")
+    assert _all_paths_agree(FilterCondition("filename", "begins", "K", True), "Key")
+
+
+def test_ascii_first_character_prefilter():
+    assert _all_paths_agree(FilterCondition("filename", "begins", "."), ".hidden")
+    assert not _all_paths_agree(FilterCondition("filename", "begins", "."), "visible")
+    assert _all_paths_agree(FilterCondition("filename", "equals", "readme"), "README")